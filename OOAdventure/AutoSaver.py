@@ -0,0 +1,153 @@
+"""
+Write-behind saving on a background thread.
+
+Callers hand over the text to write and return immediately; one worker
+thread does the disk I/O. Successive save() calls for the same path
+before the worker gets to it are coalesced into a single write, and
+append() calls are batched into one write. Full writes go through a temp
+file plus os.replace, so a crash leaves either the old file or the new
+one, never a truncated one.
+
+    saver = AutoSaver()
+    saver.save("autosave.json", json.dumps(game.to_dict()))
+    ...
+    saver.flush()   # wait until everything handed over is on disk
+"""
+import atexit
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+def atomic_write_text(path: str, text: str) -> None:
+    """Replace `path` with `text` without ever leaving a partial file."""
+    atomic_write_bytes(path, text.encode("utf-8"))
+
+
+def atomic_write_bytes(path: str, data: bytes) -> None:
+    """atomic_write_text() for binary data."""
+    target = Path(path)
+    fd, tmp = tempfile.mkstemp(dir=target.parent or ".",
+                               prefix=target.name + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, target)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+
+class _Pending:
+    __slots__ = ("base", "tail")
+
+    def __init__(self) -> None:
+        self.base: Optional[str] = None   # full contents to write, if any
+        self.tail: List[str] = []         # text to append after it
+
+
+class AutoSaver:
+    def __init__(self, delay: float = 0.02) -> None:
+        # delay: how long the worker lingers after being woken so that a
+        # burst of saves turns into one write.
+        self.delay = delay
+        self.writes = 0        # files actually written (for benchmarks)
+        self.errors: List[BaseException] = []
+        self._cond = threading.Condition()
+        self._pending: Dict[str, _Pending] = {}
+        self._writing: set = set()     # paths the worker is writing now
+        self._busy = False
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="AutoSaver",
+                                        daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def save(self, path: str, text: str) -> None:
+        """Replace the whole file (supersedes anything still queued for it)."""
+        with self._cond:
+            p = self._pending.setdefault(str(path), _Pending())
+            p.base, p.tail = text, []
+            self._hand_over(str(path))
+
+    def append(self, path: str, text: str) -> None:
+        with self._cond:
+            self._pending.setdefault(str(path), _Pending()).tail.append(text)
+            self._hand_over(str(path))
+
+    def _hand_over(self, path: str) -> None:
+        # Called with the lock held.
+        if self._closed:
+            # Worker is gone or finishing (e.g. saving during interpreter
+            # shutdown). Let it finish first, so two writes of one file
+            # never overlap; it may have taken this one with its last batch.
+            while self._thread.is_alive():
+                self._cond.wait(0.01)
+            p = self._pending.pop(path, None)
+            if p is not None:
+                self._write(path, p)
+        else:
+            self._cond.notify()
+
+    def flush(self, path: Optional[str] = None) -> None:
+        """Block until everything handed over so far has been written.
+
+        With `path`, only wait for that file.
+        """
+        with self._cond:
+            self._cond.notify_all()
+            if path is None:
+                while self._pending or self._busy:
+                    self._cond.wait()
+            else:
+                path = str(path)
+                while path in self._pending or path in self._writing:
+                    self._cond.wait()
+
+    def close(self) -> None:
+        """Flush and stop the worker (also runs at interpreter exit)."""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
+        # Don't keep closed savers alive until exit.
+        atexit.unregister(self.close)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if not self._pending and self._closed:
+                    return
+                if self.delay and not self._closed:
+                    self._cond.wait(self.delay)
+                batch, self._pending = self._pending, {}
+                self._writing = set(batch)
+                self._busy = True
+            for path, p in batch.items():
+                try:
+                    self._write(path, p)
+                except Exception as e:   # keep saving other sessions
+                    self.errors.append(e)
+            with self._cond:
+                self._busy = False
+                self._writing = set()
+                self._cond.notify_all()
+
+    def _write(self, path: str, p: _Pending) -> None:
+        if p.base is not None:
+            atomic_write_text(path, p.base + "".join(p.tail))
+        else:
+            with open(path, "a", encoding="utf-8") as f:
+                f.write("".join(p.tail))
+        self.writes += 1
@@ -0,0 +1,42 @@
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Dict, List
+
+
+class EventKind(str, Enum):
+    MOVED = "moved"                    # from_room, to
+    PICKED = "picked"                  # item, room
+    USED = "used"                      # item, room
+    EXIT_UNLOCKED = "exit_unlocked"    # room, direction, to
+    STATE_CHANGED = "state_changed"    # room, key, value
+    ITEM_MOVED = "item_moved"          # item, to
+    GAME_WON = "game_won"              # room
+    SAVED = "saved"                    # path
+    LOADED = "loaded"                  # path
+    QUIT = "quit"
+    RESTARTED = "restarted"
+    UNKNOWN_COMMAND = "unknown_command"  # verb, suggestion
+
+
+@dataclass
+class Event:
+    kind: EventKind
+    data: Dict[str, object] = field(default_factory=dict)
+
+
+@dataclass
+class CommandResult:
+    command: str = ""
+    events: List[Event] = field(default_factory=list)
+    lines: List[str] = field(default_factory=list)
+    ok: bool = True          # False when the command was refused or failed
+    won: bool = False
+    game_over: bool = False  # won, quit or restarted: the session is done
+
+    @property
+    def text(self) -> str:
+        # Rendered on demand; identical to what the command printed.
+        return "".join(line + "\n" for line in self.lines)
+
+    def of_kind(self, kind: EventKind) -> List[Event]:
+        return [e for e in self.events if e.kind == kind]
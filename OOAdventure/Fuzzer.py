@@ -0,0 +1,182 @@
+"""
+Random-playthrough fuzzer.
+
+Drives headless games with seeded random command streams and checks the
+world invariants after every command. Work is split across a
+multiprocessing pool by seed range, so runs are reproducible and scale
+with the number of cores. Failures are shrunk to a minimal command list.
+
+    python -m OOAdventure.Fuzzer --games 20000 --length 60
+"""
+import argparse
+import multiprocessing
+import random
+import time
+from typing import List, NamedTuple, Optional, Tuple, Type
+
+from .Game import Game
+
+# Verbs that touch the disk or end the session are left out of the streams.
+FUZZ_VERBS = {"go", "pick", "use", "look", "inventory"}
+
+
+class Failure(NamedTuple):
+    seed: int
+    commands: List[str]
+    problems: List[str]
+
+
+def command_vocabulary(game: Game) -> List[str]:
+    """Every command the fuzzer may emit, built from the game's own tables."""
+    vocab = []
+    for alias, verb in game.VERB_ALIASES.items():
+        if verb not in FUZZ_VERBS:
+            continue
+        if verb == "go":
+            vocab += [f"{alias} {d}" for d in game.DIR_ALIASES]
+        elif verb in ("pick", "use"):
+            vocab += [f"{alias} {a}" for a in game.item_alias_index]
+        else:
+            vocab.append(alias)
+    return vocab
+
+
+def random_commands(rng: random.Random, vocab: List[str],
+                    length: int) -> List[str]:
+    return [rng.choice(vocab) for _ in range(length)]
+
+
+def check_invariants(game: Game) -> List[str]:
+    problems = []
+    if game.player.room not in game.rooms:
+        problems.append(f"player is in unknown room {game.player.room!r}")
+
+    carried = [name for name, it in game.items.items()
+               if it.location == "inventory"]
+    inventory = list(game.player.inventory)
+    if len(set(inventory)) != len(inventory):
+        problems.append(f"inventory has duplicates: {inventory}")
+    if set(inventory) != set(carried):
+        problems.append(f"inventory {sorted(inventory)} disagrees with "
+                        f"items located in inventory {sorted(carried)}")
+    for name, it in game.items.items():
+        if it.location not in (None, "inventory") and it.location not in game.rooms:
+            problems.append(f"{name} is in unknown place {it.location!r}")
+        if name not in game.items_at.get(it.location, ()):
+            problems.append(f"{name} is at {it.location!r} but not indexed there")
+    indexed = sum(len(names) for names in game.items_at.values())
+    if indexed != len(game.items):
+        problems.append(f"location index holds {indexed} entries "
+                        f"for {len(game.items)} items")
+
+    directions = set(game.DIR_ALIASES.values())
+    for name, rm in game.rooms.items():
+        for direction, target in rm.exits.items():
+            if direction not in directions:
+                problems.append(f"{name} has bad direction {direction!r}")
+            if target not in game.rooms:
+                problems.append(
+                    f"{name} {direction} leads to unknown room {target!r}")
+    return problems
+
+
+def first_violation(commands: List[str],
+                    game_cls: Type[Game] = Game) -> Optional[Tuple[int, List[str]]]:
+    """Play commands on a fresh game; (step, problems) of the first break."""
+    game = game_cls(headless=True)
+    problems = check_invariants(game)
+    if problems:
+        return -1, problems
+    for step, cmd in enumerate(commands):
+        result = game.process_command(cmd)
+        problems = check_invariants(game)
+        if problems:
+            return step, problems
+        if result.game_over:
+            break
+    return None
+
+
+def minimize(commands: List[str], game_cls: Type[Game] = Game) -> List[str]:
+    """Shrink a failing command list while it keeps failing."""
+    found = first_violation(commands, game_cls)
+    if found is None:
+        return commands
+    commands = commands[:found[0] + 1]
+    changed = True
+    while changed:
+        changed = False
+        for i in range(len(commands) - 1, -1, -1):
+            candidate = commands[:i] + commands[i + 1:]
+            if first_violation(candidate, game_cls) is not None:
+                commands = candidate
+                changed = True
+    return commands
+
+
+def fuzz_range(start_seed: int, count: int, length: int,
+               game_cls: Type[Game] = Game) -> Tuple[int, List[Failure]]:
+    """Fuzz seeds [start_seed, start_seed + count); returns (commands run, failures)."""
+    vocab = command_vocabulary(game_cls(headless=True))
+    failures = []
+    executed = 0
+    for seed in range(start_seed, start_seed + count):
+        commands = random_commands(random.Random(seed), vocab, length)
+        found = first_violation(commands, game_cls)
+        if found is None:
+            executed += len(commands)
+            continue
+        executed += found[0] + 1
+        small = minimize(commands, game_cls)
+        failures.append(Failure(seed, small, first_violation(small, game_cls)[1]))
+    return executed, failures
+
+
+def _fuzz_chunk(args) -> Tuple[int, List[Failure]]:
+    return fuzz_range(*args)
+
+
+def fuzz(games: int, length: int = 60, workers: Optional[int] = None,
+         seed: int = 0, game_cls: Type[Game] = Game,
+         chunk: int = 250) -> Tuple[int, List[Failure]]:
+    """Fuzz `games` playthroughs across a process pool."""
+    jobs = [(s, min(chunk, seed + games - s), length, game_cls)
+            for s in range(seed, seed + games, chunk)]
+    executed, failures = 0, []
+    with multiprocessing.Pool(workers) as pool:
+        for n, found in pool.imap_unordered(_fuzz_chunk, jobs):
+            executed += n
+            failures += found
+    failures.sort(key=lambda f: (len(f.commands), f.seed))
+    return executed, failures
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Random-playthrough fuzzer")
+    ap.add_argument("--games", type=int, default=10000)
+    ap.add_argument("--length", type=int, default=60,
+                    help="commands per playthrough")
+    ap.add_argument("--workers", type=int, default=None,
+                    help="processes (default: one per core)")
+    ap.add_argument("--seed", type=int, default=0, help="first seed")
+    args = ap.parse_args()
+
+    start = time.perf_counter()
+    executed, failures = fuzz(args.games, args.length, args.workers, args.seed)
+    elapsed = time.perf_counter() - start
+    print(f"{args.games} games, {executed} commands in {elapsed:.2f}s "
+          f"({executed / elapsed:,.0f} commands/sec)")
+    if not failures:
+        print("All invariants held.")
+        return 0
+    print(f"{len(failures)} failing seeds. Smallest reproduction "
+          f"(seed {failures[0].seed}):")
+    for cmd in failures[0].commands:
+        print(f"  > {cmd}")
+    for problem in failures[0].problems:
+        print(f"  ! {problem}")
+    return 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,144 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+def _deletes(words: Iterable[str]) -> set:
+    """Every string one deletion away from one of `words`."""
+    return {w[:i] + w[i + 1:] for w in words for i in range(len(w))}
+
+
+def _one_edit(a: str, b: str) -> bool:
+    """True if a and b differ by exactly one edit (swaps included)."""
+    la, lb = len(a), len(b)
+    if la < lb:
+        a, b, la, lb = b, a, lb, la
+    if la - lb > 1:
+        return False
+    i = 0
+    while i < lb and a[i] == b[i]:
+        i += 1
+    if la != lb:
+        return a[i + 1:] == b[i:]
+    if i == la:
+        return False            # equal
+    return (a[i + 1:] == b[i + 1:]
+            or (a[i + 2:] == b[i + 2:] and a[i:i + 2] == b[i + 1::-1][:2]))
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """Optimal-string-alignment distance, or limit + 1 if it is larger.
+
+    Counts insertions, deletions, substitutions and swaps of neighbouring
+    letters ("tkae" -> "take" is 1). Only the diagonal band `limit` wide
+    is filled in, since nothing outside it can come in under the limit.
+    """
+    if a == b:
+        return 0
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    if _one_edit(a, b):
+        return 1
+    if limit < 2:
+        return limit + 1
+    over = limit + 1
+    prev2: List[int] = []
+    prev = [j if j <= limit else over for j in range(len(b) + 1)]
+    for i, ca in enumerate(a, 1):
+        cur = [over] * (len(b) + 1)
+        lo, hi = max(1, i - limit), min(len(b), i + limit)
+        if i <= limit:
+            cur[0] = i
+        for j in range(lo, hi + 1):
+            cb = b[j - 1]
+            d = min(prev[j] + 1, cur[j - 1] + 1,
+                    prev[j - 1] + (ca != cb))
+            if i > 1 and j > 1 and ca == b[j - 2] and a[i - 2] == cb:
+                d = min(d, prev2[j - 2] + 1)
+            cur[j] = d
+        if min(cur) > limit:
+            return over
+        prev2, prev = prev, cur
+    return min(prev[-1], over)
+
+
+class FuzzyIndex:
+    """Typo-tolerant "did you mean" over a fixed vocabulary.
+
+    Symmetric-delete index: every term is stored under each string you get
+    by deleting up to `max_distance` of its letters, so a lookup only
+    generates the query's own deletions and checks the few terms sharing
+    one, instead of comparing the query against the whole vocabulary.
+    Answers are memoized, since typos repeat.
+
+    Short words get a tighter limit (1 edit up to 4 letters, for the
+    query and the term alike) so that, say, "x" is not "corrected" to "i".
+    Ties go to the term listed first.
+    """
+
+    CACHE_SIZE = 4096
+
+    def __init__(self, terms: Iterable[str], max_distance: int = 2) -> None:
+        self.max_distance = max_distance
+        self._rank: Dict[str, int] = {}
+        for t in terms:
+            self._rank.setdefault(t, len(self._rank))
+        buckets: Dict[str, List[str]] = {}
+        for t in self._rank:
+            level = found = {t}
+            for _ in range(self._limit(t)):
+                level = _deletes(level) - found
+                found |= level
+            for d in found:
+                buckets.setdefault(d, []).append(t)
+        self._index: Dict[str, Tuple[str, ...]] = {
+            d: tuple(ts) for d, ts in buckets.items()}
+        self._cache: Dict[str, Optional[str]] = {}
+
+    def _limit(self, word: str) -> int:
+        return min(self.max_distance, 1 if len(word) <= 4 else 2)
+
+    def __contains__(self, word: str) -> bool:
+        return word in self._rank
+
+    def lookup(self, word: str) -> Optional[str]:
+        """The closest term to `word` within the edit limit, or None."""
+        try:
+            return self._cache[word]
+        except KeyError:
+            pass
+        best = self._search(word)
+        if len(self._cache) >= self.CACHE_SIZE:
+            self._cache.clear()
+        self._cache[word] = best
+        return best
+
+    def _search(self, word: str) -> Optional[str]:
+        if len(word) < 2:
+            return None
+        if word in self._rank:
+            return word
+        # Widen one deletion at a time: once the query's deletions up to
+        # depth k have been looked up, every term within k edits has been
+        # seen, so a match at distance <= k cannot be beaten later.
+        limit = self._limit(word)
+        best, best_key = None, None
+        seen = set()
+        level = found = {word}
+        for depth in range(limit + 1):
+            if depth:
+                level = _deletes(level) - found
+                found |= level
+            for d in level:
+                for term in self._index.get(d, ()):
+                    if term in seen:
+                        continue
+                    seen.add(term)
+                    dist = edit_distance(word, term,
+                                         min(limit, self._limit(term)))
+                    if dist > self._limit(term) or dist >= len(term):
+                        continue
+                    key = (dist, self._rank[term])
+                    if best_key is None or key < best_key:
+                        best, best_key = term, key
+            if best_key is not None and best_key[0] <= depth:
+                break
+        return best
@@ -1,56 +1,244 @@
 
 
+import copy
 import json
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Mapping, Optional, Set, TextIO, Tuple
+from . import WorldFile
+from .CommandResult import CommandResult, Event, EventKind
 from .Item import Item
-from .PickStrategy import ChamberPick
 from .Room import Room
 from .Player import Player
-from .UseStrategy import VaultUse
-from .UseStrategy import AltarUse
-from .UseStrategy import ChamberUse
-from .UseStrategy import LibraryUse
+from .PagedWorld import Overlay
+from .AutoSaver import atomic_write_text
+from .StateCodec import schema_for
+from .WorldTemplate import WorldTemplate
 
 
-class Game:
-    def __init__(self):
-        self.rooms: Dict[str, Room] = {}
-        self.items: Dict[str, Item] = {}
-        self.player = Player()
-
-        # Directions & verbs
-        self.DIR_ALIASES = {
-            "n": "north", "s": "south", "e": "east", "w": "west",
-            "north": "north", "south": "south", "east": "east", "west": "west"
-        }
-        self.VERB_ALIASES = {
-            "go": "go", "move": "go", "walk": "go",
-            "pick": "pick", "take": "pick", "get": "pick", "grab": "pick",
-            "use": "use",
-            "look": "look", "l": "look", "examine": "look",
-            "inventory": "inventory", "i": "inventory",
-            "help": "help", "quit": "quit", "exit": "quit",
-            "save": "save", "load": "load",
-            "restart": "restart", "reset": "restart"
-        }
-        self.COMMANDS = {
-            "go": self.handle_go,
-            "pick": self.handle_pick,
-            "use": self.handle_use,
-            "look": self.handle_look,
-            "inventory": self.handle_inventory,
-            "help": self.handle_help,
-            "quit": self.handle_quit,
-            "save": self.handle_save,
-            "load": self.handle_load,
-            "restart": self.handle_restart
-        }
+def _discard(*parts: object) -> None:
+    pass
+
+
+# Every game's _changed_rooms until its first room changes, when it gets
+# a set of its own.
+_NO_ROOMS: frozenset = frozenset()
 
-        self._build_world()
-        self._build_item_alias_index()
+
+class _Names(dict):
+    """Item names at one location (an ordered set), tagged with its owner."""
+    __slots__ = ("owner",)
+
+
+class Game:
+    # Every per-session field is a slot, so an idle session is a handful of
+    # pointers into the shared WorldTemplate. __dict__ is still available
+    # (created on first use) for headless games and subclasses.
+    __slots__ = ("out", "echo", "_headless", "won", "saves", "_result",
+                 "rooms", "items", "item_alias_index", "items_at",
+                 "_item_rank", "_parser", "_token", "_shared",
+                 "_changed_rooms", "player", "__dict__", "__weakref__")
+
+    # Directions & verbs (shared by every game; treat as read-only)
+    DIR_ALIASES = {
+        "n": "north", "s": "south", "e": "east", "w": "west",
+        "north": "north", "south": "south", "east": "east", "west": "west"
+    }
+    VERB_ALIASES = {
+        "go": "go", "move": "go", "walk": "go",
+        "pick": "pick", "take": "pick", "get": "pick", "grab": "pick",
+        "use": "use",
+        "look": "look", "l": "look", "examine": "look",
+        "inventory": "inventory", "i": "inventory",
+        "help": "help", "quit": "quit", "exit": "quit",
+        "save": "save", "load": "load",
+        "restart": "restart", "reset": "restart"
+    }
+    # The world file the default _build_world reads (see WorldFile).
+    # Subclasses can point this at another file or override _build_world.
+    WORLD = Path(__file__).parent / "worlds" / "tower.json"
+    # PAGED = True maps WORLD's compiled image and decodes rooms and items
+    # as they are used, HOT_ROOMS of each kept decoded (see PagedWorld),
+    # instead of loading the whole world at startup.
+    PAGED = False
+    HOT_ROOMS = 1024
+    # verb -> name of the method that handles it
+    COMMANDS = {
+        "go": "handle_go",
+        "pick": "handle_pick",
+        "use": "handle_use",
+        "look": "handle_look",
+        "inventory": "handle_inventory",
+        "help": "handle_help",
+        "quit": "handle_quit",
+        "save": "handle_save",
+        "load": "handle_load",
+        "restart": "handle_restart",
+    }
+
+    def __init__(self, out: Optional[TextIO] = None, headless: bool = False):
+        # Where this game writes its text. None means "whatever sys.stdout
+        # is right now", so the CLI keeps working unchanged; web frontends
+        # give each session its own buffer instead of swapping sys.stdout.
+        self.out = out
+        # echo=False keeps text out of `out` entirely; callers then read
+        # CommandResult.text instead (the web frontends do this).
+        self.echo = True
+        # headless=True is for simulations: no text is produced at all, only
+        # events and the ok/won/game_over flags.
+        self.headless = headless
+        self.won = False
+        # Where save/load go: None for JSON files, or a SaveSlots view of a
+        # SqliteSaveStore (see SaveStore), in which case the "path" given
+        # to save/load names a slot in the database instead.
+        self.saves = None
+        self._result: Optional[CommandResult] = None
+        # The world starts as the class's shared WorldTemplate: rooms, items
+        # and items_at point at its read-only mappings until the first
+        # change (_shared), then become this game's own dicts. Room and
+        # Item records, and the per-location name sets in items_at (item
+        # names by room name, "inventory" or None), are copied on write
+        # too: this game changes one in place only if its owner is
+        # self._token (see clone()). _changed_rooms names the rooms whose
+        # exits/state may differ from the starting world. Change
+        # Item.location only through _move_item() so items_at stays true.
+        template = WorldTemplate.of(type(self))
+        self.rooms: Mapping[str, Room] = template.rooms
+        self.items: Mapping[str, Item] = template.items
+        self.item_alias_index: Mapping[str, str] = template.item_alias_index
+        self.items_at: Mapping[Optional[str], Mapping[str, None]] = template.items_at
+        self._item_rank: Dict[str, int] = template.item_rank
+        self._parser = template.parser
+        self._shared = True
+        self._token = object()
+        self._changed_rooms: Set[str] = _NO_ROOMS
+        self.player = Player(template.start)
+
+    @property
+    def headless(self) -> bool:
+        return self._headless
+
+    @headless.setter
+    def headless(self, on: bool) -> None:
+        was = getattr(self, "_headless", False)
+        self._headless = on
+        if on:
+            self.echo = False
+            self.say = _discard
+        elif was:
+            del self.say
 
     # ----- helpers -----
+    def say(self, *parts: object) -> None:
+        if self._result is not None:
+            self._result.lines.append(" ".join(str(p) for p in parts))
+        if self.echo:
+            print(*parts, file=self.out)
+
+    def fail(self, *parts: object) -> None:
+        # Same as say(), but marks the current command as not carried out.
+        self.say(*parts)
+        if self._result is not None:
+            self._result.ok = False
+
+    def emit(self, kind: EventKind, **data: object) -> None:
+        if self._result is not None:
+            self._result.events.append(Event(kind, data))
+
+    def apply_event(self, event: Event) -> None:
+        """Redo the state change an event records (used by Journal replay).
+
+        Events that change nothing (used, saved, quit, ...) are ignored.
+        LOADED replaces the whole state and cannot be replayed from the
+        event alone; journals write a snapshot after it instead.
+        """
+        kind, d = event.kind, event.data
+        if kind == EventKind.MOVED:
+            self.player.room = d["to"]
+        elif kind == EventKind.PICKED:
+            self.player.add(d["item"])
+            self._move_item(d["item"], "inventory")
+        elif kind == EventKind.ITEM_MOVED:
+            self._move_item(d["item"], d["to"])
+        elif kind == EventKind.EXIT_UNLOCKED:
+            self._writable_room(d["room"]).connect(d["direction"], d["to"])
+        elif kind == EventKind.STATE_CHANGED:
+            self._writable_room(d["room"]).state[d["key"]] = d["value"]
+        elif kind == EventKind.GAME_WON:
+            self.won = True
+
+    def _own_world(self) -> None:
+        # First change: stop sharing the template's dicts. A paged world
+        # is never copied whole; the game gets overlays of its changes.
+        if self._shared:
+            own = Overlay if self.PAGED else dict
+            self.rooms = own(self.rooms)
+            self.items = own(self.items)
+            self.items_at = own(self.items_at)
+            self._shared = False
+
+    def _writable_room(self, name: str) -> Room:
+        rm = self.rooms[name]
+        if rm.owner is not self._token:
+            self._own_world()
+            rm = self.rooms[name] = rm.copy(self._token)
+        if name not in self._changed_rooms:
+            if self._changed_rooms is _NO_ROOMS:
+                self._changed_rooms = set()
+            self._changed_rooms.add(name)
+        return rm
+
+    def _writable_item(self, name: str) -> Item:
+        it = self.items[name]
+        if it.owner is not self._token:
+            self._own_world()
+            it = self.items[name] = it.copy(self._token)
+        return it
+
+    def _move_item(self, name: str, location: Optional[str]) -> None:
+        it = self._writable_item(name)
+        if it.location == location:
+            return
+        self._writable_location(it.location).pop(name, None)
+        self._writable_location(location)[name] = None
+        it.location = location
+
+    def _writable_location(self, location: Optional[str]) -> Dict[str, None]:
+        names = self.items_at.get(location)
+        if getattr(names, "owner", None) is not self._token:
+            self._own_world()
+            names = _Names(names or ())
+            names.owner = self._token
+            self.items_at[location] = names
+        return names
+
+    def items_in(self, location: Optional[str]) -> List[str]:
+        """Names of the items at `location`, in world order."""
+        names = self.items_at.get(location, ())
+        if len(names) < 2:
+            return list(names)
+        return sorted(names, key=self._item_rank.__getitem__)
+
+    def _end(self, won: bool = False) -> None:
+        if self._result is not None:
+            self._result.game_over = True
+            self._result.won = self._result.won or won
+
+    # State changes that strategies make go through these so they show up
+    # as events.
+    def unlock_exit(self, room_name: str, direction: str, to: str) -> None:
+        self._writable_room(room_name).connect(direction, to)
+        self.emit(EventKind.EXIT_UNLOCKED, room=room_name,
+                  direction=direction, to=to)
+
+    def set_room_state(self, room_name: str, key: str, value: object) -> None:
+        self._writable_room(room_name).state[key] = value
+        self.emit(EventKind.STATE_CHANGED, room=room_name,
+                  key=key, value=value)
+
+    def place_item(self, item_name: str, location: Optional[str]) -> None:
+        self._move_item(item_name, location)
+        self.emit(EventKind.ITEM_MOVED, item=item_name, to=location)
+
     def room(self, name: str) -> Room:
         return self.rooms[name]
 
@@ -64,110 +252,88 @@ class Game:
             for a in it.aliases:
                 self.item_alias_index[self._normalize(a)] = canon
 
+    def suggest_verb(self, raw: str) -> Optional[str]:
+        """Closest known verb to a misspelt one ("did you mean"), or None."""
+        return WorldTemplate.of(type(self)).verb_index.lookup(raw)
+
+    def suggest_item(self, raw: str) -> Optional[str]:
+        """Closest item name or alias to a misspelt one, or None."""
+        return WorldTemplate.of(type(self)).item_index.lookup(self._normalize(raw))
+
+    def _no_such_item(self, message: str, raw: str) -> None:
+        sug = None if self.headless else self.suggest_item(raw)
+        if sug:
+            message += f" Did you mean '{sug}'?"
+        self.fail(message)
+
     def resolve_item_name(self, raw: str) -> Optional[str]:
         if not raw:
             return None
-        key = self._normalize(raw)
-        return self.item_alias_index.get(key)
+        canon = self.item_alias_index.get(raw)   # already normalized (parser)
+        if canon is None:
+            canon = self.item_alias_index.get(self._normalize(raw))
+        return canon
 
     # ----- world setup -----
+    # Runs once per Game class, on the WorldTemplate builder, not per game.
     def _build_world(self) -> None:
-        # Rooms
-        self.rooms["Entrance"] = Room(
-            name="Entrance",
-            desc="You stand at the grand entrance of the ancient tower."
-        )
-        self.rooms["Library"] = Room(
-            name="Library",
-            desc="Dusty books line the walls. A faint glow comes from a pedestal.",
-            clue="A crystal orb must be placed on the pedestal to reveal the path east.",
-            use_strategy=LibraryUse()
-        )
-        self.rooms["Altar"] = Room(
-            name="Altar",
-            desc="An altar with runes that pulse softly. A deep chasm blocks the northern path.",
-            clue="You need an enchanted rope to cross the chasm below.",
-            use_strategy=AltarUse()
-        )
-        self.rooms["Chamber"] = Room(
-            name="Chamber",
-            desc="The chamber contains a frozen pool. Something glitters beneath the ice.",
-            clue="Perhaps fire could melt the ice, and cold could make it safe again.",
-            state={"ice_state": "frozen"},
-            use_strategy=ChamberUse(),
-            pick_strategy=ChamberPick()
-        )
-        self.rooms["Vault"] = Room(
-            name="Vault",
-            desc="A vault door bars your way. The Gem of Eternity sits on a stone altar inside.",
-            clue="You need the teleportation stone (and a key) to open this vault from here.",
-            state={"open": False},
-            use_strategy=VaultUse()
-        )
-
-        # Exits (gated exits are omitted until unlocked)
-        self.room("Entrance").connect("north", "Library")
-        self.room("Library").connect("south", "Entrance")
-        self.room("Altar").connect("west", "Library")
-        self.room("Chamber").connect("south", "Altar")
-        self.room("Vault").connect("west", "Chamber")
-
-        # Items (+ aliases)
-        self.items["Crystal Orb"] = Item(
-            "Crystal Orb", "Library", used_in="Library", aliases=["orb"])
-        self.items["Enchanted Rope"] = Item(
-            "Enchanted Rope", "Altar", used_in="Chasm", aliases=["rope"])
-        self.items["Fire Scroll"] = Item(
-            "Fire Scroll", "Chamber", used_in="Ice Pool", aliases=["fire", "scroll"])
-        self.items["Ice Wand"] = Item(
-            "Ice Wand", "Chamber", used_in="Ice Pool", aliases=["ice", "wand"])
-        self.items["Teleportation Stone"] = Item("Teleportation Stone", "Entrance", used_in="Vault",
-                                                 aliases=["stone", "teleporter", "tp stone"])
-        self.items["Vault Key"] = Item(
-            "Vault Key", None, used_in="Vault", aliases=["key"])
+        world = WorldFile.load(self.WORLD)
+        self.rooms.update(world.rooms())
+        self.items.update(world.items())
+        self.start = world.start
 
     # ----- UI / status -----
     def show_status(self) -> None:
-        print("\n---")
         room = self.room(self.player.room)
-        print(f"You are in the {room.name}.")
-        print(room.desc)
+        if self.headless:
+            # No text to build; only the win matters.
+            if room.name == "Vault" and room.state.get("open"):
+                self._win(room)
+            return
+
+        self.say("\n---")
+        self.say(f"You are in the {room.name}.")
+        self.say(room.desc)
         if room.clue:
-            print("Clue:", room.clue)
+            self.say("Clue:", room.clue)
 
         # Dynamic descriptions
         if room.name == "Chamber":
             ice = room.state.get("ice_state", "frozen")
             if ice == "frozen":
-                print("The pool is frozen solid. Something glitters under the ice.")
+                self.say("The pool is frozen solid. Something glitters under the ice.")
             elif ice == "melted":
-                print("The pool has melted. The water is too deep to cross.")
+                self.say("The pool has melted. The water is too deep to cross.")
                 if self.items["Vault Key"].location == "Chamber":
-                    print("You see the Vault Key gleaming in the water.")
+                    self.say("You see the Vault Key gleaming in the water.")
             elif ice == "refrozen":
-                print(
+                self.say(
                     "The pool has been refrozen into a bridge of ice. You can cross east to the Vault.")
 
         if room.name == "Vault":
             if room.state.get("open"):
-                print("The Gem of Eternity glows on the altar!")
-                print(
+                self.say("The Gem of Eternity glows on the altar!")
+                self.say(
                     "Congratulations! You have reached the Gem of Eternity and won the game!")
-                raise SystemExit
+                self._win(room)
             else:
-                print("The vault door is shut. Perhaps a special stone could open it...")
+                self.say("The vault door is shut. Perhaps a special stone could open it...")
 
         # Visible items
-        for it in self.items.values():
-            if it.location == room.name:
-                print(f"You see a {it.name} here.")
+        for name in self.items_in(room.name):
+            self.say(f"You see a {name} here.")
 
         inv = ", ".join(self.player.inventory) or "empty"
-        print("\nInventory:", inv)
-        print("---")
+        self.say("\nInventory:", inv)
+        self.say("---")
+
+    def _win(self, room: Room) -> None:
+        self.won = True
+        self.emit(EventKind.GAME_WON, room=room.name)
+        self._end(won=True)
 
     def show_help(self) -> None:
-        print("""
+        self.say("""
 Commands:
   go [direction]      - Move north, south, east, or west
   look                - Show room description and items
@@ -176,6 +342,7 @@ Commands:
   inventory, i        - Show your inventory
   help                - Show this help message
   quit, exit          - Quit the game
+  cmd; cmd; ...       - Run several commands (stops at the first that fails)
 """)
 
     # ----- mechanics -----
@@ -183,23 +350,25 @@ Commands:
         rm = self.room(self.player.room)
         if rm.has_exit(direction):
             self.player.room = rm.exits[direction]
+            self.emit(EventKind.MOVED, from_room=rm.name, to=self.player.room)
             self.show_status()
         else:
-            print("You can't go that way.")
+            self.fail("You can't go that way.")
 
     def pick(self, item_name: str) -> None:
         # canonical name assumed (resolver runs in parser)
         item = self.items.get(item_name)
         room = self.room(self.player.room)
-        if not item or item.location != room.name:
-            print(f"There is no {item_name} here.")
+        if not item or item_name not in self.items_at.get(room.name, ()):
+            self.fail(f"There is no {item_name} here.")
             return
         if self.player.has(item_name):
-            print(f"You already have the {item_name}.")
+            self.fail(f"You already have the {item_name}.")
             return
         self.player.add(item_name)
-        item.location = "inventory"
-        print(f"You picked up the {item_name}.")
+        self._move_item(item_name, "inventory")
+        self.emit(EventKind.PICKED, item=item_name, room=room.name)
+        self.say(f"You picked up the {item_name}.")
         # Strategy hook
         if room.pick_strategy:
             room.pick_strategy.on_pick(self, item_name)
@@ -207,90 +376,103 @@ Commands:
     def use(self, item_name: str) -> None:
         # canonical name assumed (resolver runs in parser)
         if not self.player.has(item_name):
-            print(f"You don't have a {item_name}.")
+            self.fail(f"You don't have a {item_name}.")
             return
         room = self.room(self.player.room)
+        self.emit(EventKind.USED, item=item_name, room=room.name)
         if room.use_strategy:
             room.use_strategy.use(self, item_name)
         else:
-            print("Nothing happens.")
+            self.fail("Nothing happens.")
 
     # ----- parser -----
     def handle_go(self, args: List[str]):
         if not args:
-            print("Go where? Try: go north")
+            self.fail("Go where? Try: go north")
             return
         d = self.DIR_ALIASES.get(args[0])
         if not d:
-            print("I don’t recognize that direction. Try north/south/east/west.")
+            self.fail("I don’t recognize that direction. Try north/south/east/west.")
             return
         self.move(d)
 
     def handle_pick(self, args: List[str]):
         if not args:
-            print("Pick what? Example: pick orb")
+            self.fail("Pick what? Example: pick orb")
             return
         raw = " ".join(args)  # keep raw for aliases like "tp stone"
         canon = self.resolve_item_name(raw)
         if canon:
             self.pick(canon)
         else:
-            print(f"There is no {raw} here.")
+            self._no_such_item(f"There is no {raw} here.", raw)
 
     def handle_use(self, args: List[str]):
         if not args:
-            print("Use what? Example: use stone")
+            self.fail("Use what? Example: use stone")
             return
         raw = " ".join(args)
         canon = self.resolve_item_name(raw)
         if canon:
             self.use(canon)
         else:
-            print(f"You don't have a {raw}.")
+            self._no_such_item(f"You don't have a {raw}.", raw)
 
     def handle_look(self, args: List[str]):
         self.show_status()
 
     def handle_inventory(self, args: List[str]):
-        print("Inventory:", ", ".join(self.player.inventory) or "empty")
+        self.say("Inventory:", ", ".join(self.player.inventory) or "empty")
 
     def handle_help(self, args: List[str]):
         self.show_help()
 
     def handle_quit(self, args: List[str]):
-        print("Saving game before exit...")
-        try:
-            self.save("autosave.json")
-        except Exception as e:
-            print(f"Warning: could not autosave: {e}")
-        print("Farewell, wizard!")
-        raise SystemExit
+        # Headless games (batch runs, the fuzzer) leave no files behind
+        # unless they were given a save store.
+        if self.saves is not None or not self._headless:
+            self.say("Saving game before exit...")
+            try:
+                self.save("autosave.json")
+            except Exception as e:
+                self.say(f"Warning: could not autosave: {e}")
+        self.say("Farewell, wizard!")
+        self.emit(EventKind.QUIT)
+        self._end()
 
     def handle_save(self, args):
         path = args[0] if args else "save.json"
         try:
             self.save(path)
         except Exception:
-            print("Could not save game.")
+            self.fail("Could not save game.")
 
     def handle_load(self, args):
         path = args[0] if args else "save.json"
         try:
-            new_game = Game.load(path)   # returns a new instance
-            # Swap state into current loop
-            self.rooms = new_game.rooms
-            self.items = new_game.items
-            self.player = new_game.player
-            print("Loaded. Type 'look' to resume.")
+            data = self._read_save(path, self.say, self.saves)
+            new_game = type(self)(out=self.out)
+            new_game._restore(data)
         except Exception:
-            print("Could not load game.")
+            self.fail("Could not load game.")
+            return
+        # Swap state into current loop, copy-on-write bookkeeping included
+        for attr in ("rooms", "items", "items_at", "player", "won", "_token",
+                     "_shared", "_changed_rooms"):
+            setattr(self, attr, getattr(new_game, attr))
+        self.emit(EventKind.LOADED, path=path)
+        self.say(f"Game loaded from {path}.")
+        self.say("Loaded. Type 'look' to resume.")
 
     def handle_restart(self, args):
         import os
-        if os.path.exists("autosave.json"):
+        if self.saves is not None:
+            self.saves.delete("autosave.json")
+        elif not self._headless and os.path.exists("autosave.json"):
             os.remove("autosave.json")
-        print("Progress cleared. Restart the game to begin a new adventure.")
-        raise SystemExit
+        self.say("Progress cleared. Restart the game to begin a new adventure.")
+        self.emit(EventKind.RESTARTED)
+        self._end()
 
     def to_dict(self) -> dict:
         # Player state
@@ -299,10 +481,18 @@ Commands:
             "inventory": list(self.player.inventory)
         }
 
+        # A paged world saves only the rooms and items this game changed
+        # (the dirty ones); the rest are as the world file has them.
+        if self.PAGED:
+            rooms = {name: self.rooms[name] for name in sorted(self._changed_rooms)}
+            items = {} if self._shared else self.items.own
+        else:
+            rooms, items = self.rooms, self.items
+
         # Items: only location needs to be saved (names are keys)
         items_data = {
             name: {"location": it.location}
-            for name, it in self.items.items()
+            for name, it in items.items()
         }
 
         # Rooms: exits and state can change during play
@@ -311,106 +501,230 @@ Commands:
                 "exits": dict(rm.exits),
                 "state": dict(rm.state)
             }
-            for name, rm in self.rooms.items()
+            for name, rm in rooms.items()
         }
 
         return {
             "version": 1,
             "player": player_data,
+            "won": self.won,
             "items": items_data,
             "rooms": rooms_data
         }
 
+    def encode_state(self) -> bytes:
+        """Compact binary form of to_dict() (see StateCodec)."""
+        return schema_for(type(self)).encode(self)
+
+    @classmethod
+    def decode_state(cls, data: bytes,
+                     out: Optional[TextIO] = None) -> "Game":
+        """Inverse of encode_state(), like from_dict()."""
+        return cls.from_dict(schema_for(cls).decode(data), out=out)
+
     def save(self, path: str = "save.json") -> None:
         data = self.to_dict()
-        Path(path).write_text(json.dumps(data, indent=2))
-        print(f"Game saved to {path}.")
+        if self.saves is not None:
+            self.saves.write(path, data, self.won)
+        else:
+            atomic_write_text(path, json.dumps(data, indent=2))
+        self.emit(EventKind.SAVED, path=path)
+        self.say(f"Game saved to {path}.")
 
-    @classmethod
-    def load(cls, path: str = "save.json") -> "Game":
+    @staticmethod
+    def _read_save(path: str, say, saves=None) -> dict:
         try:
+            if saves is not None:
+                data = saves.read(path)
+                if data is None:
+                    raise FileNotFoundError(path)
+                return data
             raw = Path(path).read_text()
-            data = json.loads(raw)
+            return json.loads(raw)
         except FileNotFoundError:
-            print(f"No save found at {path}.")
+            say(f"No save found at {path}.")
             raise
         except json.JSONDecodeError as e:
-            print(f"Save file is corrupted or invalid JSON: {e}")
+            say(f"Save file is corrupted or invalid JSON: {e}")
             raise
 
-        game = cls.from_dict(data)
-        print(f"Game loaded from {path}.")
+    @classmethod
+    def load(cls, path: str = "save.json",
+             out: Optional[TextIO] = None, saves=None) -> "Game":
+        data = cls._read_save(path, lambda msg: print(msg, file=out), saves)
+        game = cls.from_dict(data, out=out)
+        game.saves = saves
+        game.say(f"Game loaded from {path}.")
         return game
 
     @classmethod
-    def from_dict(cls, data: dict) -> "Game":
-     # 1) Create a fresh game (builds rooms/items/strategies)
-        game = cls()
+    def from_dict(cls, data: dict,
+                  out: Optional[TextIO] = None) -> "Game":
+     # 1) Create a fresh game (a cheap copy of the world template)
+        game = cls(out=out)
+        game._restore(data)
+        return game
 
+    def _restore(self, data: dict) -> None:
       # 2) Optional: handle version differences gracefully
         version = data.get("version", 1)
         if version != 1:
-            print(
+            self.say(
                 f"Warning: save version {version} not recognized by loader v1. Attempting best-effort load.")
 
             # 3) Restore player
         p = data["player"]
-        game.player.room = p["room"]
-        game.player.inventory = list(p.get("inventory", []))
+        self.player.room = p["room"]
+        self.player.set_inventory(p.get("inventory", []))
+        self.won = bool(data.get("won", False))
 
         # 4) Restore items (locations)
         for name, item_data in data.get("items", {}).items():
-            if name in game.items:
-                game.items[name].location = item_data.get("location")
+            loc = item_data.get("location")
+            if name in self.items and self.items[name].location != loc:
+                self._move_item(name, loc)
 
         # 5) Restore rooms (exits + state)
         for name, room_data in data.get("rooms", {}).items():
-            if name in game.rooms:
-                rm = game.rooms[name]
-                rm.exits = dict(room_data.get("exits", rm.exits))
-                rm.state = dict(room_data.get("state", rm.state))
-
-        return game
+            if name in self.rooms:
+                rm = self.rooms[name]
+                exits = room_data.get("exits", rm.exits)
+                state = room_data.get("state", rm.state)
+                if exits != rm.exits or state != rm.state:
+                    rm = self._writable_room(name)
+                    rm.exits = dict(exits)
+                    rm.state = dict(state)
+
+    # ----- cloning / state keys -----
+    def clone(self) -> "Game":
+        """An independent copy of this game, cheap enough for search.
+
+        Room and Item records stay shared between the two games until one
+        side changes them (through unlock_exit, set_room_state, place_item
+        or pick), so cloning costs at most three dict copies rather than a
+        deep copy of the world. Strategies must change the world through those
+        helpers, not by editing Room.exits/state directly.
+        """
+        twin = copy.copy(self)
+        if not self._shared:
+            twin.rooms = self.rooms.copy()
+            twin.items = self.items.copy()
+            twin.items_at = self.items_at.copy()
+        twin.player = Player(self.player.room, self.player.inventory.copy())
+        twin._result = None
+        if self._changed_rooms:
+            twin._changed_rooms = set(self._changed_rooms)
+        # New tokens on both sides: every record they now share is
+        # copied before either one changes it.
+        self._token = object()
+        twin._token = object()
+        return twin
+
+    def state_key(self) -> Tuple:
+        """Hashable key of everything that affects play from here on.
+
+        Player room, every item's location and the exits/state of the rooms
+        that changed since the world was built. Inventory order is left out
+        (it only affects display).
+        """
+        changed = tuple(
+            (name, tuple(sorted(rm.exits.items())), tuple(sorted(rm.state.items())))
+            for name in sorted(self._changed_rooms)
+            for rm in (self.rooms[name],)
+        )
+        return (self.player.room,
+                tuple(it.location for it in self.items.values()),
+                changed)
+
+    def with_state_key(self, key: Tuple) -> "Game":
+        """A clone of this game moved to the state described by `key`.
+
+        `self` should be in its starting state (or share the key's item
+        order); rooms not listed in the key keep this game's exits/state.
+        """
+        twin = self.clone()
+        room, locations, changed = key
+        twin.player.room = room
+        for (name, it), loc in zip(self.items.items(), locations):
+            if it.location != loc:
+                twin._move_item(name, loc)
+        twin.player.set_inventory(name for name, loc in zip(self.items, locations)
+                                  if loc == "inventory")
+        for name, exits, state in changed:
+            rm = twin._writable_room(name)
+            rm.exits = dict(exits)
+            rm.state = dict(state)
+        return twin
+
+    def process_command(self, cmd: str) -> CommandResult:
+        result = CommandResult(command=cmd)
+        outer, self._result = self._result, result
+        try:
+            self._dispatch(cmd)
+        finally:
+            self._result = outer
+        return result
+
+    def process_line(self, line: str) -> CommandResult:
+        """Run "n; take orb; use orb; e" one clause at a time.
+
+        Stops after the first clause that fails or ends the game. Returns
+        a single CommandResult covering every clause that ran: events and
+        lines in order (each clause's lines headed by "> clause"), ok only
+        if all of them were. A line without ';' is just process_command.
+        """
+        clauses = [c.strip() for c in line.split(";")]
+        clauses = [c for c in clauses if c]
+        if len(clauses) < 2:
+            return self.process_command(clauses[0] if clauses else "")
+        combined = CommandResult(command=line)
+        for clause in clauses:
+            outer, self._result = self._result, combined
+            try:
+                self.say(f"> {clause}")
+            finally:
+                self._result = outer
+            result = self.process_command(clause)
+            combined.events += result.events
+            combined.lines += result.lines
+            combined.won = combined.won or result.won
+            combined.game_over = result.game_over
+            if not result.ok or result.game_over:
+                combined.ok = result.ok
+                break
+        return combined
 
-    def process_command(self, cmd: str):
-        text = cmd.strip().lower()
-        if not text:
+    def _dispatch(self, cmd: str) -> None:
+        verb, raw_verb, args = self._parser.parse(cmd)
+        if not raw_verb:
             return
-        parts = text.split()
-        raw_verb, args = parts[0], parts[1:]
-        verb = self.VERB_ALIASES.get(raw_verb)
         if not verb:
-            try:
-                import difflib
-                sug = difflib.get_close_matches(
-                    raw_verb, self.VERB_ALIASES.keys(), n=1)
-                if sug:
-                    print(
-                        f"Unknown command '{raw_verb}'. Did you mean '{sug[0]}'? (Type 'help' for commands.)")
-                else:
-                    print(
-                        f"Unknown command '{raw_verb}'. Type 'help' for commands.")
-            except Exception:
-                print(
+            sug = None if self.headless else self.suggest_verb(raw_verb)
+            self.emit(EventKind.UNKNOWN_COMMAND, verb=raw_verb, suggestion=sug)
+            if sug:
+                self.fail(
+                    f"Unknown command '{raw_verb}'. Did you mean '{sug}'? (Type 'help' for commands.)")
+            else:
+                self.fail(
                     f"Unknown command '{raw_verb}'. Type 'help' for commands.")
             return
 
         handler = self.COMMANDS.get(verb)
         if handler:
-            handler(args)
+            getattr(self, handler)(args)
         else:
-            print("That command exists but isn’t wired up yet. (Bug!)")
+            self.fail("That command exists but isn’t wired up yet. (Bug!)")
 
     # ----- run loop -----
     def run(self):
-        print("=== Wizard's Quest (OOP + Strategy) ===")
+        self.say("=== Wizard's Quest (OOP + Strategy) ===")
         self.show_status()
         while True:
             try:
                 cmd = input("\n> ")
-                self.process_command(cmd)
+                result = self.process_line(cmd)
             except (EOFError, KeyboardInterrupt):
-                print("\nFarewell, wizard!")
+                self.say("\nFarewell, wizard!")
                 break
-            except SystemExit:
+            if result.game_over:
                 break
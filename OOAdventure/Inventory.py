@@ -0,0 +1,45 @@
+from typing import Iterable, Iterator
+
+
+class Inventory:
+    """Insertion-ordered set of item names.
+
+    Backed by a dict, so membership, add and remove are O(1) however much
+    the player carries, while iteration keeps pick-up order (what the
+    inventory listing and saves show). Compares equal to a list or tuple
+    with the same names in the same order.
+    """
+    __slots__ = ("_names",)
+
+    def __init__(self, names: Iterable[str] = ()) -> None:
+        self._names = dict.fromkeys(names)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._names
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def add(self, name: str) -> None:
+        self._names[name] = None
+
+    def discard(self, name: str) -> None:
+        self._names.pop(name, None)
+
+    def copy(self) -> "Inventory":
+        return Inventory(self._names)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Inventory):
+            other = other._names
+        elif not isinstance(other, (list, tuple)):
+            return NotImplemented
+        return list(self._names) == list(other)
+
+    __hash__ = None  # mutable
+
+    def __repr__(self) -> str:
+        return f"Inventory({list(self._names)!r})"
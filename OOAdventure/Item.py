@@ -1,10 +1,42 @@
-from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Iterable, NamedTuple, Optional, Tuple
 
 
-@dataclass
-class Item:
+class ItemDef(NamedTuple):
+    """The parts of an item that never change (shared, like RoomDef)."""
     name: str
-    location: Optional[str]                 # room name | "inventory" | None
     used_in: Optional[str] = None
-    aliases: List[str] = field(default_factory=list)
+    aliases: Tuple[str, ...] = ()
+
+
+class Item:
+    """An item as one game sees it: a shared ItemDef plus where it is."""
+    __slots__ = ("spec", "location", "owner")
+
+    def __init__(self, name: str, location: Optional[str],
+                 used_in: Optional[str] = None,
+                 aliases: Iterable[str] = ()) -> None:
+        self.spec = ItemDef(name, used_in, tuple(aliases))
+        self.location = location                 # room name | "inventory" | None
+        self.owner: Optional[object] = None      # see Room.owner
+
+    @property
+    def name(self) -> str:
+        return self.spec.name
+
+    @property
+    def used_in(self) -> Optional[str]:
+        return self.spec.used_in
+
+    @property
+    def aliases(self) -> Tuple[str, ...]:
+        return self.spec.aliases
+
+    def copy(self, owner: Optional[object] = None) -> "Item":
+        twin = Item.__new__(Item)
+        twin.spec = self.spec
+        twin.location = self.location
+        twin.owner = owner
+        return twin
+
+    def __repr__(self) -> str:
+        return f"Item({self.name!r}, {self.location!r})"
@@ -0,0 +1,119 @@
+"""
+Append-only journal of one session's state-changing events.
+
+Each line is JSON: either an event ({"kind": "moved", "to": ...}) or a
+snapshot ({"snapshot": <base64 of Game.encode_state()>, "won": ...},
+as encode_state() does not record the win). Recording a
+command appends only its events, so the cost does not grow with the size
+of the game; every `snapshot_every` events a snapshot is appended so that
+replay only has to redo the tail.
+
+    journal = Journal("autosave.journal")
+    result = game.process_command(cmd)
+    journal.record(game, result)
+    ...
+    game = Journal.replay("autosave.journal")
+
+Pass an AutoSaver to take the appends off the caller's thread.
+"""
+import base64
+import json
+from pathlib import Path
+from typing import Optional, Type
+
+from .AutoSaver import AutoSaver
+from .CommandResult import CommandResult, Event, EventKind
+from .Game import Game
+
+# Events that change the game state (everything apply_event handles).
+STATE_EVENTS = {
+    EventKind.MOVED, EventKind.PICKED, EventKind.ITEM_MOVED,
+    EventKind.EXIT_UNLOCKED, EventKind.STATE_CHANGED, EventKind.GAME_WON,
+}
+
+_SNAPSHOT = '{"snapshot"'
+
+
+class Journal:
+    def __init__(self, path: str, snapshot_every: int = 200,
+                 saver: Optional[AutoSaver] = None) -> None:
+        self.path = Path(path)
+        self.snapshot_every = snapshot_every
+        self.saver = saver
+        self._since_snapshot = 0
+        self._fh = None
+
+    def _write(self, line: str) -> None:
+        if self.saver is not None:
+            self.saver.append(str(self.path), line + "\n")
+            return
+        if self._fh is None:
+            self._fh = open(self.path, "a", encoding="utf-8")
+        self._fh.write(line + "\n")
+
+    def record(self, game: Game, result: CommandResult) -> None:
+        """Append the state changes of one command."""
+        kinds = {e.kind for e in result.events}
+        if EventKind.LOADED in kinds:
+            # The whole state was swapped in; a snapshot is the only record.
+            self.snapshot(game)
+            return
+        wrote = False
+        for event in result.events:
+            if event.kind in STATE_EVENTS:
+                self._write(json.dumps({"kind": event.kind.value, **event.data}))
+                self._since_snapshot += 1
+                wrote = True
+        if self._since_snapshot >= self.snapshot_every:
+            self.snapshot(game)
+        elif wrote:
+            self.flush()
+
+    def snapshot(self, game: Game) -> None:
+        blob = base64.b64encode(game.encode_state()).decode("ascii")
+        self._write(json.dumps({"snapshot": blob, "won": game.won}))
+        self._since_snapshot = 0
+        self.flush()
+
+    def reset(self, game: Game) -> None:
+        """Start the journal over from `game`'s current state."""
+        self.close()
+        if self.saver is not None:
+            self.saver.save(str(self.path), "")
+        else:
+            self.path.write_text("")
+        self.snapshot(game)
+
+    def flush(self) -> None:
+        # With a saver this only hands the lines over; saver.flush() waits
+        # for the disk.
+        if self._fh is not None:
+            self._fh.flush()
+
+    def close(self) -> None:
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+    @staticmethod
+    def replay(path: str, game_cls: Type[Game] = Game,
+               out=None) -> Game:
+        """Rebuild a game from the latest snapshot plus the events after it."""
+        text = Path(path).read_text(encoding="utf-8")
+        # json.dumps escapes quotes inside values, so this can only match
+        # at the start of a snapshot line.
+        start = text.rfind(_SNAPSHOT)
+        game: Optional[Game] = None
+        if start >= 0:
+            end = text.find("\n", start)
+            snap = json.loads(text[start:end if end >= 0 else None])
+            game = game_cls.decode_state(base64.b64decode(snap["snapshot"]), out=out)
+            game.won = snap.get("won", False)
+            text = text[end + 1:] if end >= 0 else ""
+        if game is None:
+            game = game_cls(out=out)
+        for line in text.splitlines():
+            if line:
+                data = json.loads(line)
+                game.apply_event(Event(EventKind(data.pop("kind")), data))
+        return game
@@ -0,0 +1,238 @@
+"""
+Worlds too big to load: rooms and items paged in from a mapped image.
+
+    class Huge(Game):
+        WORLD = "worlds/huge.json"
+        PAGED = True
+
+A paged Game class's WorldTemplate is backed by a PagedWorld instead of
+dicts of every Room and Item. The compiled image (see WorldFile) is
+mapped into memory, and a record is decoded the first time something
+asks for it: Game.room(), game.items[name], the items at a location, an
+alias while parsing. Decoded rooms and items sit in small LRU caches
+shared by every game, so the world costs what the recently visited part
+of it costs, whatever its size. Records are never changed in place (see
+Game._writable_room), so one dropped from a cache and decoded again is
+as good as the old one.
+
+Each game keeps only what it changed, in Overlay mappings over these:
+those are also the dirty rooms and items that Game.to_dict() saves for
+a paged world.
+"""
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from types import MappingProxyType
+from typing import Callable, Dict, Iterator, Mapping, MutableMapping, Optional, Union
+
+from . import WorldFile
+from .PhraseParser import _END
+
+
+class _Lru(Mapping):
+    """Read-only mapping that decodes values on demand and keeps the last few."""
+
+    def __init__(self, size: int, index: Callable[[str], Optional[int]],
+                 decode: Callable[[int], object], names: Callable[[], Iterator[str]],
+                 count: int) -> None:
+        self.size = size
+        self._index = index
+        self._decode = decode
+        self._names = names
+        self._count = count
+        self._hot: "OrderedDict[object, object]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.misses = 0
+
+    def __getitem__(self, key):
+        with self._lock:
+            try:
+                self._hot.move_to_end(key)
+                return self._hot[key]
+            except KeyError:
+                pass
+        i = self._index(key)
+        if i is None:
+            raise KeyError(key)
+        value = self._decode(i)
+        with self._lock:
+            self.misses += 1
+            self._hot[key] = value
+            if len(self._hot) > self.size:
+                self._hot.popitem(last=False)
+        return value
+
+    def __contains__(self, key) -> bool:
+        with self._lock:
+            if key in self._hot:
+                return True
+        return self._index(key) is not None
+
+    def __iter__(self) -> Iterator:
+        return self._names()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def hot(self) -> int:
+        """How many records are decoded right now."""
+        return len(self._hot)
+
+
+class Overlay(MutableMapping):
+    """A game's changes over a shared read-only mapping.
+
+    Reads fall through to `base` for keys this game has not set; writes
+    only ever go to `own`. Iteration follows `base`, then any new keys.
+    """
+
+    def __init__(self, base: Mapping, own: Optional[dict] = None) -> None:
+        self.base = base
+        self.own = own if own is not None else {}
+
+    def __getitem__(self, key):
+        try:
+            return self.own[key]
+        except KeyError:
+            return self.base[key]
+
+    def get(self, key, default=None):
+        value = self.own.get(key)
+        if value is not None:
+            return value
+        return self.base.get(key, default)
+
+    def __contains__(self, key) -> bool:
+        return key in self.own or key in self.base
+
+    def __setitem__(self, key, value) -> None:
+        self.own[key] = value
+
+    def __delitem__(self, key) -> None:
+        raise TypeError("world entries cannot be removed")
+
+    def __iter__(self) -> Iterator:
+        for key in self.base:
+            yield key
+        for key in self.own:
+            if key not in self.base:
+                yield key
+
+    def __len__(self) -> int:
+        return len(self.base) + sum(1 for key in self.own if key not in self.base)
+
+    def copy(self) -> "Overlay":
+        return Overlay(self.base, dict(self.own))
+
+
+class _AliasNode:
+    """A node of the item alias trie PhraseParser walks, looked up in the image."""
+    __slots__ = ("image", "prefix")
+
+    def __init__(self, image: WorldFile.WorldImage, prefix: str) -> None:
+        self.image = image
+        self.prefix = prefix
+
+    def get(self, word: str) -> Optional["_AliasNode"]:
+        if word == _END:
+            return None
+        phrase = f"{self.prefix} {word}" if self.prefix else word
+        if self.image.alias(phrase) is None and not self.image.has_alias_prefix(phrase + " "):
+            return None
+        return _AliasNode(self.image, phrase)
+
+    def __contains__(self, key: str) -> bool:
+        return key == _END and bool(self.prefix) and self.image.alias(self.prefix) is not None
+
+    def __getitem__(self, key: str) -> str:
+        if key in self:
+            return self.prefix
+        raise KeyError(key)
+
+
+class _Aliases(Mapping):
+    """Normalized alias -> item name, answered from the image."""
+
+    def __init__(self, image: WorldFile.WorldImage) -> None:
+        self._image = image
+
+    def __getitem__(self, alias: str) -> str:
+        i = self._image.alias(alias)
+        if i is None:
+            raise KeyError(alias)
+        return self._image.item_name(i)
+
+    def __contains__(self, alias) -> bool:
+        return isinstance(alias, str) and self._image.alias(alias) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return (alias for alias, _ in self._image.aliases())
+
+    def __len__(self) -> int:
+        return self._image.alias_count
+
+
+class _Ranks(Mapping):
+    """Item name -> position in the world (for listing items in order)."""
+
+    def __init__(self, image: WorldFile.WorldImage) -> None:
+        self._image = image
+
+    def __getitem__(self, name: str) -> int:
+        i = self._image.item_index(name)
+        if i is None:
+            raise KeyError(name)
+        return i
+
+    def __iter__(self) -> Iterator[str]:
+        return (self._image.item_name(i) for i in range(self._image.item_count))
+
+    def __len__(self) -> int:
+        return self._image.item_count
+
+
+class PagedWorld:
+    """The rooms, items and indexes of a mapped world image, decoded lazily."""
+
+    def __init__(self, path: Union[str, Path], hot_rooms: int = 1024) -> None:
+        image = self.image = WorldFile.load(path, mapped=True)
+        self.start = image.start
+        self.rooms: _Lru = _Lru(
+            hot_rooms, image.room_index, self._room,
+            lambda: (image.room_name(i) for i in range(image.room_count)),
+            image.room_count)
+        self.items: _Lru = _Lru(
+            hot_rooms, image.item_index, image.item,
+            lambda: (image.item_name(i) for i in range(image.item_count)),
+            image.item_count)
+        self.items_at: _Lru = _Lru(
+            hot_rooms, self._location_code, self._placed, self._locations,
+            image.room_count + 2)
+        self.aliases = _Aliases(image)
+        self.item_rank = _Ranks(image)
+        self.alias_trie = _AliasNode(image, "")
+
+    def _room(self, index: int):
+        rm = self.image.room(index)
+        # Frozen like a WorldTemplate's rooms: games copy before changing.
+        rm.exits = MappingProxyType(rm.exits)
+        rm.state = MappingProxyType(rm.state)
+        return rm
+
+    def _location_code(self, location: Optional[str]) -> Optional[int]:
+        if location is None:
+            return 0
+        if location == "inventory":
+            return 1
+        i = self.image.room_index(location)
+        return None if i is None else i + 2
+
+    def _placed(self, code: int) -> Mapping[str, None]:
+        names: Dict[str, None] = dict.fromkeys(
+            self.image.item_name(i) for i in self.image.placed(code))
+        return MappingProxyType(names)
+
+    def _locations(self) -> Iterator[Optional[str]]:
+        yield None
+        yield "inventory"
+        yield from self.rooms
@@ -0,0 +1,124 @@
+"""
+Phrase parser: turns "pick up the glowing crystal orb" into
+("pick", ["crystal", "orb"]).
+
+Verbs (including multi-word ones like "pick up"), directions and item
+aliases (including multi-word ones like "tp stone") are compiled into
+token tries once per Game class. A command is split into words once and
+each trie is walked from the current word for the longest match, so the
+cost depends on the length of the command, not on how many aliases the
+world has.
+
+Parsing rules:
+  * the first phrase is the verb; a bare direction ("n", "north") means go
+  * for go, pick and use, stop-words ("the", "a", ...) and unknown words
+    are skipped while looking for the direction/item; a preposition
+    ("on", "with", ...) ends the search, so "use the rope on the chasm"
+    uses the rope
+  * every other verb gets its words unchanged (save/load take file names)
+"""
+from typing import List, Mapping, Optional, Sequence, Tuple
+
+STOP_WORDS = frozenset({"the", "a", "an", "my", "your", "some", "this",
+                        "that", "up", "around", "please", "then"})
+PREPOSITIONS = frozenset({"on", "onto", "with", "at", "in", "into", "to",
+                          "from", "over", "across", "under"})
+# Punctuation people type around a command ("take orb.", "'look'").
+_PUNCTUATION = ".,!?;:\"'"
+_STRIP = _PUNCTUATION + " \t\r\n"
+
+_END = ""   # trie key holding the value of a phrase ending at that node
+
+
+# (canonical verb or None, what was typed in the verb's place, the words
+# handed to the verb's handler). A plain tuple: building a NamedTuple
+# costs more than the rest of a terse parse.
+Parse = Tuple[Optional[str], str, List[str]]
+
+
+def _compile(phrases: Mapping[str, str]) -> dict:
+    root: dict = {}
+    for phrase, value in phrases.items():
+        node = root
+        for word in phrase.split():
+            node = node.setdefault(word, {})
+        node[_END] = value
+    return root
+
+
+def _longest(trie: dict, words: Sequence[str], start: int):
+    """(value, end) of the longest phrase starting at words[start]."""
+    node, found, i = trie, None, start
+    while i < len(words):
+        node = node.get(words[i])
+        if node is None:
+            break
+        i += 1
+        if _END in node:
+            found = (node[_END], i)
+    return found
+
+
+class PhraseParser:
+    def __init__(self, verbs: Mapping[str, str], directions: Mapping[str, str],
+                 items: Mapping[str, str],
+                 argument_verbs: Sequence[str] = ("go", "pick", "use"),
+                 item_trie=None) -> None:
+        self.verbs = _compile(verbs)
+        self.directions = dict(directions)
+        if item_trie is None:
+            self.items = _compile({alias: alias for alias in items})
+            self.item_aliases = frozenset(items)
+        else:
+            # Supplied by a paged world: answers get() / _END lookups from
+            # the world image instead of holding every alias.
+            self.items = item_trie
+            self.item_aliases = items
+        self.argument_verbs = frozenset(argument_verbs)
+        # Verbs that no longer phrase starts with: no trie walk needed.
+        self._simple_verbs = {w: node[_END] for w, node in self.verbs.items()
+                              if len(node) == 1 and _END in node}
+
+    def parse(self, text: str) -> Parse:
+        words = text.lower().strip(_STRIP).split()
+        if not words:
+            return (None, "", [])
+        first = words[0]
+        verb = self._simple_verbs.get(first)
+        if verb is not None:
+            start = 1
+        else:
+            match = _longest(self.verbs, words, 0)
+            if match is None:
+                d = self.directions.get(first)
+                if d is not None:
+                    return "go", first, [d]
+                return None, first, words[1:]
+            verb, start = match
+        if verb not in self.argument_verbs:
+            return verb, first, words[start:]
+        # Fast path: the rest is exactly a direction or an alias.
+        rest = words[start:]
+        if len(rest) == 1 and verb == "go" and rest[0] in self.directions:
+            return verb, first, rest
+        if verb != "go" and " ".join(rest) in self.item_aliases:
+            return verb, first, rest
+        return verb, first, self._argument(verb, words, start)
+
+    def _argument(self, verb: str, words: List[str], start: int) -> List[str]:
+        """The words naming the direction/item, or the leftovers if none does."""
+        rest = []
+        for i in range(start, len(words)):
+            w = words[i]
+            if w in PREPOSITIONS and i > start:
+                break
+            if verb == "go":
+                if w in self.directions:
+                    return [w]
+            else:
+                match = _longest(self.items, words, i)
+                if match is not None:
+                    return words[i:match[1]]
+            if w not in STOP_WORDS:
+                rest.append(w)
+        return rest
@@ -1,4 +1,8 @@
 class PickStrategyBase:
+    # Constructor arguments that name rooms and items (see UseStrategyBase).
+    ROOM_ARGS = ()
+    ITEM_ARGS = ()
+
     def on_pick(self, game: "Game", item_name: str) -> None:
         # Optional hook per-room after a successful pick
         pass
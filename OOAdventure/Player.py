@@ -1,19 +1,35 @@
-from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Iterable
+
+from .Inventory import Inventory
 
 
-@dataclass
 class Player:
-    room: str = "Entrance"
-    inventory: List[str] = field(default_factory=list)
+    __slots__ = ("room", "inventory")
+
+    def __init__(self, room: str = "Entrance",
+                 inventory: Iterable[str] = ()) -> None:
+        self.room = room
+        self.inventory = (inventory if isinstance(inventory, Inventory)
+                          else Inventory(inventory))
+
+    def set_inventory(self, names: Iterable[str]) -> None:
+        self.inventory = Inventory(names)
 
     def has(self, item_name: str) -> bool:
         return item_name in self.inventory
 
     def add(self, item_name: str) -> None:
-        if item_name not in self.inventory:
-            self.inventory.append(item_name)
+        self.inventory.add(item_name)
 
     def remove(self, item_name: str) -> None:
-        if item_name in self.inventory:
-            self.inventory.remove(item_name)
+        self.inventory.discard(item_name)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Player):
+            return NotImplemented
+        return self.room == other.room and self.inventory == other.inventory
+
+    __hash__ = None  # mutable
+
+    def __repr__(self) -> str:
+        return f"Player(room={self.room!r}, inventory={self.inventory!r})"
@@ -1,24 +1,74 @@
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Dict, NamedTuple, Optional
 
 from .UseStrategy import UseStrategyBase
 from .PickStrategy import PickStrategyBase
 
 
-@dataclass
-class Room:
+class RoomDef(NamedTuple):
+    """The parts of a room that never change during play.
+
+    Built once per world (see WorldTemplate) and shared by every game.
+    """
     name: str
     desc: str
     clue: Optional[str] = None
-    exits: Dict[str, str] = field(
-        default_factory=dict)      # direction -> room_name
-    state: Dict[str, object] = field(
-        default_factory=dict)   # arbitrary per-room state
     use_strategy: Optional[UseStrategyBase] = None
     pick_strategy: Optional[PickStrategyBase] = None
 
+
+class Room:
+    """A room as one game sees it: a shared RoomDef plus its own exits/state.
+
+    `owner` tags the game (copy-on-write token, see Game) allowed to change
+    this record in place; the template's records have none.
+    """
+    __slots__ = ("spec", "exits", "state", "owner")
+
+    def __init__(self, name: str, desc: str, clue: Optional[str] = None,
+                 exits: Optional[Dict[str, str]] = None,
+                 state: Optional[Dict[str, object]] = None,
+                 use_strategy: Optional[UseStrategyBase] = None,
+                 pick_strategy: Optional[PickStrategyBase] = None) -> None:
+        self.spec = RoomDef(name, desc, clue, use_strategy, pick_strategy)
+        self.exits: Dict[str, str] = exits if exits is not None else {}  # direction -> room_name
+        self.state: Dict[str, object] = state if state is not None else {}  # arbitrary per-room state
+        self.owner: Optional[object] = None
+
+    @property
+    def name(self) -> str:
+        return self.spec.name
+
+    @property
+    def desc(self) -> str:
+        return self.spec.desc
+
+    @property
+    def clue(self) -> Optional[str]:
+        return self.spec.clue
+
+    @property
+    def use_strategy(self) -> Optional[UseStrategyBase]:
+        return self.spec.use_strategy
+
+    @property
+    def pick_strategy(self) -> Optional[PickStrategyBase]:
+        return self.spec.pick_strategy
+
+    def copy(self, owner: Optional[object] = None) -> "Room":
+        """Same definition, own copies of exits and state."""
+        twin = Room.__new__(Room)
+        twin.spec = self.spec
+        twin.exits = dict(self.exits)
+        twin.state = dict(self.state)
+        twin.owner = owner
+        return twin
+
     def connect(self, direction: str, room_name: str) -> None:
         self.exits[direction] = room_name
 
     def has_exit(self, direction: str) -> bool:
         return direction in self.exits
+
+    def __repr__(self) -> str:
+        return (f"Room({self.name!r}, exits={dict(self.exits)!r}, "
+                f"state={dict(self.state)!r})")
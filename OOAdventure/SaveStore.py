@@ -0,0 +1,156 @@
+"""
+SQLite save backend: every save of every session in one WAL-mode
+database instead of a JSON file per save.
+
+    store = SqliteSaveStore("saves.db")
+    game.saves = store.slots(session_id)
+    game.process_command("save")        # upserts (session_id, "save.json")
+
+Rows are keyed by (session, slot); the slot is the name `save`/`load`
+would otherwise use as a file name, so "save mine.json" still works. The
+player's room and the win flag are stored in indexed columns so that
+find() can answer "who is stuck in the Vault?" without parsing saves.
+
+Each thread gets its own connection (sqlite3 connections are not safe to
+share), reused for the life of the store. Writes commit one by one unless
+they are inside `with store.batch():` or go through write_many(), which
+commit once for the lot.
+"""
+import json
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS saves (
+    session TEXT NOT NULL,
+    slot    TEXT NOT NULL,
+    room    TEXT,
+    won     INTEGER NOT NULL DEFAULT 0,
+    data    TEXT NOT NULL,
+    updated REAL NOT NULL,
+    PRIMARY KEY (session, slot)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS saves_room ON saves (room);
+CREATE INDEX IF NOT EXISTS saves_won ON saves (won);
+"""
+
+# Constant SQL so sqlite3's statement cache keeps them prepared.
+_UPSERT = """
+INSERT INTO saves (session, slot, room, won, data, updated)
+VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT (session, slot) DO UPDATE SET
+    room = excluded.room, won = excluded.won,
+    data = excluded.data, updated = excluded.updated
+"""
+_SELECT = "SELECT data FROM saves WHERE session = ? AND slot = ?"
+_DELETE = "DELETE FROM saves WHERE session = ? AND slot = ?"
+
+
+def _row(session: str, slot: str, data: dict, won: bool) -> tuple:
+    return (session, slot, data.get("player", {}).get("room"), int(won),
+            json.dumps(data, separators=(",", ":")), time.time())
+
+
+class SqliteSaveStore:
+    def __init__(self, path: str = "saves.db") -> None:
+        self.path = str(path)
+        self._local = threading.local()
+        self._conns: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self._conn().executescript(_SCHEMA)
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, check_same_thread=False,
+                                   isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=5000")
+            self._local.conn = conn
+            self._local.depth = 0
+            with self._lock:
+                self._conns.append(conn)
+        return conn
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Commit this thread's writes once, at the end of the block."""
+        conn = self._conn()
+        if self._local.depth == 0:
+            conn.execute("BEGIN IMMEDIATE")
+        self._local.depth += 1
+        try:
+            yield
+        except BaseException:
+            self._local.depth -= 1
+            if self._local.depth == 0:
+                conn.execute("ROLLBACK")
+            raise
+        self._local.depth -= 1
+        if self._local.depth == 0:
+            conn.execute("COMMIT")
+
+    def write(self, session: str, slot: str, data: dict,
+              won: bool = False) -> None:
+        self._conn().execute(_UPSERT, _row(session, slot, data, won))
+
+    def write_many(self,
+                   rows: Iterable[Tuple[str, str, dict, bool]]) -> None:
+        """Upsert (session, slot, data, won) rows in one transaction."""
+        with self.batch():
+            self._conn().executemany(_UPSERT, (_row(*r) for r in rows))
+
+    def read(self, session: str, slot: str) -> Optional[dict]:
+        row = self._conn().execute(_SELECT, (session, slot)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def delete(self, session: str, slot: str) -> None:
+        self._conn().execute(_DELETE, (session, slot))
+
+    def find(self, room: Optional[str] = None,
+             won: Optional[bool] = None) -> List[Tuple[str, str]]:
+        """(session, slot) of saves in `room` and/or with the given win state."""
+        where, args = [], []
+        if room is not None:
+            where.append("room = ?")
+            args.append(room)
+        if won is not None:
+            where.append("won = ?")
+            args.append(int(won))
+        sql = "SELECT session, slot FROM saves"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        return self._conn().execute(sql + " ORDER BY session, slot",
+                                    args).fetchall()
+
+    def slots(self, session: str) -> "SaveSlots":
+        return SaveSlots(self, session)
+
+    def close(self) -> None:
+        with self._lock:
+            conns, self._conns = self._conns, []
+        for conn in conns:
+            conn.close()
+        self._local = threading.local()
+
+
+class SaveSlots:
+    """One session's view of a store; what Game.saves expects."""
+    __slots__ = ("store", "session")
+
+    def __init__(self, store: SqliteSaveStore, session: str) -> None:
+        self.store = store
+        self.session = session
+
+    def write(self, slot: str, data: dict, won: bool = False) -> None:
+        self.store.write(self.session, slot, data, won)
+
+    def read(self, slot: str) -> Optional[dict]:
+        return self.store.read(self.session, slot)
+
+    def delete(self, slot: str) -> None:
+        self.store.delete(self.session, slot)
@@ -0,0 +1,90 @@
+"""
+Pool of ready-to-play games for new visitors.
+
+    pool = SessionPool(new_game, size=64, refill_per_sec=500)
+    game, opening = pool.take()        # opening: CommandResult of "look"
+
+A background thread keeps up to `size` games built, each with its opening
+command already run, so a new session costs a deque pop instead of
+building a game and rendering the first screen on the request path. The
+thread builds at most `refill_per_sec` games a second (0 for no limit),
+so refilling after a spike does not starve the request threads. When the
+pool is empty, take() builds one inline rather than waiting.
+"""
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Optional, Tuple
+
+from .CommandResult import CommandResult
+from .Game import Game
+
+
+def quiet_game() -> Game:
+    """A game that keeps its text in CommandResults (the default factory)."""
+    game = Game()
+    game.echo = False
+    return game
+
+
+class SessionPool:
+    def __init__(self, factory: Callable[[], Game] = quiet_game, size: int = 32,
+                 refill_per_sec: float = 0.0, opening: str = "look") -> None:
+        self.factory = factory
+        self.size = size
+        self.refill_per_sec = refill_per_sec
+        self.opening = opening
+        self.hits = 0
+        self.misses = 0
+        self._ready: Deque[Tuple[Game, CommandResult]] = deque()
+        self._cond = threading.Condition()
+        self._closed = False
+        self._thread = threading.Thread(target=self._refill, daemon=True,
+                                        name="SessionPool")
+        self._thread.start()
+
+    def _build(self) -> Tuple[Game, CommandResult]:
+        game = self.factory()
+        return game, game.process_command(self.opening)
+
+    def take(self) -> Tuple[Game, CommandResult]:
+        """A fresh game and the result of its opening command."""
+        with self._cond:
+            if self._ready:
+                self.hits += 1
+                ready = self._ready.popleft()
+                self._cond.notify()
+                return ready
+            self.misses += 1
+            self._cond.notify()
+        return self._build()
+
+    def __len__(self) -> int:
+        return len(self._ready)
+
+    def wait_full(self, timeout: Optional[float] = None) -> bool:
+        """Block until the pool holds `size` games (for startup and tests)."""
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: len(self._ready) >= self.size or self._closed, timeout)
+
+    def _refill(self) -> None:
+        gap = 1.0 / self.refill_per_sec if self.refill_per_sec > 0 else 0.0
+        while True:
+            with self._cond:
+                self._cond.wait_for(
+                    lambda: len(self._ready) < self.size or self._closed)
+                if self._closed:
+                    return
+            ready = self._build()
+            with self._cond:
+                self._ready.append(ready)
+                self._cond.notify_all()
+            if gap:
+                time.sleep(gap)
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
@@ -0,0 +1,196 @@
+"""
+Per-session game store: one journal file per session id, with an
+in-memory LRU cache of live games in front of it.
+
+    store = SessionStore("sessions", max_sessions=500, ttl=1800)
+    with store.session(session_id) as s:
+        result = s.game.process_command(cmd)
+        s.record(result)
+
+A cache miss replays the session's journal (or starts a new game). The
+cache holds at most `max_sessions` games; the least recently used ones,
+and any idle for longer than `ttl` seconds, are evicted after a final
+snapshot so that reloading them is quick. A session is locked while it
+is in use, so it is never evicted mid-command; the next least recently
+used one goes instead (the cache can only exceed max_sessions by
+sessions that are all in use at that moment).
+"""
+import re
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional, Type
+
+from .AutoSaver import AutoSaver
+from .CommandResult import CommandResult
+from .Game import Game
+from .Journal import Journal
+
+
+class Session:
+    __slots__ = ("sid", "game", "journal", "lock", "last_used", "evicted",
+                 "fresh")
+
+    def __init__(self, sid: str, game: Game, journal: Journal,
+                 fresh: bool = False) -> None:
+        self.sid = sid
+        self.game = game
+        self.journal = journal
+        self.lock = threading.Lock()
+        self.last_used = time.monotonic()
+        self.evicted = False
+        # True for a new session that has nothing recorded yet, so the
+        # caller may swap in a pre-built game (see SessionPool).
+        self.fresh = fresh
+
+    def record(self, result: CommandResult) -> None:
+        self.journal.record(self.game, result)
+        self.fresh = False
+
+    def reset(self, game: Optional[Game] = None) -> None:
+        """Replace the session's game (a fresh one by default)."""
+        self.game = game if game is not None else type(self.game)()
+        self.game.echo = False
+        self.journal.reset(self.game)
+        self.fresh = False
+
+
+class SessionStore:
+    def __init__(self, folder: str = "sessions", max_sessions: int = 1000,
+                 ttl: float = 1800.0, saver: Optional[AutoSaver] = None,
+                 snapshot_every: int = 200, game_cls: Type[Game] = Game) -> None:
+        self.folder = Path(folder)
+        self.folder.mkdir(parents=True, exist_ok=True)
+        self.max_sessions = max_sessions
+        self.ttl = ttl
+        self.saver = saver
+        self.snapshot_every = snapshot_every
+        self.game_cls = game_cls
+        self.evictions = 0
+        self._cache: "OrderedDict[str, Session]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._last_sweep = time.monotonic()
+
+    def path(self, sid: str) -> Path:
+        return self.folder / (re.sub(r"[^A-Za-z0-9_-]", "_", sid) + ".journal")
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    @contextmanager
+    def session(self, sid: str) -> Iterator[Session]:
+        """The session for `sid`, locked for the duration of the block."""
+        while True:
+            s = self._get(sid)
+            s.lock.acquire()
+            if not s.evicted:
+                break
+            s.lock.release()       # evicted while we waited; load again
+        try:
+            yield s
+            s.last_used = time.monotonic()
+        finally:
+            s.lock.release()
+        self._maybe_sweep()
+
+    def _get(self, sid: str) -> Session:
+        with self._lock:
+            s = self._cache.get(sid)
+            if s is not None:
+                self._cache.move_to_end(sid)
+                return s
+        s = self._load(sid)
+        with self._lock:
+            # Another thread may have loaded it meanwhile; keep the first.
+            s = self._cache.setdefault(sid, s)
+            self._cache.move_to_end(sid)
+            over = len(self._cache) > self.max_sessions
+            oldest = [v for v in self._cache.values() if v is not s] if over else []
+        # Least recently used first; one in use is passed over for the
+        # next oldest, so the cache only stays over max_sessions while
+        # every other session in it is busy.
+        for v in oldest:
+            with self._lock:
+                if len(self._cache) <= self.max_sessions:
+                    break
+            self._evict(v)
+        return s
+
+    def _load(self, sid: str) -> Session:
+        path = self.path(sid)
+        if self.saver is not None:
+            self.saver.flush(str(path))
+        journal = Journal(str(path), self.snapshot_every, saver=self.saver)
+        fresh = not path.exists()
+        if fresh:
+            game = self.game_cls()
+        else:
+            game = Journal.replay(str(path), self.game_cls)
+        game.echo = False
+        return Session(sid, game, journal, fresh)
+
+    def _evict(self, s: Session) -> bool:
+        if not s.lock.acquire(blocking=False):
+            return False           # in use; try again next time
+        try:
+            with self._lock:
+                if self._cache.get(s.sid) is s:
+                    del self._cache[s.sid]
+            s.evicted = True
+            s.journal.snapshot(s.game)
+            s.journal.close()
+            self.evictions += 1
+            return True
+        finally:
+            s.lock.release()
+
+    def evict_idle(self, now: Optional[float] = None) -> int:
+        """Evict sessions idle for longer than ttl; returns how many."""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            idle = [s for s in self._cache.values()
+                    if now - s.last_used > self.ttl]
+        return sum(self._evict(s) for s in idle)
+
+    def _maybe_sweep(self) -> None:
+        now = time.monotonic()
+        if now - self._last_sweep > self.ttl / 10:
+            self._last_sweep = now
+            self.evict_idle(now)
+
+    def drop(self, sid: str) -> None:
+        """Forget a session entirely (memory and disk)."""
+        # Lock the session as _evict does, but wait for a command in
+        # flight, and delete the journal before letting go: a request that
+        # was waiting then loads a new game instead of recording into a
+        # deleted file.
+        while True:
+            with self._lock:
+                s = self._cache.get(sid)
+            if s is None:
+                break
+            s.lock.acquire()
+            with self._lock:
+                if self._cache.get(sid) is s:
+                    del self._cache[sid]
+                    break
+            s.lock.release()       # evicted meanwhile; look again
+        try:
+            if s is not None:
+                s.evicted = True
+                s.journal.close()
+            if self.saver is not None:
+                self.saver.flush(str(self.path(sid)))
+            self.path(sid).unlink(missing_ok=True)
+        finally:
+            if s is not None:
+                s.lock.release()
+
+    def close(self) -> None:
+        """Snapshot and release every cached session."""
+        with self._lock:
+            sessions = list(self._cache.values())
+        for s in sessions:
+            self._evict(s)
@@ -0,0 +1,31 @@
+from typing import Iterable
+
+from .Game import Game
+
+# Outcome codes, one byte per command.
+OK = 0
+FAILED = 1
+GAME_OVER = 2   # quit / restart
+WON = 3
+
+
+def run_commands(game: Game, commands: Iterable[str],
+                 stop_on_game_over: bool = True) -> bytearray:
+    """Run a batch of commands and return one outcome code per command.
+
+    Meant for a ``Game(headless=True)``, which skips all text; it works on
+    any Game, though, so a normal game can be driven the same way.
+    """
+    outcomes = bytearray()
+    process = game.process_command
+    for cmd in commands:
+        result = process(cmd)
+        if result.won:
+            outcomes.append(WON)
+        elif result.game_over:
+            outcomes.append(GAME_OVER)
+        else:
+            outcomes.append(OK if result.ok else FAILED)
+        if result.game_over and stop_on_game_over:
+            break
+    return outcomes
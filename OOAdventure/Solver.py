@@ -0,0 +1,95 @@
+"""
+Shortest-solution solver.
+
+Breadth-first search over game states, where each step is a real command
+run through Game.process_command, so the search uses exactly the same
+UseStrategy/PickStrategy logic as play. States are deduplicated by
+Game.state_key(); only keys are queued, and a state is rebuilt from its
+key (a cheap copy-on-write clone) when it is expanded.
+
+    python -m OOAdventure.Solver
+"""
+import time
+from collections import deque
+from typing import List, NamedTuple, Optional
+
+from .Game import Game
+
+
+class Solution(NamedTuple):
+    commands: Optional[List[str]]   # None when the game cannot be won
+    states: int                     # distinct states reached
+
+
+def actions(game: Game) -> List[str]:
+    """Commands worth trying from this state (canonical names, lower case)."""
+    room = game.room(game.player.room)
+    cmds = [f"go {d}" for d in room.exits]
+    cmds += [f"pick {name.lower()}" for name in game.items_in(room.name)]
+    cmds += [f"use {name.lower()}" for name in game.player.inventory]
+    return cmds
+
+
+def solve(game: Optional[Game] = None, exhaustive: bool = True,
+          max_states: Optional[int] = None) -> Solution:
+    """Minimal winning command list from `game`'s current state.
+
+    With exhaustive=True (the default) the search carries on after the
+    first win so that `states` counts every reachable state; otherwise it
+    stops at the first (shortest) win. Won states are not expanded.
+    """
+    start = (game or Game()).clone()
+    start.headless = True
+
+    start_key = start.state_key()
+    parents = {start_key: None}     # key -> (parent key, command)
+    queue = deque([start_key])
+    best = None
+    while queue:
+        key = queue.popleft()
+        state = start.with_state_key(key)
+        for cmd in actions(state):
+            nxt = state.clone()
+            result = nxt.process_command(cmd)
+            if not result.ok:
+                continue
+            nxt_key = nxt.state_key()
+            if nxt_key in parents:
+                continue
+            parents[nxt_key] = (key, cmd)
+            if result.won:
+                if best is None:
+                    best = _path(parents, nxt_key)
+                if not exhaustive:
+                    return Solution(best, len(parents))
+                continue
+            if max_states is not None and len(parents) >= max_states:
+                return Solution(best, len(parents))
+            queue.append(nxt_key)
+    return Solution(best, len(parents))
+
+
+def _path(parents: dict, key) -> List[str]:
+    cmds = []
+    while parents[key] is not None:
+        key, cmd = parents[key]
+        cmds.append(cmd)
+    return cmds[::-1]
+
+
+def main() -> int:
+    t0 = time.perf_counter()
+    solution = solve()
+    elapsed = time.perf_counter() - t0
+    if solution.commands is None:
+        print(f"Not winnable ({solution.states} states reached).")
+        return 1
+    print(f"Won in {len(solution.commands)} commands "
+          f"({solution.states} states, {elapsed * 1000:.1f} ms):")
+    for cmd in solution.commands:
+        print(f"  > {cmd}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,233 @@
+"""
+Compact binary encoding of a game's mutable state.
+
+Everything is stored as unsigned varints against a StateSchema built once
+per Game class from its starting world: rooms, items and directions become
+indexes, and known strings (state keys and values, including the
+STATE_VALUES declared by use strategies) become small codes. Anything the
+schema does not know is written inline, so encoding never fails on
+unexpected state: state values other than bool/None/int/str (floats,
+lists, ...) are stored inline as JSON text.
+
+Layout (all numbers are varints):
+    version
+    player room, inventory count, inventory item indexes (in order)
+    per item:  0 = nowhere, 1 = inventory, 2 + room index
+    per room:  exit bitmask over schema directions, one target per set bit,
+               count of other exits, (inline direction, target) each,
+               state entry count, (key, tagged value) each
+"""
+import json
+from typing import Dict, List, Tuple, Type
+
+VERSION = 1
+
+# Tags for room state values.
+_FALSE, _TRUE, _NONE, _INT, _WORD, _TEXT, _JSON = range(7)
+
+
+def _put(buf: bytearray, n: int) -> None:
+    while n > 0x7F:
+        buf.append((n & 0x7F) | 0x80)
+        n >>= 7
+    buf.append(n)
+
+
+def _get(data: bytes, pos: int) -> Tuple[int, int]:
+    b = data[pos]
+    if b < 0x80:            # almost every number fits in one byte
+        return b, pos + 1
+    n = shift = 0
+    while True:
+        b = data[pos]
+        pos += 1
+        n |= (b & 0x7F) << shift
+        if b < 0x80:
+            return n, pos
+        shift += 7
+
+
+class StateSchema:
+    def __init__(self, game) -> None:
+        self.rooms: List[str] = list(game.rooms)
+        self.items: List[str] = list(game.items)
+        self.directions: List[str] = list(dict.fromkeys(game.DIR_ALIASES.values()))
+        words = {}
+        for rm in game.rooms.values():
+            for key, value in rm.state.items():
+                words.setdefault(key, None)
+                if isinstance(value, str):
+                    words.setdefault(value, None)
+            if rm.use_strategy is not None:
+                for value in rm.use_strategy.STATE_VALUES:
+                    words.setdefault(value, None)
+        self.words: List[str] = list(words)
+        self.room_index = {name: i for i, name in enumerate(self.rooms)}
+        self.item_index = {name: i for i, name in enumerate(self.items)}
+        self.dir_index = {d: i for i, d in enumerate(self.directions)}
+        self.word_index = {w: i for i, w in enumerate(self.words)}
+
+    # ----- strings -----
+    def _put_text(self, buf: bytearray, s: str) -> None:
+        raw = s.encode("utf-8")
+        _put(buf, len(raw))
+        buf += raw
+
+    def _get_text(self, data: bytes, pos: int) -> Tuple[str, int]:
+        n, pos = _get(data, pos)
+        return data[pos:pos + n].decode("utf-8"), pos + n
+
+    def _put_key(self, buf: bytearray, key: str) -> None:
+        # 0 = inline text follows, else word index + 1
+        code = self.word_index.get(key)
+        if code is None:
+            buf.append(0)
+            self._put_text(buf, key)
+        else:
+            _put(buf, code + 1)
+
+    def _get_key(self, data: bytes, pos: int) -> Tuple[str, int]:
+        code, pos = _get(data, pos)
+        if code == 0:
+            return self._get_text(data, pos)
+        return self.words[code - 1], pos
+
+    def _put_value(self, buf: bytearray, value: object) -> None:
+        if value is True:
+            buf.append(_TRUE)
+        elif value is False:
+            buf.append(_FALSE)
+        elif value is None:
+            buf.append(_NONE)
+        elif isinstance(value, int):
+            buf.append(_INT)
+            _put(buf, (value << 1) if value >= 0 else ((-value << 1) - 1))
+        elif isinstance(value, str) and value in self.word_index:
+            buf.append(_WORD)
+            _put(buf, self.word_index[value])
+        elif isinstance(value, str):
+            buf.append(_TEXT)
+            self._put_text(buf, value)
+        else:
+            buf.append(_JSON)
+            self._put_text(buf, json.dumps(value))
+
+    def _get_value(self, data: bytes, pos: int) -> Tuple[object, int]:
+        tag = data[pos]
+        pos += 1
+        if tag == _TRUE:
+            return True, pos
+        if tag == _FALSE:
+            return False, pos
+        if tag == _NONE:
+            return None, pos
+        if tag == _INT:
+            n, pos = _get(data, pos)
+            return (n >> 1) if not n & 1 else -((n + 1) >> 1), pos
+        if tag == _WORD:
+            n, pos = _get(data, pos)
+            return self.words[n], pos
+        if tag == _JSON:
+            text, pos = self._get_text(data, pos)
+            return json.loads(text), pos
+        return self._get_text(data, pos)
+
+    # ----- whole state -----
+    def encode(self, game) -> bytes:
+        buf = bytearray()
+        _put(buf, VERSION)
+        _put(buf, self.room_index[game.player.room])
+        inventory = game.player.inventory
+        _put(buf, len(inventory))
+        for name in inventory:
+            _put(buf, self.item_index[name])
+
+        room_index = self.room_index
+        for name in self.items:
+            loc = game.items[name].location
+            if loc is None:
+                buf.append(0)
+            elif loc == "inventory":
+                buf.append(1)
+            else:
+                _put(buf, room_index[loc] + 2)
+
+        dir_index = self.dir_index
+        for name in self.rooms:
+            rm = game.rooms[name]
+            mask, targets, others = 0, {}, []
+            for direction, target in rm.exits.items():
+                bit = dir_index.get(direction)
+                if bit is None:
+                    others.append((direction, target))
+                else:
+                    mask |= 1 << bit
+                    targets[bit] = target
+            _put(buf, mask)
+            for bit in sorted(targets):
+                _put(buf, room_index[targets[bit]])
+            _put(buf, len(others))
+            for direction, target in others:
+                self._put_text(buf, direction)
+                _put(buf, room_index[target])
+            _put(buf, len(rm.state))
+            for key, value in rm.state.items():
+                self._put_key(buf, key)
+                self._put_value(buf, value)
+        return bytes(buf)
+
+    def decode(self, data: bytes) -> dict:
+        """The encoded state as a Game.to_dict()-shaped dict."""
+        version, pos = _get(data, 0)
+        if version != VERSION:
+            raise ValueError(f"Unknown state encoding version {version}")
+        room, pos = _get(data, pos)
+        count, pos = _get(data, pos)
+        inventory = []
+        for _ in range(count):
+            i, pos = _get(data, pos)
+            inventory.append(self.items[i])
+
+        items = {}
+        for name in self.items:
+            code, pos = _get(data, pos)
+            loc = None if code == 0 else "inventory" if code == 1 else self.rooms[code - 2]
+            items[name] = {"location": loc}
+
+        rooms = {}
+        for name in self.rooms:
+            mask, pos = _get(data, pos)
+            exits = {}
+            for bit, direction in enumerate(self.directions):
+                if mask >> bit & 1:
+                    target, pos = _get(data, pos)
+                    exits[direction] = self.rooms[target]
+            count, pos = _get(data, pos)
+            for _ in range(count):
+                direction, pos = self._get_text(data, pos)
+                target, pos = _get(data, pos)
+                exits[direction] = self.rooms[target]
+            count, pos = _get(data, pos)
+            state = {}
+            for _ in range(count):
+                key, pos = self._get_key(data, pos)
+                state[key], pos = self._get_value(data, pos)
+            rooms[name] = {"exits": exits, "state": state}
+
+        return {
+            "version": 1,
+            "player": {"room": self.rooms[room], "inventory": inventory},
+            "items": items,
+            "rooms": rooms,
+        }
+
+
+_SCHEMAS: Dict[type, StateSchema] = {}
+
+
+def schema_for(game_cls: Type) -> StateSchema:
+    """The schema for a Game class, built once from a pristine world."""
+    schema = _SCHEMAS.get(game_cls)
+    if schema is None:
+        schema = _SCHEMAS[game_cls] = StateSchema(game_cls(headless=True))
+    return schema
@@ -0,0 +1,73 @@
+"""
+Append-only transcript for long sessions.
+
+    chat = Transcript(window=200)
+    chat.append(("> look", text))
+    chatbot_value = chat.window()     # what the browser is sent
+    everything = list(chat)           # full history, e.g. for a download
+
+Appending is O(1): entries go into an open chunk, and every `chunk`
+entries the chunk is sealed into a zlib-compressed JSON blob. The last
+`window` entries are also kept as-is in a deque, so the UI never has to
+decompress anything. Entries must be JSON-serializable; those read back
+from sealed chunks come out as JSON gives them (tuples as lists).
+"""
+import json
+import zlib
+from collections import deque
+from typing import Any, Iterable, Iterator, List
+
+
+class Transcript:
+    def __init__(self, entries: Iterable[Any] = (), window: int = 200,
+                 chunk: int = 256) -> None:
+        self.chunk = chunk
+        self._sealed: List[bytes] = []
+        self._open: List[Any] = []
+        self._recent: deque = deque(maxlen=window)
+        for entry in entries:
+            self.append(entry)
+
+    def append(self, entry: Any) -> None:
+        self._open.append(entry)
+        self._recent.append(entry)
+        if len(self._open) >= self.chunk:
+            self._sealed.append(zlib.compress(
+                json.dumps(self._open, separators=(",", ":")).encode()))
+            self._open = []
+
+    def __len__(self) -> int:
+        return len(self._sealed) * self.chunk + len(self._open)
+
+    def __iter__(self) -> Iterator[Any]:
+        for blob in self._sealed:
+            yield from json.loads(zlib.decompress(blob))
+        yield from self._open
+
+    def window(self) -> List[Any]:
+        """The most recent entries (at most `window` of them)."""
+        return list(self._recent)
+
+    def page(self, start: int, size: int) -> List[Any]:
+        """Entries start .. start+size-1, decompressing only the chunks needed."""
+        stop = min(start + size, len(self))
+        out: List[Any] = []
+        i = max(start, 0)
+        while i < stop:
+            c, offset = divmod(i, self.chunk)
+            if c < len(self._sealed):
+                part = json.loads(zlib.decompress(self._sealed[c]))
+            else:
+                part = self._open
+            take = part[offset:offset + stop - i]
+            out += take
+            i += len(take)
+        return out
+
+    def since(self, start: int) -> List[Any]:
+        """Every entry from index `start` on (what a client has not seen)."""
+        return self.page(start, len(self) - start)
+
+    def stored_bytes(self) -> int:
+        """Bytes held by the sealed (compressed) chunks."""
+        return sum(len(blob) for blob in self._sealed)
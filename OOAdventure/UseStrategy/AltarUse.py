@@ -2,14 +2,23 @@ from . import UseStrategyBase
 
 
 class AltarUse(UseStrategyBase):
+    """Laying `item` across the chasm in `room` opens `direction` to `to`."""
+    ROOM_ARGS = ("room", "to")
+    ITEM_ARGS = ("item",)
+
+    def __init__(self, room: str, direction: str, to: str,
+                 item: str = "Enchanted Rope") -> None:
+        self.room, self.item = room, item
+        self.direction, self.to = direction, to
+
     def use(self, game: "Game", item_name: str) -> None:
-        if item_name == "Enchanted Rope":
-            room = game.room("Altar")
-            if not room.has_exit("north"):
-                print(
-                    "You lay the rope across the chasm below. The path north is now safe.")
-                room.connect("north", "Chamber")
+        if item_name == self.item:
+            room = game.room(self.room)
+            if not room.has_exit(self.direction):
+                game.say(
+                    f"You lay the rope across the chasm below. The path {self.direction} is now safe.")
+                game.unlock_exit(self.room, self.direction, self.to)
             else:
-                print("The rope bridge is already in place.")
+                game.say("The rope bridge is already in place.")
         else:
-            print("Nothing happens.")
+            game.fail("Nothing happens.")
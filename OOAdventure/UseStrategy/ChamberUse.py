@@ -1,32 +1,46 @@
+from typing import Optional
+
 from . import UseStrategyBase
 
 
 class ChamberUse(UseStrategyBase):
+    """`melt` thaws the pool in `room`, showing `prize` (if any); `freeze`
+    then refreezes it and opens `direction` to `to`."""
+    STATE_VALUES = ("frozen", "melted", "refrozen")
+    ROOM_ARGS = ("room", "to")
+    ITEM_ARGS = ("melt", "freeze", "prize")
+
+    def __init__(self, room: str, direction: str, to: str,
+                 melt: str = "Fire Scroll", freeze: str = "Ice Wand",
+                 prize: Optional[str] = "Vault Key") -> None:
+        self.room, self.melt, self.freeze, self.prize = room, melt, freeze, prize
+        self.direction, self.to = direction, to
+
     def use(self, game: "Game", item_name: str) -> None:
-        room = game.room("Chamber")
+        room = game.room(self.room)
         ice = room.state.get("ice_state", "frozen")
 
-        if item_name == "Fire Scroll":
+        if item_name == self.melt:
             if ice == "frozen":
-                print("You read the Fire Scroll. Flames dance across the pool, melting the ice! "
-                      "The Vault Key gleams at the bottom.")
-                room.state["ice_state"] = "melted"
-                key = game.items["Vault Key"]
-                if key.location is None:
-                    key.location = "Chamber"
+                gleams = f" The {self.prize} gleams at the bottom." if self.prize else ""
+                game.say(f"You read the {self.melt}. Flames dance across the pool, melting the ice!"
+                         + gleams)
+                game.set_room_state(self.room, "ice_state", "melted")
+                if self.prize and game.items[self.prize].location is None:
+                    game.place_item(self.prize, self.room)
             else:
-                print("The fire crackles, but the pool is already melted.")
+                game.say("The fire crackles, but the pool is already melted.")
 
-        elif item_name == "Ice Wand":
+        elif item_name == self.freeze:
             if ice == "melted":
-                print("You wave the Ice Wand. Frost races across the pool, freezing it solid again. "
-                      "You can now cross to the east.")
-                room.state["ice_state"] = "refrozen"
-                if not room.has_exit("east"):
-                    room.connect("east", "Vault")
+                game.say(f"You wave the {self.freeze}. Frost races across the pool, freezing it solid again. "
+                         f"You can now cross to the {self.direction}.")
+                game.set_room_state(self.room, "ice_state", "refrozen")
+                if not room.has_exit(self.direction):
+                    game.unlock_exit(self.room, self.direction, self.to)
             elif ice == "frozen":
-                print("The pool is already frozen solid.")
+                game.say("The pool is already frozen solid.")
             elif ice == "refrozen":
-                print("The pool remains safe to cross.")
+                game.say("The pool remains safe to cross.")
         else:
-            print("Nothing happens.")
+            game.fail("Nothing happens.")
@@ -2,14 +2,23 @@ from . import UseStrategyBase
 
 
 class LibraryUse(UseStrategyBase):
+    """Placing `item` on the pedestal in `room` opens `direction` to `to`."""
+    ROOM_ARGS = ("room", "to")
+    ITEM_ARGS = ("item",)
+
+    def __init__(self, room: str, direction: str, to: str,
+                 item: str = "Crystal Orb") -> None:
+        self.room, self.item = room, item
+        self.direction, self.to = direction, to
+
     def use(self, game: "Game", item_name: str) -> None:
-        if item_name == "Crystal Orb":
-            room = game.room("Library")
-            if not room.has_exit("east"):
-                print(
-                    "You place the Crystal Orb on the pedestal. A hidden door opens to the east!")
-                room.connect("east", "Altar")
+        if item_name == self.item:
+            room = game.room(self.room)
+            if not room.has_exit(self.direction):
+                game.say(
+                    f"You place the {self.item} on the pedestal. A hidden door opens to the {self.direction}!")
+                game.unlock_exit(self.room, self.direction, self.to)
             else:
-                print("The hidden door is already open.")
+                game.say("The hidden door is already open.")
         else:
-            print("Nothing happens.")
+            game.fail("Nothing happens.")
@@ -1,3 +1,11 @@
 class UseStrategyBase:
+    # Room.state values this strategy can set, so compact state encodings
+    # can store them as small codes instead of strings.
+    STATE_VALUES = ()
+    # Constructor arguments that name rooms and items, which world files
+    # check exist.
+    ROOM_ARGS = ()
+    ITEM_ARGS = ()
+
     def use(self, game: "Game", item_name: str) -> None:
-        print("Nothing happens.")
+        game.fail("Nothing happens.")
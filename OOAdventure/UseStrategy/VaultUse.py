@@ -1,21 +1,34 @@
+from typing import Optional
+
 from . import UseStrategyBase
 
 
 class VaultUse(UseStrategyBase):
+    """`stone` opens the vault in `room` once the player holds `key`. The
+    way in from `approach` (by `direction`) is made sure of as well."""
+    ROOM_ARGS = ("room", "approach")
+    ITEM_ARGS = ("stone", "key")
+
+    def __init__(self, room: str, stone: str = "Teleportation Stone",
+                 key: str = "Vault Key", approach: Optional[str] = None,
+                 direction: str = "east") -> None:
+        self.room, self.stone, self.key = room, stone, key
+        self.approach, self.direction = approach, direction
+
     def use(self, game: "Game", item_name: str) -> None:
-        room = game.room("Vault")
-        if item_name == "Teleportation Stone":
-            if game.player.has("Vault Key"):
+        room = game.room(self.room)
+        if item_name == self.stone:
+            if game.player.has(self.key):
                 if not room.state.get("open"):
-                    print("You activate the stone. The vault door swings open!")
-                    room.state["open"] = True
+                    game.say("You activate the stone. The vault door swings open!")
+                    game.set_room_state(self.room, "open", True)
                     # Safety: ensure Chamber → Vault is present
-                    if not game.room("Chamber").has_exit("east"):
-                        game.room("Chamber").connect("east", "Vault")
-                    game.show_status()  # will end the game here
+                    if self.approach and not game.room(self.approach).has_exit(self.direction):
+                        game.unlock_exit(self.approach, self.direction, self.room)
+                    game.show_status()  # reports the win (game_won event)
                 else:
-                    print("The vault is already open.")
+                    game.say("The vault is already open.")
             else:
-                print("The stone does nothing without a key.")
+                game.fail("The stone does nothing without a key.")
         else:
-            print("Nothing happens.")
+            game.fail("Nothing happens.")
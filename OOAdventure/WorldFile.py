@@ -0,0 +1,650 @@
+"""
+World files: a game's rooms, exits, items and aliases as data.
+
+    {
+      "start": "Entrance",
+      "rooms": {
+        "Library": {
+          "desc": "Dusty books line the walls.",
+          "clue": "An orb belongs on the pedestal.",   (optional)
+          "exits": {"south": "Entrance"},
+          "gated": {"east": "Altar"},        (exits a strategy opens in play)
+          "state": {"open": false},          (starting room state)
+          "use": "LibraryUse",               (strategy class name, or
+          "pick": "ChamberPick"               {"strategy": name, "args": {...}})
+        }
+      },
+      "items": {
+        "Crystal Orb": {"at": "Library", "used_in": "Library", "aliases": ["orb"]}
+      }
+    }
+
+Strategy names are looked up in OOAdventure.UseStrategy/PickStrategy, or
+given in full as "package.module:Class". Arguments a strategy takes but
+the file leaves out come from the world where it can tell: `room` is the
+room the strategy is attached to, `direction` and `to` that room's gated
+exit, and `approach` (with `direction`) the gated exit leading into it.
+Arguments the strategy lists in ROOM_ARGS/ITEM_ARGS must name rooms and
+items of the world. An item "at" null starts nowhere (a strategy places
+it), "inventory" starts carried.
+
+compile_world() checks a world, reporting every problem at once as a
+WorldError, and packs it into a flat binary image. load() keeps that
+image in __pycache__ next to the world file, named by the SHA-256 of the
+text, so once a world has been compiled, starting a server only hashes
+the file and unpacks the image; no JSON is parsed. load(path,
+mapped=True) maps the image instead of reading it, for worlds paged in
+a room at a time (see PagedWorld).
+
+Image layout (little-endian u32 unless noted):
+    header   magic "WQW1", version, room count, item count, start room,
+             string count, the offsets of the string, room, item, pool,
+             name, placed, item name and alias sections, alias count
+    strings  count + 1 offsets into the UTF-8 blob that follows them
+    rooms    11 per room: name, desc, clue, use, pick (string ids, NONE
+             when absent), then (pool offset, count) of its exits, gated
+             exits and state entries
+    items    5 per item: name, location (0 nowhere, 1 inventory, 2 + room
+             index), used_in, (pool offset, count) of its aliases
+    pool     exits as (direction, room index) pairs, state as (key, tag,
+             value) triples, aliases as string ids
+    names    room indexes sorted by room name, for lookups by name
+    placed   (pool offset, count) of the items starting at each location
+             code (0 nowhere, 1 inventory, 2 + room index); the pool
+             holds their item indexes
+    inames   item indexes sorted by item name
+    aliases  (alias, item index) pairs sorted by alias, every item name
+             and alias normalized as Game does, for parsing commands
+
+Each distinct string is stored once, so rooms that share a description
+share one string object once loaded too.
+
+    python -m OOAdventure.WorldFile OOAdventure/worlds/tower.json
+"""
+import argparse
+import hashlib
+import importlib
+import inspect
+import json
+import mmap
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+from . import PickStrategy, UseStrategy
+from .AutoSaver import atomic_write_bytes
+from .Item import Item
+from .PickStrategy import PickStrategyBase
+from .Room import Room
+from .UseStrategy import UseStrategyBase
+
+MAGIC = b"WQW1"
+VERSION = 3
+NONE = 0xFFFFFFFF
+
+_HEADER = struct.Struct("<4s14I")
+_ROOM = struct.Struct("<11I")
+_ITEM = struct.Struct("<5I")
+
+# Tags of room state values in the pool.
+_NULL, _FALSE, _TRUE, _INT, _STR = range(5)
+
+_TOP_KEYS = {"start", "rooms", "items"}
+_ROOM_KEYS = {"desc", "clue", "exits", "gated", "state", "use", "pick"}
+_ITEM_KEYS = {"at", "used_in", "aliases"}
+
+
+class WorldError(ValueError):
+    """A world that cannot be compiled; `problems` lists every issue found."""
+
+    def __init__(self, problems: List[str], source: str = "world") -> None:
+        self.problems = problems
+        super().__init__(f"{source}: " + "; ".join(problems))
+
+
+# ----- strategies -----
+def strategy_class(name: str, base: type) -> type:
+    """The strategy class a world file names ("LibraryUse", "pkg.mod:Cls")."""
+    if ":" in name:
+        module, _, attr = name.partition(":")
+        cls = getattr(importlib.import_module(module), attr)
+    else:
+        package = UseStrategy if base is UseStrategyBase else PickStrategy
+        cls = getattr(package, name)
+    if not (isinstance(cls, type) and issubclass(cls, base)):
+        raise TypeError(f"{name} is not a {base.__name__}")
+    return cls
+
+
+def _strategy_ref(value: object) -> Tuple[str, dict]:
+    if isinstance(value, str):
+        return value, {}
+    if isinstance(value, dict) and isinstance(value.get("strategy"), str):
+        args = value.get("args", {})
+        if isinstance(args, dict):
+            return value["strategy"], args
+    raise TypeError("expected a strategy name or {\"strategy\": name, \"args\": {...}}")
+
+
+def _gated_into(rooms: dict) -> Dict[str, List[Tuple[str, str]]]:
+    """(room, direction) of every gated exit, by the room it leads to."""
+    into: Dict[str, List[Tuple[str, str]]] = {}
+    for name, room in rooms.items():
+        gated = room.get("gated") if isinstance(room, dict) else None
+        if isinstance(gated, dict):
+            for direction, target in gated.items():
+                if isinstance(target, str):
+                    into.setdefault(target, []).append((name, direction))
+    return into
+
+
+def _strategy_args(cls: type, args: dict, name: str, rooms: dict,
+                   into: Dict[str, List[Tuple[str, str]]]) -> dict:
+    """`args` for a strategy of room `name`, with what the world says
+    filled in for the ones it leaves out (see the module docstring)."""
+    params = inspect.signature(cls).parameters
+    found = {}
+    if "room" in params:
+        found["room"] = name
+    gated = rooms[name].get("gated", {})
+    if "to" in params and isinstance(gated, dict) and len(gated) == 1:
+        (found["direction"], found["to"]), = gated.items()
+    elif "approach" in params and len(into.get(name, ())) == 1:
+        (found["approach"], found["direction"]), = into[name]
+    found.update(args)
+    return found
+
+
+def _strategy_text(name: str, args: dict) -> str:
+    # The string stored in the image: a bare name, or canonical JSON when
+    # the strategy takes arguments (as _strategy_args completed them).
+    if not args:
+        return name
+    return json.dumps({"strategy": name, "args": args}, sort_keys=True,
+                      separators=(",", ":"))
+
+
+def normalize(s: str) -> str:
+    """An item name or alias as it is looked up (same as Game._normalize)."""
+    return s.strip().lower().strip('"').strip("'")
+
+
+# ----- checking -----
+def validate(world: object) -> List[str]:
+    """Every problem with a world definition (an empty list if none)."""
+    if not isinstance(world, dict):
+        return ["a world must be a JSON object"]
+    problems = [f"unknown key {key!r}" for key in world if key not in _TOP_KEYS]
+    rooms, items = world.get("rooms"), world.get("items", {})
+    if not isinstance(rooms, dict) or not rooms:
+        return problems + ["'rooms' must be a non-empty object"]
+    if not isinstance(items, dict):
+        return problems + ["'items' must be an object"]
+    start = world.get("start", "Entrance")
+    if start not in rooms:
+        problems.append(f"start room {start!r} does not exist")
+    into = _gated_into(rooms)
+
+    for name, room in rooms.items():
+        where = f"room {name!r}"
+        if not isinstance(room, dict):
+            problems.append(f"{where} must be an object")
+            continue
+        problems += [f"{where}: unknown key {key!r}"
+                     for key in room if key not in _ROOM_KEYS]
+        if not isinstance(room.get("desc"), str):
+            problems.append(f"{where}: 'desc' must be a string")
+        if not isinstance(room.get("clue", ""), str):
+            problems.append(f"{where}: 'clue' must be a string")
+        for field in ("exits", "gated"):
+            exits = room.get(field, {})
+            if not isinstance(exits, dict):
+                problems.append(f"{where}: '{field}' must be an object")
+                continue
+            for direction, target in exits.items():
+                if target not in rooms:
+                    problems.append(f"{where}: {field} {direction} leads to "
+                                    f"unknown room {target!r}")
+        exits, gated = room.get("exits", {}), room.get("gated", {})
+        both = (set(exits) & set(gated)
+                if isinstance(exits, dict) and isinstance(gated, dict) else ())
+        if both:
+            problems.append(f"{where}: {', '.join(sorted(both))} is both an "
+                            "exit and a gated exit")
+        state = room.get("state", {})
+        if not isinstance(state, dict):
+            problems.append(f"{where}: 'state' must be an object")
+        else:
+            for key, value in state.items():
+                if not (value is None or isinstance(value, (bool, str)) or
+                        isinstance(value, int) and -2**31 <= value < 2**31):
+                    problems.append(f"{where}: state {key!r} must be null, a "
+                                    "boolean, a 32-bit integer or a string")
+        for field, base in (("use", UseStrategyBase), ("pick", PickStrategyBase)):
+            if field not in room:
+                continue
+            try:
+                strategy, args = _strategy_ref(room[field])
+                cls = strategy_class(strategy, base)
+                bound = inspect.signature(cls).bind(
+                    **_strategy_args(cls, args, name, rooms, into))
+                bound.apply_defaults()
+                cls(**bound.arguments)
+            except Exception as e:
+                problems.append(f"{where}: bad {field} strategy: {e}")
+                continue
+            for kind, known, names in (("room", rooms, cls.ROOM_ARGS),
+                                       ("item", items, cls.ITEM_ARGS)):
+                for arg in names:
+                    value = bound.arguments.get(arg)
+                    if value is not None and (not isinstance(value, str)
+                                              or value not in known):
+                        problems.append(f"{where}: {field} strategy argument "
+                                        f"{arg!r} names unknown {kind} {value!r}")
+
+    owners: Dict[str, str] = {}
+    for name, item in items.items():
+        where = f"item {name!r}"
+        if not isinstance(item, dict):
+            problems.append(f"{where} must be an object")
+            continue
+        problems += [f"{where}: unknown key {key!r}"
+                     for key in item if key not in _ITEM_KEYS]
+        at = item.get("at")
+        if at is not None and at != "inventory" and at not in rooms:
+            problems.append(f"{where} is in unknown room {at!r}")
+        used_in = item.get("used_in")
+        if used_in is not None and not isinstance(used_in, str):
+            problems.append(f"{where}: 'used_in' must be a string or null")
+        aliases = item.get("aliases", [])
+        if not isinstance(aliases, list) or not all(isinstance(a, str) for a in aliases):
+            problems.append(f"{where}: 'aliases' must be a list of strings")
+            aliases = []
+        for alias in [name] + aliases:
+            key = normalize(alias)
+            other = owners.setdefault(key, name)
+            if other != name:
+                problems.append(f"{where}: alias {alias!r} is already "
+                                f"taken by item {other!r}")
+    return problems
+
+
+# ----- writing -----
+class _Strings:
+    def __init__(self) -> None:
+        self.ids: Dict[str, int] = {}
+        self.offsets = array("I", [0])
+        self.blob = bytearray()
+
+    def __call__(self, s: Optional[str]) -> int:
+        if s is None:
+            return NONE
+        sid = self.ids.get(s)
+        if sid is None:
+            sid = self.ids[s] = len(self.offsets) - 1
+            self.blob += s.encode("utf-8")
+            self.offsets.append(len(self.blob))
+        return sid
+
+
+def _le(numbers: array) -> bytes:
+    if sys.byteorder != "little":
+        numbers = array(numbers.typecode, numbers)
+        numbers.byteswap()
+    return numbers.tobytes()
+
+
+def compile_world(world: dict, source: str = "world") -> bytes:
+    """Check `world` (a parsed world file) and pack it into an image."""
+    problems = validate(world)
+    if problems:
+        raise WorldError(problems, source)
+    rooms, items = world["rooms"], world.get("items", {})
+    index = {name: i for i, name in enumerate(rooms)}
+    into = _gated_into(rooms)
+    text = _Strings()
+    pool = array("I")
+    room_rows = array("I")
+    for name, room in rooms.items():
+        row = [text(name), text(room["desc"]), text(room.get("clue"))]
+        for field, base in (("use", UseStrategyBase), ("pick", PickStrategyBase)):
+            if field not in room:
+                row.append(NONE)
+                continue
+            strategy, args = _strategy_ref(room[field])
+            cls = strategy_class(strategy, base)
+            args = _strategy_args(cls, args, name, rooms, into)
+            row.append(text(_strategy_text(strategy, args)))
+        for field in ("exits", "gated"):
+            exits = room.get(field, {})
+            row += [len(pool), len(exits)]
+            for direction, target in exits.items():
+                pool += array("I", [text(direction), index[target]])
+        state = room.get("state", {})
+        row += [len(pool), len(state)]
+        for key, value in state.items():
+            if value is None:
+                entry = [_NULL, 0]
+            elif isinstance(value, bool):
+                entry = [_TRUE if value else _FALSE, 0]
+            elif isinstance(value, int):
+                entry = [_INT, value & NONE]
+            else:
+                entry = [_STR, text(value)]
+            pool += array("I", [text(key)] + entry)
+        room_rows += array("I", row)
+
+    item_rows = array("I")
+    placed: List[List[int]] = [[] for _ in range(len(rooms) + 2)]
+    aliases: Dict[str, int] = {}
+    for i, (name, item) in enumerate(items.items()):
+        at = item.get("at")
+        location = 0 if at is None else 1 if at == "inventory" else 2 + index[at]
+        placed[location].append(i)
+        names = item.get("aliases", [])
+        item_rows += array("I", [text(name), location, text(item.get("used_in")),
+                                 len(pool), len(names)])
+        pool += array("I", [text(a) for a in names])
+        for alias in [name] + names:
+            aliases.setdefault(normalize(alias), i)
+    placed_rows = array("I")
+    for here in placed:
+        placed_rows += array("I", [len(pool), len(here)])
+        pool += array("I", here)
+    room_names = array("I", sorted(range(len(rooms)), key=list(rooms).__getitem__))
+    item_names = array("I", sorted(range(len(items)), key=list(items).__getitem__))
+    alias_rows = array("I")
+    for alias in sorted(aliases):
+        alias_rows += array("I", [text(alias), aliases[alias]])
+
+    sections = [_le(text.offsets) + bytes(text.blob), _le(room_rows),
+                _le(item_rows), _le(pool), _le(room_names), _le(placed_rows),
+                _le(item_names), _le(alias_rows)]
+    offsets, at = [], _HEADER.size
+    for section in sections:
+        at += -at % 4           # keep every section 4-byte aligned
+        offsets.append(at)
+        at += len(section)
+    image = bytearray(_HEADER.pack(MAGIC, VERSION, len(rooms), len(items),
+                                   index[world.get("start", "Entrance")],
+                                   len(text.offsets) - 1, *offsets, len(aliases)))
+    for offset, section in zip(offsets, sections):
+        image += bytes(offset - len(image)) + section
+    return bytes(image)
+
+
+# ----- reading -----
+class WorldImage:
+    """A compiled world, read in place from bytes (or an mmap).
+
+    Nothing is decoded up front. room(i)/item(i) decode one record from
+    its row; rooms()/items() decode the string table and pool once and
+    build every record.
+    """
+
+    # Strings kept decoded by string(); the cache starts over when full, so
+    # a mapped image never holds more than this many.
+    TEXT_CACHE = 4096
+
+    def __init__(self, data) -> None:
+        (magic, version, self.room_count, self.item_count, self._start,
+         self._n_strings, self._strings_at, self._rooms_at, self._items_at,
+         self._pool_at, self._names_at, self._placed_at, self._item_names_at,
+         self._aliases_at, self.alias_count) = _HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("not a compiled world (or an older format)")
+        self._data = data
+        self._blob_at = self._strings_at + 4 * (self._n_strings + 1)
+        self._text: Dict[int, str] = {}
+        self._strategies: Dict[Tuple[int, type], object] = {}
+        self._lookups = None
+
+    def _u32(self, at: int, count: int) -> array:
+        numbers = array("I")
+        numbers.frombytes(self._data[at:at + 4 * count])
+        if sys.byteorder != "little":
+            numbers.byteswap()
+        return numbers
+
+    def _pool(self, at: int, count: int) -> array:
+        return self._u32(self._pool_at + 4 * at, count)
+
+    def string(self, sid: int) -> Optional[str]:
+        if sid == NONE:
+            return None
+        s = self._text.get(sid)
+        if s is None:
+            start, end = struct.unpack_from("<2I", self._data, self._strings_at + 4 * sid)
+            if len(self._text) >= self.TEXT_CACHE:
+                self._text.clear()
+            s = self._text[sid] = str(self._data[self._blob_at + start:
+                                                 self._blob_at + end], "utf-8")
+        return s
+
+    def _bytes(self, sid: int) -> bytes:
+        # A string's UTF-8 bytes sort like the string itself, so the
+        # binary searches below compare these and never decode.
+        start, end = struct.unpack_from("<2I", self._data, self._strings_at + 4 * sid)
+        return self._data[self._blob_at + start:self._blob_at + end]
+
+    def _strings(self):
+        """string() for every id at once, as a lookup function."""
+        offsets = self._u32(self._strings_at, self._n_strings + 1)
+        blob = bytes(self._data[self._blob_at:self._blob_at + offsets[-1]])
+        strings = {sid: str(blob[a:b], "utf-8")
+                   for sid, (a, b) in enumerate(zip(offsets, offsets[1:]))}
+        strings[NONE] = None
+        return strings.__getitem__
+
+    def _strategy(self, sid: int, base: type, text):
+        if sid == NONE:
+            return None
+        # One instance per distinct strategy, shared by every room using it.
+        strategy = self._strategies.get((sid, base))
+        if strategy is None:
+            ref = text(sid)
+            name, args = _strategy_ref(json.loads(ref) if ref.startswith("{") else ref)
+            strategy = self._strategies[sid, base] = strategy_class(name, base)(**args)
+        return strategy
+
+    @property
+    def start(self) -> str:
+        return self.room_name(self._start)
+
+    def room_name(self, index: int) -> str:
+        return self.string(struct.unpack_from(
+            "<I", self._data, self._rooms_at + _ROOM.size * index)[0])
+
+    def item_name(self, index: int) -> str:
+        return self.string(struct.unpack_from(
+            "<I", self._data, self._items_at + _ITEM.size * index)[0])
+
+    def _room_key(self, index: int) -> bytes:
+        return self._bytes(struct.unpack_from(
+            "<I", self._data, self._rooms_at + _ROOM.size * index)[0])
+
+    def _item_key(self, index: int) -> bytes:
+        return self._bytes(struct.unpack_from(
+            "<I", self._data, self._items_at + _ITEM.size * index)[0])
+
+    def _lower_bound(self, at: int, count: int, stride: int, key_of, key: bytes) -> int:
+        """First position in a sorted section whose key is >= `key`."""
+        data, unpack = self._data, struct.unpack_from
+        lo, hi = 0, count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if key_of(unpack("<I", data, at + 4 * stride * mid)[0]) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _find(self, at: int, count: int, key_of, key: bytes) -> Optional[int]:
+        i = self._lower_bound(at, count, 1, key_of, key)
+        if i < count:
+            found = struct.unpack_from("<I", self._data, at + 4 * i)[0]
+            if key_of(found) == key:
+                return found
+        return None
+
+    def room_index(self, name: str) -> Optional[int]:
+        """Index of the room called `name` (a binary search), or None."""
+        return self._find(self._names_at, self.room_count, self._room_key, name.encode())
+
+    def item_index(self, name: str) -> Optional[int]:
+        return self._find(self._item_names_at, self.item_count, self._item_key, name.encode())
+
+    def alias(self, key: str) -> Optional[int]:
+        """Index of the item a normalized name or alias refers to, or None."""
+        key = key.encode()
+        i = self._lower_bound(self._aliases_at, self.alias_count, 2, self._bytes, key)
+        if i < self.alias_count:
+            sid, item = struct.unpack_from("<2I", self._data, self._aliases_at + 8 * i)
+            if self._bytes(sid) == key:
+                return item
+        return None
+
+    def has_alias_prefix(self, prefix: str) -> bool:
+        """True if some alias starts with `prefix`."""
+        prefix = prefix.encode()
+        i = self._lower_bound(self._aliases_at, self.alias_count, 2, self._bytes, prefix)
+        if i < self.alias_count:
+            sid = struct.unpack_from("<I", self._data, self._aliases_at + 8 * i)[0]
+            return self._bytes(sid).startswith(prefix)
+        return False
+
+    def aliases(self):
+        """Every (normalized alias, item index), sorted by alias."""
+        rows = self._u32(self._aliases_at, 2 * self.alias_count)
+        return [(self.string(rows[i]), rows[i + 1]) for i in range(0, len(rows), 2)]
+
+    def placed(self, location: int) -> array:
+        """Indexes of the items that start at a location code (see above)."""
+        at, count = struct.unpack_from("<2I", self._data, self._placed_at + 8 * location)
+        return self._pool(at, count)
+
+    def _room(self, row, pool, text, name) -> Room:
+        # row: the room's 11 numbers; pool(at, count), text(sid) and
+        # name(room index) look up what they point at.
+        pairs = pool(row[5], 2 * row[6])
+        triples = pool(row[9], 3 * row[10])
+        state = {}
+        for i in range(0, len(triples), 3):
+            tag, value = triples[i + 1], triples[i + 2]
+            if tag == _INT:
+                value = value - (1 << 32) if value >> 31 else value
+            elif tag == _STR:
+                value = text(value)
+            else:
+                value = None if tag == _NULL else tag == _TRUE
+            state[text(triples[i])] = value
+        return Room(text(row[0]), text(row[1]), text(row[2]),
+                    {text(pairs[i]): name(pairs[i + 1]) for i in range(0, len(pairs), 2)},
+                    state, self._strategy(row[3], UseStrategyBase, text),
+                    self._strategy(row[4], PickStrategyBase, text))
+
+    def _item(self, row, pool, text, name) -> Item:
+        location = row[1]
+        at = (None if location == 0 else "inventory" if location == 1
+              else name(location - 2))
+        return Item(text(row[0]), at, text(row[2]),
+                    [text(a) for a in pool(row[3], row[4])])
+
+    def room(self, index: int) -> Room:
+        return self._room(_ROOM.unpack_from(self._data, self._rooms_at + _ROOM.size * index),
+                          self._pool, self.string, self.room_name)
+
+    def item(self, index: int) -> Item:
+        return self._item(_ITEM.unpack_from(self._data, self._items_at + _ITEM.size * index),
+                          self._pool, self.string, self.room_name)
+
+    def gated(self, index: int) -> Dict[str, str]:
+        """Exits of room `index` that start locked (opened by strategies)."""
+        row = _ROOM.unpack_from(self._data, self._rooms_at + _ROOM.size * index)
+        pairs = self._pool(row[7], 2 * row[8])
+        return {self.string(pairs[i]): self.room_name(pairs[i + 1])
+                for i in range(0, len(pairs), 2)}
+
+    def _decoded(self):
+        """(pool, text, name) lookups over the whole image, decoded once."""
+        if self._lookups is None:
+            text = self._strings()
+            rows = self._u32(self._rooms_at, 11 * self.room_count)
+            names = [text(rows[i]) for i in range(0, len(rows), 11)]
+            pool = self._u32(self._pool_at, (self._names_at - self._pool_at) // 4)
+            self._lookups = (lambda at, count: pool[at:at + count], text,
+                             names.__getitem__)
+        return self._lookups
+
+    def rooms(self) -> Dict[str, Room]:
+        lookups = self._decoded()
+        rows = self._u32(self._rooms_at, 11 * self.room_count)
+        return {rm.name: rm for rm in (self._room(rows[i:i + 11], *lookups)
+                                       for i in range(0, len(rows), 11))}
+
+    def items(self) -> Dict[str, Item]:
+        lookups = self._decoded()
+        rows = self._u32(self._items_at, 5 * self.item_count)
+        return {it.name: it for it in (self._item(rows[i:i + 5], *lookups)
+                                       for i in range(0, len(rows), 5))}
+
+
+def cache_path(path: Union[str, Path]) -> Path:
+    """Where load() keeps the image of world file `path` (as it is now)."""
+    path = Path(path)
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return path.parent / "__pycache__" / f"{path.stem}.{digest.hexdigest()[:24]}.wqw{VERSION}"
+
+
+def _open_image(path: Path, mapped: bool) -> WorldImage:
+    if not mapped:
+        return WorldImage(path.read_bytes())
+    with open(path, "rb") as f:
+        return WorldImage(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+
+def load(path: Union[str, Path], mapped: bool = False) -> WorldImage:
+    """The image of a world file, compiled only if its text has changed.
+
+    mapped=True maps the cached image into memory instead of reading it,
+    so only the pages actually used are ever loaded.
+    """
+    cached = cache_path(path)
+    try:
+        return _open_image(cached, mapped)
+    except (OSError, ValueError):
+        pass
+    image = compile_world(json.loads(Path(path).read_bytes()), source=str(path))
+    try:
+        cached.parent.mkdir(exist_ok=True)
+        atomic_write_bytes(str(cached), image)
+    except OSError:
+        return WorldImage(image)    # read-only install: compile again next start
+    return _open_image(cached, mapped) if mapped else WorldImage(image)
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Check and compile world files")
+    ap.add_argument("worlds", nargs="+")
+    args = ap.parse_args(argv)
+    status = 0
+    for path in args.worlds:
+        try:
+            world = load(path)
+        except (OSError, ValueError) as e:
+            print(f"{path}: {e}" if not isinstance(e, WorldError) else
+                  "\n  ".join([f"{path}:"] + e.problems))
+            status = 1
+            continue
+        print(f"{path}: {world.room_count} rooms, {world.item_count} items "
+              f"-> {cache_path(path)}")
+    return status
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,216 @@
+"""
+Seeded random worlds of any size, for measuring how the game scales.
+
+    world, walkthrough = generate(rooms=1000, items=300, puzzles=10, seed=1)
+
+`world` is a world file object (see WorldFile). Its rooms form a random
+tree joined by compass exits, split into `puzzles` regions entered one
+after the other. Each region but the last ends in a gate room whose way
+on is opened with the tower's puzzles: LibraryUse and AltarUse want one
+item, ChamberUse a fire and an ice item. The last room is the Vault,
+opened as in the tower with the Teleportation Stone while holding the
+Vault Key (the prize of the last chamber, if there is one). Everything a
+gate needs lies before it, so every world can be won, and `walkthrough`
+is a list of commands that wins it. Up to `items` items in all: the rest
+are trinkets scattered anywhere. The same arguments give the same world.
+
+    python -m OOAdventure.WorldGenerator --rooms 10000 --items 3000 --puzzles 50 -o big.json
+"""
+import argparse
+import json
+import random
+from typing import Dict, List, Optional, Tuple
+
+_BACK = {"north": "south", "south": "north", "east": "west", "west": "east"}
+_GATES = ("LibraryUse", "AltarUse", "ChamberUse")
+
+_DESCS = (
+    "A narrow stone passage. Water drips somewhere in the dark.",
+    "Faded tapestries hang from the walls of this draughty hall.",
+    "A spiral stair winds past arrow slits full of grey sky.",
+    "Broken furniture is piled against the walls of a storeroom.",
+    "Moss covers the flagstones of a forgotten courtyard.",
+)
+_GATE_ROOMS = {
+    "LibraryUse": ("Dusty books line the walls. A faint glow comes from a pedestal.",
+                   "Something round and bright belongs on the pedestal."),
+    "AltarUse": ("An altar with runes that pulse softly. A deep chasm blocks the way on.",
+                 "You need an enchanted rope to cross the chasm below."),
+    "ChamberUse": ("A chamber with a frozen pool.",
+                   "Perhaps fire could melt the ice, and cold could make it safe again."),
+}
+
+
+def _region_sizes(rooms: int, puzzles: int) -> List[int]:
+    base, extra = divmod(rooms, puzzles)
+    return [base + (r < extra) for r in range(puzzles)]
+
+
+def _layout(rooms: int, puzzles: int, rng: random.Random):
+    """Grow the room tree region by region.
+
+    Returns each room's parent and the direction from its parent (None
+    for room 0), the first room of every region, and the gate rooms.
+    """
+    parent: List[Optional[int]] = [None]
+    step: List[Optional[str]] = [None]
+    free = [list(_BACK)]                 # directions each room has left
+    firsts, gates = [0], []
+
+    def add_room(frontier: List[int]) -> int:
+        # A child of a random room of `frontier` that has a direction free;
+        # rooms found full are dropped from it for good.
+        while True:
+            k = rng.randrange(len(frontier))
+            src = frontier[k]
+            if free[src]:
+                break
+            frontier[k] = frontier[-1]
+            frontier.pop()
+        d = free[src].pop(rng.randrange(len(free[src])))
+        parent.append(src)
+        step.append(d)
+        free.append([e for e in _BACK if e != _BACK[d]])
+        return len(parent) - 1
+
+    frontier = [0]                       # rooms of this region that may grow
+    for r, size in enumerate(_region_sizes(rooms, puzzles)):
+        if r:
+            # The region starts behind a gate out of the one before.
+            firsts.append(add_room(frontier))
+            gates.append(parent[-1])
+            frontier = [firsts[-1]]
+        while len(parent) < firsts[-1] + size:
+            frontier.append(add_room(frontier))
+    return parent, step, firsts, gates
+
+
+def generate(rooms: int, items: int = 0, puzzles: int = 1,
+             seed: int = 0) -> Tuple[dict, List[str]]:
+    """A winnable world and a walkthrough for it (see the module docstring)."""
+    if puzzles < 1 or rooms < puzzles:
+        raise ValueError("need at least one puzzle and one room per puzzle")
+    rng = random.Random(seed)
+    parent, step, firsts, gates = _layout(rooms, puzzles, rng)
+    names = [f"Room {i}" for i in range(rooms - 1)] + ["Vault"]
+    world_rooms: Dict[str, dict] = {
+        name: {"desc": rng.choice(_DESCS), "exits": {}} for name in names}
+    gated = set(firsts)
+    for i in range(1, rooms):
+        p, d = names[parent[i]], step[i]
+        # A region's first room is only reached once the gate opens.
+        world_rooms[p].setdefault("gated" if i in gated else "exits", {})[d] = names[i]
+        world_rooms[names[i]]["exits"][_BACK[d]] = p
+
+    world_items: Dict[str, dict] = {}
+    needs: List[List[str]] = []          # items used at each gate, in order
+
+    def add_item(name: str, alias: str, at: Optional[str], used_in: str) -> str:
+        world_items[name] = {"at": at, "used_in": used_in, "aliases": [alias]}
+        return name
+
+    def before(gate: int) -> str:
+        return names[rng.randrange(firsts[gate + 1])]
+
+    kinds = [rng.choice(_GATES) for _ in gates]
+    last_chamber = max((g for g, k in enumerate(kinds) if k == "ChamberUse"), default=None)
+    for g, (room, kind) in enumerate(zip(gates, kinds)):
+        name = names[room]
+        (d, to), = world_rooms[name]["gated"].items()
+        args = {"room": name, "direction": d, "to": to}
+        if kind == "ChamberUse":
+            melt = add_item(f"Fire Scroll {g}", f"fire{g}", before(g), name)
+            freeze = add_item(f"Ice Wand {g}", f"wand{g}", before(g), name)
+            args.update(melt=melt, freeze=freeze,
+                        prize="Vault Key" if g == last_chamber else None)
+            world_rooms[name]["state"] = {"ice_state": "frozen"}
+            needs.append([melt, freeze])
+        else:
+            item = (f"Crystal Orb {g}", f"orb{g}") if kind == "LibraryUse" else (
+                f"Enchanted Rope {g}", f"rope{g}")
+            args["item"] = add_item(*item, before(g), name)
+            needs.append([args["item"]])
+        desc, clue = _GATE_ROOMS[kind]
+        world_rooms[name].update(desc=desc, clue=clue,
+                                 use={"strategy": kind, "args": args})
+
+    vault = world_rooms["Vault"]
+    vault.update(desc="A vault door bars your way. The Gem of Eternity sits inside.",
+                 clue="You need the teleportation stone (and a key) to open it.",
+                 state={"open": False},
+                 use={"strategy": "VaultUse", "args": {"approach": None}})
+    add_item("Teleportation Stone", "stone", names[rng.randrange(rooms)], "Vault")
+    add_item("Vault Key", "key",
+             None if last_chamber is not None else names[rng.randrange(rooms)], "Vault")
+    for i in range(max(0, items - len(world_items))):
+        add_item(f"Trinket {i}", f"trinket{i}", names[rng.randrange(rooms)], "")
+
+    world = {"start": names[0], "rooms": world_rooms, "items": world_items}
+    return world, _walkthrough(world, names, parent, step, gates, needs)
+
+
+def _walkthrough(world: dict, names: List[str], parent, step, gates, needs) -> List[str]:
+    index = {name: i for i, name in enumerate(names)}
+    depth = [0] * len(names)
+    for i in range(1, len(names)):
+        depth[i] = depth[parent[i]] + 1
+    alias = {name: item["aliases"][0] for name, item in world["items"].items()}
+    commands: List[str] = []
+    here = 0
+
+    def go(to: int) -> None:
+        nonlocal here
+        # Up from here and from `to` to where they meet, through the tree.
+        up, down, a, b = [], [], here, to
+        while a != b:
+            if depth[a] >= depth[b]:
+                up.append(_BACK[step[a]])
+                a = parent[a]
+            else:
+                down.append(step[b])
+                b = parent[b]
+        commands.extend(f"go {d}" for d in up + down[::-1])
+        here = to
+
+    def fetch(item: str) -> None:
+        at = world["items"][item]["at"]
+        if at is not None:
+            go(index[at])
+            commands.append(f"pick {alias[item]}")
+
+    for room, used in zip(gates, needs):
+        for item in used:
+            fetch(item)
+        go(room)
+        for item in used:
+            commands.append(f"use {alias[item]}")
+            if item.startswith("Fire Scroll") and world["rooms"][names[room]]["use"]["args"]["prize"]:
+                commands.append("pick key")
+    fetch("Teleportation Stone")
+    fetch("Vault Key")
+    go(len(names) - 1)
+    commands.append("use stone")
+    return commands
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Write a random winnable world file")
+    ap.add_argument("--rooms", type=int, default=100)
+    ap.add_argument("--items", type=int, default=0)
+    ap.add_argument("--puzzles", type=int, default=3)
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("-o", "--out", required=True, help="world file to write")
+    ap.add_argument("--walkthrough", help="also write the winning commands here")
+    args = ap.parse_args()
+    world, commands = generate(args.rooms, args.items, args.puzzles, args.seed)
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(world, f, indent=1)
+    if args.walkthrough:
+        with open(args.walkthrough, "w", encoding="utf-8") as f:
+            f.write("\n".join(commands) + "\n")
+    print(f"{args.out}: {len(world['rooms'])} rooms, {len(world['items'])} items, "
+          f"won in {len(commands)} commands")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+from functools import cached_property
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional
+
+from .FuzzyIndex import FuzzyIndex
+from .Item import Item
+from .PagedWorld import PagedWorld
+from .PhraseParser import PhraseParser
+from .Room import Room
+
+
+class WorldTemplate:
+    """A Game class's starting world, compiled once per process.
+
+    Holds the Room and Item records (their RoomDef/ItemDef flyweights carry
+    descriptions, clues, aliases and strategies), the item alias index,
+    the starting items-by-location index, the "did you mean" indexes for
+    verbs and item names and the compiled PhraseParser. Every Game of that
+    class starts out pointing at these read-only mappings and copies a
+    record only when it changes it (see Game.clone), so the static text
+    exists once no matter how many sessions are live. Nothing here is ever
+    changed after it is built.
+    """
+
+    _cache: Dict[type, "WorldTemplate"] = {}
+
+    def __init__(self, rooms: Dict[str, Room], items: Dict[str, Item],
+                 item_alias_index: Dict[str, str],
+                 verbs: Mapping[str, str] = MappingProxyType({}),
+                 directions: Mapping[str, str] = MappingProxyType({}),
+                 start: str = "Entrance",
+                 paged: Optional[PagedWorld] = None) -> None:
+        self.start = start
+        self.paged = paged
+        self.item_alias_index = item_alias_index
+        self.verb_index = FuzzyIndex(verbs)
+        if paged is not None:
+            # rooms/items/item_alias_index are the PagedWorld's lazy
+            # mappings; so are the indexes below.
+            self.rooms: Mapping[str, Room] = rooms
+            self.items: Mapping[str, Item] = items
+            self.item_rank: Mapping[str, int] = paged.item_rank
+            self.items_at: Mapping[Optional[str], Mapping[str, None]] = paged.items_at
+            self.parser = PhraseParser(verbs, directions, item_alias_index,
+                                       item_trie=paged.alias_trie)
+            return
+        self.rooms = MappingProxyType(rooms)
+        self.items = MappingProxyType(items)
+        # Position of each item in the world, for listing items in a
+        # stable order, and location -> ordered set (dict) of item names.
+        self.item_rank = {name: i for i, name in enumerate(items)}
+        items_at: Dict[Optional[str], Dict[str, None]] = {}
+        for name, it in items.items():
+            items_at.setdefault(it.location, {})[name] = None
+        self.items_at = MappingProxyType({
+            loc: MappingProxyType(names) for loc, names in items_at.items()})
+        self.parser = PhraseParser(verbs, directions, item_alias_index)
+
+    @cached_property
+    def item_index(self) -> FuzzyIndex:
+        # Built on the first misspelt item name rather than at startup: for
+        # a big world it costs far more than everything else here. Paged
+        # worlds offer no item suggestions (it would read every alias).
+        return FuzzyIndex(() if self.paged else self.item_alias_index)
+
+    @classmethod
+    def build(cls, game_cls: type) -> "WorldTemplate":
+        """Run game_cls's world builders on a bare instance.
+
+        A PAGED class instead gets its WORLD file mapped (see PagedWorld).
+        """
+        if game_cls.PAGED:
+            paged = PagedWorld(game_cls.WORLD, game_cls.HOT_ROOMS)
+            return cls(paged.rooms, paged.items, paged.aliases,
+                       game_cls.VERB_ALIASES, game_cls.DIR_ALIASES,
+                       paged.start, paged)
+        builder = game_cls.__new__(game_cls)
+        builder.rooms = {}
+        builder.items = {}
+        builder.start = "Entrance"
+        builder._build_world()
+        builder._build_item_alias_index()
+        # Freeze room exits/state so a change that bypasses copy-on-write
+        # fails loudly instead of leaking into every session.
+        for rm in builder.rooms.values():
+            rm.exits = MappingProxyType(rm.exits)
+            rm.state = MappingProxyType(rm.state)
+        return cls(builder.rooms, builder.items, builder.item_alias_index,
+                   game_cls.VERB_ALIASES, game_cls.DIR_ALIASES, builder.start)
+
+    @classmethod
+    def of(cls, game_cls: type) -> "WorldTemplate":
+        template = cls._cache.get(game_cls)
+        if template is None:
+            template = cls._cache[game_cls] = cls.build(game_cls)
+        return template
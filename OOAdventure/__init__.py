@@ -2,9 +2,13 @@
 
 # Expose main classes at the package level
 from .Game import Game
-from .Room import Room
+from .Room import Room, RoomDef
 from .Player import Player
-from .Item import Item
+from .Item import Item, ItemDef
+from .CommandResult import CommandResult, Event, EventKind
+from .Simulation import run_commands
+from .Journal import Journal
+from .SaveStore import SqliteSaveStore
 
 # You can also expose base strategy classes
 from .UseStrategy import UseStrategyBase
@@ -22,8 +26,16 @@ from .PickStrategy.ChamberPick import ChamberPick
 __all__ = [
     "Game",
     "Room",
+    "RoomDef",
     "Player",
     "Item",
+    "ItemDef",
+    "CommandResult",
+    "Event",
+    "EventKind",
+    "run_commands",
+    "Journal",
+    "SqliteSaveStore",
     "UseStrategyBase",
     "PickStrategyBase",
     "LibraryUse",
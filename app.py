@@ -1,64 +1,116 @@
 #!/usr/bin/env python3
-import io
 import json
+import os
 import tempfile
-from typing import List, Tuple
+import threading
+import weakref
+from typing import Optional, Tuple
 
 import gradio as gr
 from OOAdventure.Game import Game  # your OO engine
+from OOAdventure.SessionPool import SessionPool
+from OOAdventure.Transcript import Transcript
+
+# Queue settings. Commands take microseconds, so a few workers keep up with
+# many players; max_size bounds how many requests may wait in line.
+CONCURRENCY = int(os.environ.get("WQ_CONCURRENCY", "8"))
+QUEUE_SIZE = int(os.environ.get("WQ_QUEUE_SIZE", "256"))
+# How many recent chat pairs the browser is sent; the full history stays
+# on the server (see Transcript) and goes into downloads.
+CHAT_WINDOW = int(os.environ.get("WQ_CHAT_WINDOW", "200"))
+# Games kept ready (opening screen included) for new visitors, and how
+# many the background thread may build per second to refill the pool.
+POOL_SIZE = int(os.environ.get("WQ_POOL_SIZE", "64"))
+POOL_REFILL = float(os.environ.get("WQ_POOL_REFILL", "500"))
 
 
 # ----------------------------
 # Helpers
 # ----------------------------
 
+def new_game(data: Optional[dict] = None) -> Game:
+    """A game that keeps its text in CommandResults instead of printing."""
+    g = Game.from_dict(data) if data is not None else Game()
+    g.echo = False
+    return g
+
+
 def run_and_capture(game: Game, cmd: str) -> str:
-    """Run a command and capture printed output."""
-    import sys
-    buf = io.StringIO()
-    old = sys.stdout
-    sys.stdout = buf
-    try:
-        game.process_command(cmd)
-    except SystemExit:
+    """Run a command (or "cmd; cmd; ...") and return its text."""
+    result = game.process_line(cmd)
+    text = result.text
+    if result.won:
         # Keep the app alive; just show a celebratory message.
-        print("🎉 Congratulations! You completed the quest!")
-    finally:
-        sys.stdout = old
-    return buf.getvalue().strip()
+        text += "🎉 Congratulations! You completed the quest!\n"
+    return text.strip()
+
 
+pool = SessionPool(new_game, size=POOL_SIZE, refill_per_sec=POOL_REFILL)
 
-def bootstrap() -> Tuple[List[Tuple[str, str]], Game]:
-    """New game + initial 'look' as a bot message."""
-    g = Game()
-    first = run_and_capture(g, "look")
+
+def new_transcript(pairs=()) -> Transcript:
+    return Transcript(pairs, window=CHAT_WINDOW)
+
+
+def bootstrap() -> Tuple[Transcript, Game]:
+    """New game + initial 'look' as a bot message (both from the pool)."""
+    g, opening = pool.take()
+    first = opening.text.strip()
     # Chatbot expects pairs: (user, bot). For the first screen, bot-only is fine with empty user.
-    chat = [("", f"=== Wizard's Quest — Gradio Edition ===\n{first}")]
+    chat = new_transcript([("", f"=== Wizard's Quest — Gradio Edition ===\n{first}")])
     return chat, g
 
 
-def on_send(cmd: str, chat: List[Tuple[str, str]], game: Game):
-    """Handle a command: append (user, bot) pair."""
+# One lock per live Game, so that two events from the same session (Enter
+# and the Send button together) never run commands on it at once.
+_locks: "weakref.WeakKeyDictionary[Game, threading.Lock]" = weakref.WeakKeyDictionary()
+_locks_guard = threading.Lock()
+
+
+def game_lock(game: Game) -> threading.Lock:
+    with _locks_guard:
+        lock = _locks.get(game)
+        if lock is None:
+            lock = _locks[game] = threading.Lock()
+        return lock
+
+
+def on_send(cmd: str, chat: Transcript, game: Game):
+    """Handle a command: append (user, bot) pair.
+
+    Returns (chat_state, game_state, command box, chatbot), so one event
+    both updates the state and shows it. The transcript is appended to in
+    place and the chatbot only gets its recent window, so a command costs
+    the same at turn 5000 as at turn 5.
+    """
     if game is None:
         chat, game = bootstrap()
 
     cmd = (cmd or "").strip()
     if not cmd:
-        return chat, game, ""  # just clear the box
+        return chat, game, "", chat.window()  # just clear the box
 
-    out = run_and_capture(game, cmd)
-    chat = chat + [(f"> {cmd}", out or "(no output)")]
-    return chat, game, ""  # clear input
+    lock = game_lock(game)
+    if not lock.acquire(blocking=False):
+        # The same command is already running (double submit); drop this one.
+        return gr.update(), gr.update(), gr.update(), gr.update()
+    try:
+        out = run_and_capture(game, cmd)
+        chat.append((f"> {cmd}", out or "(no output)"))
+    finally:
+        lock.release()
+    return chat, game, "", chat.window()  # clear input
 
 
 def on_restart():
-    """Start fresh."""
-    return bootstrap()
+    """Start fresh: (chat_state, game_state, chatbot)."""
+    chat, game = bootstrap()
+    return chat, game, chat.window()
 
 
 # ------- Save / Load (legacy-compatible) -------
 
-def on_download_legacy(chat: List[Tuple[str, str]], game: Game):
+def on_download_legacy(chat: Transcript, game: Game):
     """
     Create a temp JSON save file for older Gradio versions.
     Returns a file path that a File component can serve for download.
@@ -67,13 +119,12 @@ def on_download_legacy(chat: List[Tuple[str, str]], game: Game):
         chat, game = bootstrap()
     payload = {
         "game": game.to_dict(),
-        "chat": chat,
+        "chat": list(chat),
     }
-    data = json.dumps(payload, indent=2).encode("utf-8")
-    tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".json")
-    tmp.write(data)
-    tmp.flush()
-    tmp.close()
+    # Compact JSON straight to the file: no indent, no second copy in memory.
+    with tempfile.NamedTemporaryFile("w", encoding="utf-8", delete=False,
+                                     suffix=".json") as tmp:
+        json.dump(payload, tmp, separators=(",", ":"))
     return tmp.name
 
 
@@ -83,7 +134,7 @@ def on_upload_legacy(upload):
     Supports both 'chat' style and older 'transcript' text.
     """
     if upload is None:
-        return gr.update(), gr.update()
+        return gr.update(), gr.update(), gr.update()
 
     try:
         with open(upload.name, "rb") as f:
@@ -91,7 +142,7 @@ def on_upload_legacy(upload):
         state = json.loads(raw)
 
         # Rebuild game
-        game = Game.from_dict(state["game"])
+        game = new_game(state["game"])
 
         # Rebuild chat
         if "chat" in state and isinstance(state["chat"], list):
@@ -107,11 +158,13 @@ def on_upload_legacy(upload):
 
         # Add a fresh LOOK to anchor the UI
         look = run_and_capture(game, "look")
-        chat = chat + [("", f"(Resumed) {look}")]
-        return chat, game
+        chat = new_transcript(chat)
+        chat.append(("", f"(Resumed) {look}"))
+        return chat, game, chat.window()
 
     except Exception as e:
-        return [("", f"Error loading save: {e}")], None
+        chat = new_transcript([("", f"Error loading save: {e}")])
+        return chat, None, chat.window()
 
 
 # ----------------------------
@@ -122,11 +175,12 @@ with gr.Blocks(title="Wizard's Quest", css="footer {display:none !important;}")
     gr.Markdown("# 🧙 Wizard's Quest — Gradio Edition")
     gr.Markdown(
         "Type commands like **go north**, **pick orb**, **use stone**, **look**, **help**.  \n"
+        "Chain several with **;** — e.g. `n; take orb; use orb; e`.  \n"
         "Use **Download Save**/**Upload Save** to persist progress."
     )
 
     # Per-user state
-    chat_state = gr.State()   # List[Tuple[str,str]]
+    chat_state = gr.State()   # Transcript of (user, bot) pairs
     game_state = gr.State()   # Game
 
     with gr.Row():
@@ -149,41 +203,27 @@ with gr.Blocks(title="Wizard's Quest", css="footer {display:none !important;}")
     # Initialize state on app load
     def _load():
         c, g = bootstrap()
-        return c, g, c
+        return c, g, c.window()
 
     demo.load(_load, inputs=None, outputs=[chat_state, game_state, chat])
 
-    # Send command (button)
-    send.click(
-        on_send,
-        inputs=[cmd, chat_state, game_state],
-        outputs=[chat_state, game_state, cmd],
-    ).then(
-        lambda c: c,  # reflect latest chat_state in UI
-        inputs=[chat_state],
-        outputs=[chat],
-    )
-
-    # Send command (press Enter)
-    cmd.submit(
-        on_send,
-        inputs=[cmd, chat_state, game_state],
-        outputs=[chat_state, game_state, cmd],
-    ).then(
-        lambda c: c,
-        inputs=[chat_state],
-        outputs=[chat],
-    )
+    # Send command (button or Enter). One event updates both the state and
+    # the chat. trigger_mode="once" ignores repeats of a trigger while it is
+    # pending; game_lock drops an Enter that races a click (or vice versa).
+    for trigger, api_name in ((send.click, "send"), (cmd.submit, False)):
+        trigger(
+            on_send,
+            inputs=[cmd, chat_state, game_state],
+            outputs=[chat_state, game_state, cmd, chat],
+            api_name=api_name,
+            trigger_mode="once",
+        )
 
     # Restart
     restart.click(
-        lambda: on_restart(),
+        on_restart,
         inputs=None,
-        outputs=[chat_state, game_state],
-    ).then(
-        lambda c: c,
-        inputs=[chat_state],
-        outputs=[chat],
+        outputs=[chat_state, game_state, chat],
     )
 
     # Download save (legacy-compatible path via File)
@@ -197,13 +237,11 @@ with gr.Blocks(title="Wizard's Quest", css="footer {display:none !important;}")
     upload_file.change(
         on_upload_legacy,
         inputs=[upload_file],
-        outputs=[chat_state, game_state],
-    ).then(
-        lambda c: c,
-        inputs=[chat_state],
-        outputs=[chat],
+        outputs=[chat_state, game_state, chat],
     )
 
+demo.queue(default_concurrency_limit=CONCURRENCY, max_size=QUEUE_SIZE)
+
 
 if __name__ == "__main__":
     demo.launch()
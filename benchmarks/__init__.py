@@ -0,0 +1,4 @@
+# benchmarks/__init__.py
+#
+# Stand-alone performance scripts. Run them from the repo root, e.g.:
+#     python -m benchmarks.bench_output_sink
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Per-command latency (p50/p99) with autosave off and on.
+
+Each command is timed from process_command() to the autosave call
+returning, which is what the request thread pays:
+
+  off             no autosave
+  sync json       json.dump of to_dict() after every command (the old way)
+  sync atomic     the same through temp file + fsync + os.replace
+  behind json     the full save handed to a background AutoSaver
+  behind journal  journal events handed to a background AutoSaver
+
+    python -m benchmarks.bench_autosave --commands 3000
+"""
+import argparse
+import json
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from OOAdventure import Fuzzer
+from OOAdventure.AutoSaver import AutoSaver, atomic_write_text
+from OOAdventure.Game import Game
+from OOAdventure.Journal import Journal
+
+
+def run(commands, save) -> list:
+    game = Game(headless=True)
+    times = []
+    for cmd in commands:
+        t = time.perf_counter()
+        result = game.process_command(cmd)
+        save(game, result)
+        times.append(time.perf_counter() - t)
+    return times
+
+
+def pct(times, p: float) -> float:
+    return statistics.quantiles(times, n=100)[int(p) - 1] * 1e6
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Command latency with autosave")
+    ap.add_argument("--commands", type=int, default=3000)
+    args = ap.parse_args()
+
+    vocab = Fuzzer.command_vocabulary(Game(headless=True))
+    commands = Fuzzer.random_commands(random.Random(7), vocab, args.commands)
+    tmp = Path(tempfile.mkdtemp())
+    saver = AutoSaver()
+
+    def plain(game, result):
+        with open(tmp / "plain.json", "w") as f:
+            json.dump(game.to_dict(), f)
+
+    def atomic(game, result):
+        atomic_write_text(str(tmp / "atomic.json"), json.dumps(game.to_dict()))
+
+    def behind(game, result):
+        saver.save(str(tmp / "behind.json"), json.dumps(game.to_dict()))
+
+    journal = Journal(str(tmp / "behind.journal"), saver=saver)
+
+    modes = [
+        ("off", lambda game, result: None),
+        ("sync json", plain),
+        ("sync atomic", atomic),
+        ("behind json", behind),
+        ("behind journal", journal.record),
+    ]
+    print(f"{'mode':15s} {'p50 us':>8s} {'p99 us':>9s} {'disk writes':>12s}")
+    for label, save in modes:
+        before = saver.writes
+        times = run(commands, save)
+        saver.flush()
+        writes = saver.writes - before if label.startswith("behind") else (
+            0 if label == "off" else len(commands))
+        print(f"{label:15s} {pct(times, 50):8.1f} {pct(times, 99):9.1f} {writes:12d}")
+    saver.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Per-command cost of every verb, compared against a saved baseline.
+
+Each case runs one command on a copy (Game.clone(), not timed) of a game
+set up for it, so every call does the same work: a door that is still
+shut, an item still on the floor. Every verb in Game.COMMANDS must have
+a case, plus an unknown verb (the "did you mean" path), Game() and
+from_dict. Each case is timed three ways, to show how much of a command
+is the game and how much is producing and writing its text:
+
+    headless   Game(headless=True): no text built at all
+    quiet      echo off, text kept in CommandResult.text (the web apps)
+    echo       text also printed into an io.StringIO (the CLI / capture path)
+
+Reported per call: median and p99 time, and the peak memory the call
+allocated (tracemalloc, measured in a separate pass).
+
+    python -m benchmarks.bench_commands --save        # record a baseline
+    python -m benchmarks.bench_commands               # compare with it
+
+Results go to --out as JSON. With a baseline present, any median more
+than --threshold slower than its baseline is flagged and the exit
+status is 1, so the script can gate a change (medians under --floor
+microseconds apart are never flagged: that is timer noise). Baselines
+depend on the machine and are not committed; a gate should record one
+on its own runner and pass --require-baseline, so that a missing
+baseline fails (status 2) instead of passing unchecked.
+"""
+import argparse
+import gc
+import io
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Tuple
+
+from OOAdventure.Game import Game
+
+from .common import summary
+
+MODES = ("headless", "quiet", "echo")
+
+# (case, commands that set the game up, the command timed)
+CASES: List[Tuple[str, List[str], str]] = [
+    ("go", [], "go north"),
+    ("pick", [], "pick stone"),
+    ("use", ["go north", "pick orb"], "use orb"),
+    ("look", [], "look"),
+    ("inventory", ["pick stone"], "inventory"),
+    ("help", [], "help"),
+    ("save", [], "save bench.json"),
+    ("load", ["save bench.json"], "load bench.json"),
+    ("quit", [], "quit"),
+    ("restart", [], "restart"),
+    ("unknown verb", [], "jmup north"),
+]
+
+
+def new_game(mode: str) -> Game:
+    game = Game(headless=mode == "headless")
+    game.out = io.StringIO()
+    game.echo = mode == "echo"
+    return game
+
+
+def command_case(mode: str, setup: List[str], cmd: str) -> Callable[[], Callable[[], object]]:
+    """A factory of calls that each run `cmd` on a fresh copy of the set-up game."""
+    ready = new_game(mode)
+    for step in setup:
+        ready.process_command(step)
+
+    def prepare():
+        game = ready.clone()
+        game.out = io.StringIO()
+        return lambda: game.process_command(cmd)
+    return prepare
+
+
+def constructor_cases(mode: str) -> Dict[str, Callable[[], Callable[[], object]]]:
+    data = new_game("quiet").to_dict()
+    return {
+        "Game()": lambda: lambda: new_game(mode),
+        "from_dict": lambda: lambda: Game.from_dict(data, out=io.StringIO()),
+    }
+
+
+def time_case(prepare, calls: int, rounds: int = 5) -> Tuple[float, List[float]]:
+    """The lowest median of `rounds` rounds (steadier than one long run,
+    as timeit does), and every call's time. GC is off while timing."""
+    medians, times = [], []
+    for _ in range(rounds):
+        batch = [prepare() for _ in range(max(1, calls // rounds))]
+        gc.disable()
+        try:
+            for call in batch:
+                t = time.perf_counter()
+                call()
+                times.append(time.perf_counter() - t)
+        finally:
+            gc.enable()
+        medians.append(statistics.median(times[-len(batch):]))
+    return min(medians), times
+
+
+def peak_bytes(prepare, calls: int) -> int:
+    peaks = []
+    tracemalloc.start()
+    for _ in range(calls):
+        call = prepare()
+        base = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        call()
+        peaks.append(tracemalloc.get_traced_memory()[1] - base)
+    tracemalloc.stop()
+    return sorted(peaks)[len(peaks) // 2]
+
+
+def run(calls: int) -> Dict[str, Dict[str, dict]]:
+    missing = set(Game.COMMANDS) - {cmd.split()[0] for _, _, cmd in CASES}
+    if missing:
+        sys.exit(f"no benchmark case for: {', '.join(sorted(missing))}")
+    results: Dict[str, Dict[str, dict]] = {}
+    for mode in MODES:
+        cases = {name: command_case(mode, setup, cmd) for name, setup, cmd in CASES}
+        cases.update(constructor_cases(mode))
+        for name, prepare in cases.items():
+            time_case(prepare, min(calls, 50), rounds=1)       # warm up
+            median, times = time_case(prepare, calls)
+            stats = summary(times)
+            stats["median_us"] = round(median * 1e6, 2)
+            stats["peak_bytes"] = peak_bytes(prepare, min(calls, 200))
+            results.setdefault(name, {})[mode] = stats
+    return results
+
+
+def regressions(results, baseline, threshold: float, floor_us: float) -> List[str]:
+    found = []
+    for name, modes in results.items():
+        for mode, stats in modes.items():
+            old = baseline.get(name, {}).get(mode)
+            if (old and stats["median_us"] > old["median_us"] * (1 + threshold)
+                    and stats["median_us"] - old["median_us"] > floor_us):
+                found.append(f"{name} ({mode}): {old['median_us']:.1f} -> "
+                             f"{stats['median_us']:.1f} us")
+    return found
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Per-command micro-benchmarks")
+    ap.add_argument("--calls", type=int, default=2000, help="timed calls per case and mode")
+    ap.add_argument("--baseline", default="bench_commands_baseline.json")
+    ap.add_argument("--save", action="store_true", help="write the results as the baseline")
+    ap.add_argument("--require-baseline", action="store_true",
+                    help="exit with status 2 when there is no baseline to compare with")
+    ap.add_argument("--threshold", type=float, default=0.5,
+                    help="flag medians this much slower than the baseline (0.5 = 50%%; "
+                         "the file-writing cases vary that much on a busy machine)")
+    ap.add_argument("--floor", type=float, default=1.0,
+                    help="...and at least this many microseconds slower")
+    ap.add_argument("--out", default="bench_commands.json", help="JSON results file")
+    args = ap.parse_args()
+    baseline_path = os.path.abspath(args.baseline)
+    out_path = os.path.abspath(args.out)
+
+    # save/load/quit/restart write files in the working directory.
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as folder:
+        os.chdir(folder)
+        try:
+            results = run(args.calls)
+        finally:
+            os.chdir(cwd)
+
+    print(f"{'':14s}" + "".join(f" {m + ' p50':>13s} {'p99':>8s}" for m in MODES)
+          + f" {'alloc B':>9s}   (us; alloc is quiet mode)")
+    for name, modes in results.items():
+        print(f"{name:14s}" + "".join(
+            f" {modes[m]['median_us']:13.1f} {modes[m]['p99_us']:8.1f}" for m in MODES)
+            + f" {modes['quiet']['peak_bytes']:9d}")
+
+    with open(out_path, "w", encoding="utf-8") as f:
+        json.dump({"benchmark": "commands", "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+                   "python": sys.version.split()[0], "calls": args.calls,
+                   "results": results}, f, indent=1)
+    if args.save:
+        with open(baseline_path, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=1)
+        print(f"baseline saved to {args.baseline}")
+        return
+    if not os.path.exists(baseline_path):
+        print(f"no baseline at {args.baseline}; run with --save to record one")
+        if args.require_baseline:
+            sys.exit(2)
+        return
+    with open(baseline_path, encoding="utf-8") as f:
+        found = regressions(results, json.load(f), args.threshold, args.floor)
+    for line in found:
+        print("REGRESSION", line)
+    if found:
+        sys.exit(1)
+    print(f"no regressions beyond {args.threshold:.0%} of {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+"Did you mean" lookups: difflib over the vocabulary versus FuzzyIndex.
+
+The typo corpus is made from the game's own verbs and item aliases with
+the mistakes people make on a keyboard: swapped neighbours, a dropped
+letter, a doubled letter, a neighbouring key hit instead of (or as well
+as) the right one. One or two typos per word, seeded. Reports time per
+lookup and how often the suggestion is the word that was meant, then the
+cost of a whole process_command for a known verb and for a typo.
+
+    python -m benchmarks.bench_fuzzy --words 5000
+"""
+import argparse
+import difflib
+import random
+import time
+
+from OOAdventure.FuzzyIndex import FuzzyIndex
+from OOAdventure.Game import Game
+
+KEYBOARD = ["qwertyuiop", "asdfghjkl", "zxcvbnm"]
+NEIGHBOURS = {}
+for r, row in enumerate(KEYBOARD):
+    for c, ch in enumerate(row):
+        near = set()
+        for dr in (-1, 0, 1):
+            if 0 <= r + dr < len(KEYBOARD):
+                other = KEYBOARD[r + dr]
+                near.update(other[max(0, c - 1):c + 2])
+        near.discard(ch)
+        NEIGHBOURS[ch] = "".join(sorted(near))
+
+
+def typo(word: str, rng: random.Random) -> str:
+    i = rng.randrange(len(word))
+    ch = word[i]
+    kind = rng.choice(["swap", "drop", "double", "near", "extra"])
+    if kind == "swap" and i + 1 < len(word):
+        return word[:i] + word[i + 1] + ch + word[i + 2:]
+    if kind == "drop" and len(word) > 2:
+        return word[:i] + word[i + 1:]
+    if kind == "double":
+        return word[:i] + ch + word[i:]
+    near = NEIGHBOURS.get(ch)
+    if not near:
+        return word[:i] + word[i + 1:] if len(word) > 2 else word + word[-1]
+    if kind == "near":
+        return word[:i] + rng.choice(near) + word[i + 1:]
+    return word[:i] + ch + rng.choice(near) + word[i + 1:]
+
+
+def corpus(terms, n: int, seed: int = 7):
+    rng = random.Random(seed)
+    long_enough = [t for t in terms if len(t) >= 3]
+    out = []
+    while len(out) < n:
+        meant = rng.choice(long_enough)
+        word = typo(meant, rng)
+        if len(meant) > 5 and rng.random() < 0.3:
+            word = typo(word, rng)
+        if word not in terms:
+            out.append((word, meant))
+    return out
+
+
+def per_lookup(fn, words) -> float:
+    start = time.perf_counter()
+    for w in words:
+        fn(w)
+    return (time.perf_counter() - start) / len(words) * 1e6
+
+
+def accuracy(fn, pairs) -> float:
+    return sum(fn(w) == meant for w, meant in pairs) / len(pairs)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="difflib vs FuzzyIndex")
+    ap.add_argument("--words", type=int, default=5000)
+    args = ap.parse_args()
+
+    game = Game()
+    game.echo = False
+    vocabularies = {
+        "verbs": list(game.VERB_ALIASES),
+        "items": list(game.item_alias_index),
+    }
+    print(f"{'vocab':6s} {'method':14s} {'us/lookup':>10s} {'right':>7s}")
+    for label, terms in vocabularies.items():
+        pairs = corpus(set(terms), args.words)
+        words = [w for w, _ in pairs]
+
+        def close(w):
+            m = difflib.get_close_matches(w, terms, n=1)
+            return m[0] if m else None
+
+        cold = FuzzyIndex(terms)
+        cold.CACHE_SIZE = 0         # every lookup is a fresh search
+        warm = FuzzyIndex(terms)
+        per_lookup(warm.lookup, words)
+        rows = [("difflib", close), ("index (cold)", cold.lookup),
+                ("index (warm)", warm.lookup)]
+        for name, fn in rows:
+            us = per_lookup(fn, words)
+            print(f"{label:6s} {name:14s} {us:10.2f} {accuracy(fn, pairs):7.1%}")
+
+    verbs = [w for w, _ in corpus(set(vocabularies["verbs"]), 1000)]
+    hit = per_lookup(lambda _: game.process_command("inventory"), verbs)
+    miss = per_lookup(lambda w: game.process_command(w), verbs)
+    print(f"process_command: known verb {hit:.1f} us, typo {miss:.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Gradio round trips per command: the old send -> .then(copy) chain versus
+app.py's single event.
+
+Builds the old two-event wiring around app.on_send, launches it and the
+real app locally, and plays the walkthrough through gradio_client, the
+way the browser would: the old wiring needs a second request to copy
+chat_state into the Chatbot, the new one does not. Reports queue events
+per command (counted from each app's dependency graph) and p50/p95 time
+per command. Needs gradio and gradio_client.
+
+    python -m benchmarks.bench_gradio_pipeline --rounds 20
+"""
+import argparse
+import statistics
+import time
+
+import gradio as gr
+from gradio_client import Client
+
+import app
+from .common import WALKTHROUGH
+
+
+def two_step_demo() -> gr.Blocks:
+    """The wiring app.py used to have, for comparison."""
+    with gr.Blocks() as demo:
+        chat_state, game_state = gr.State(), gr.State()
+        chat = gr.Chatbot()
+        cmd = gr.Textbox()
+        send = gr.Button("Send")
+
+        def legacy_send(c, ch, g):
+            ch, g, box, _ = app.on_send(c, ch, g)
+            return ch, g, box
+
+        send.click(legacy_send, inputs=[cmd, chat_state, game_state],
+                   outputs=[chat_state, game_state, cmd], api_name="send"
+                   ).then(lambda c: c, inputs=[chat_state], outputs=[chat],
+                          api_name="show")
+    demo.queue()
+    return demo
+
+
+def events_per_send(demo: gr.Blocks) -> int:
+    """Dependencies fired by one click of the send endpoint, .then()s included."""
+    deps = demo.config["dependencies"]
+    ids = {d.get("id", i): d for i, d in enumerate(deps)}
+    start = next(k for k, d in ids.items() if d.get("api_name") == "send")
+    count, frontier = 0, {start}
+    while frontier:
+        count += len(frontier)
+        frontier = {k for k, d in ids.items() if d.get("trigger_after") in frontier}
+    return count
+
+
+def play(client: Client, endpoints, rounds: int):
+    latencies = []
+    for _ in range(rounds):
+        for command in WALKTHROUGH[1:]:
+            t = time.perf_counter()
+            for api_name, args in endpoints(command):
+                client.predict(*args, api_name=api_name)
+            latencies.append(time.perf_counter() - t)
+        client.reset_session()
+    return latencies
+
+
+def report(label: str, events: int, latencies) -> None:
+    cuts = statistics.quantiles(latencies, n=100)
+    print(f"{label:10s} {events:7d} {cuts[49] * 1e3:8.2f} {cuts[94] * 1e3:8.2f}")
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Gradio events and latency per command")
+    ap.add_argument("--rounds", type=int, default=20)
+    args = ap.parse_args()
+
+    print(f"{'wiring':10s} {'events':>7s} {'p50 ms':>8s} {'p95 ms':>8s}")
+    old = two_step_demo()
+    _, url, _ = old.launch(prevent_thread_lock=True, quiet=True)
+    lat = play(Client(url, verbose=False),
+               lambda c: [("/send", (c,)), ("/show", ())], args.rounds)
+    report("two-step", events_per_send(old), lat)
+    old.close()
+
+    _, url, _ = app.demo.launch(prevent_thread_lock=True, quiet=True)
+    lat = play(Client(url, verbose=False),
+               lambda c: [("/send", (c,))], args.rounds)
+    report("single", events_per_send(app.demo), lat)
+    app.demo.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Commands/sec for the canonical walkthrough, three ways:
+
+  capture   - text printed into a per-game buffer (the old frontend path)
+  result    - echo off, text read from CommandResult.text
+  headless  - Game(headless=True) driven by Simulation.run_commands
+
+Games are built before the clock starts, so only command execution is
+timed.
+
+    python -m benchmarks.bench_headless --runs 2000
+"""
+import argparse
+import io
+import time
+
+from OOAdventure.Game import Game
+from OOAdventure.Simulation import run_commands
+from benchmarks.common import WALKTHROUGH
+
+
+def capture(games) -> None:
+    for game in games:
+        game.out = io.StringIO()
+        for cmd in WALKTHROUGH:
+            game.process_command(cmd)
+        game.out.getvalue()
+
+
+def result_text(games) -> None:
+    for game in games:
+        game.echo = False
+        for cmd in WALKTHROUGH:
+            game.process_command(cmd).text
+
+
+def headless(games) -> None:
+    for game in games:
+        run_commands(game, WALKTHROUGH)
+
+
+def measure(fn, runs: int, **game_kwargs) -> float:
+    games = [Game(**game_kwargs) for _ in range(runs)]
+    start = time.perf_counter()
+    fn(games)
+    elapsed = time.perf_counter() - start
+    return runs * len(WALKTHROUGH) / elapsed
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Walkthrough command throughput")
+    ap.add_argument("--runs", type=int, default=2000)
+    args = ap.parse_args()
+
+    base = measure(capture, args.runs)
+    rows = [
+        ("capture", base),
+        ("result", measure(result_text, args.runs)),
+        ("headless", measure(headless, args.runs, headless=True)),
+    ]
+    for label, rate in rows:
+        print(f"{label:9s} {rate:12,.0f} commands/sec  ({rate / base:4.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Player inventory operations, list-backed (before) versus Inventory.
+
+For each inventory size, times has() on a carried item near the end and
+on a missing item, and a remove()+add() round trip, per call.
+
+    python -m benchmarks.bench_inventory --sizes 10 1000 10000
+"""
+import argparse
+import timeit
+
+from OOAdventure.Player import Player
+
+
+class ListPlayer:
+    """Player as it was: the inventory is a plain list."""
+
+    def __init__(self, inventory):
+        self.inventory = list(inventory)
+
+    def has(self, item_name):
+        return item_name in self.inventory
+
+    def add(self, item_name):
+        if item_name not in self.inventory:
+            self.inventory.append(item_name)
+
+    def remove(self, item_name):
+        if item_name in self.inventory:
+            self.inventory.remove(item_name)
+
+
+def ns_per_call(stmt, number: int) -> float:
+    return min(timeit.repeat(stmt, number=number, repeat=5)) / number * 1e9
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="list vs ordered-set inventory")
+    ap.add_argument("--sizes", type=int, nargs="+", default=[10, 1000, 10000])
+    ap.add_argument("--number", type=int, default=2000)
+    args = ap.parse_args()
+
+    print(f"{'size':>6s} {'kind':8s} {'has ns':>9s} {'miss ns':>9s} {'rm+add ns':>10s}")
+    for size in args.sizes:
+        names = [f"Trinket {i}" for i in range(size)]
+        mid = names[size // 2]
+        for kind, player in (("list", ListPlayer(names)),
+                             ("ordered", Player(inventory=names))):
+            has = ns_per_call(lambda: player.has(names[-1]), args.number)
+            miss = ns_per_call(lambda: player.has("Nothing"), args.number)
+            cycle = ns_per_call(lambda: (player.remove(mid), player.add(mid)),
+                                args.number)
+            print(f"{size:6d} {kind:8s} {has:9.0f} {miss:9.0f} {cycle:10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Cost of "look" as the world grows, with the items-by-location index.
+
+Adds `n` clutter items spread over storerooms the player never visits and
+times "look" in the Entrance. "scan" is what show_status used to do to
+find the items in the room (a pass over every item); "index" is
+Game.items_in(). With the index, "look" stays flat as n grows.
+
+    python -m benchmarks.bench_item_index --items 100 1000 10000 100000
+"""
+import argparse
+import time
+
+from OOAdventure.Game import Game
+from OOAdventure.Item import Item
+from OOAdventure.Room import Room
+
+
+def cluttered(n: int) -> type:
+    class ClutteredGame(Game):
+        def _build_world(self) -> None:
+            super()._build_world()
+            stores = max(1, n // 100)
+            for s in range(stores):
+                self.rooms[f"Storeroom {s}"] = Room(f"Storeroom {s}", "Dusty.")
+            for i in range(n):
+                name = f"Trinket {i}"
+                self.items[name] = Item(name, f"Storeroom {i % stores}")
+    return ClutteredGame
+
+
+def per_call_us(fn, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="look cost vs number of items")
+    ap.add_argument("--items", type=int, nargs="+",
+                    default=[100, 1000, 10000, 100000])
+    ap.add_argument("--repeat", type=int, default=200)
+    args = ap.parse_args()
+
+    print(f"{'items':>7s} {'scan us':>9s} {'index us':>9s} {'look us':>9s}")
+    for n in args.items:
+        game = cluttered(n)()
+        game.echo = False
+        here = game.player.room
+        scan = per_call_us(lambda: [name for name, it in game.items.items()
+                                    if it.location == here], args.repeat)
+        index = per_call_us(lambda: game.items_in(here), args.repeat)
+        look = per_call_us(lambda: game.process_command("look"), args.repeat)
+        print(f"{n:7d} {scan:9.1f} {index:9.2f} {look:9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Journal autosave versus rewriting the whole save after every command.
+
+Plays seeded random sessions (the fuzzer's command streams) and autosaves
+after each command both ways. Reports time per autosave, bytes on disk
+and, for the journal, how long a replay takes.
+
+    python -m benchmarks.bench_journal --commands 1000 10000
+"""
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from OOAdventure import Fuzzer
+from OOAdventure.Game import Game
+from OOAdventure.Journal import Journal
+
+
+def session(n: int, seed: int = 1):
+    game = Game(headless=True)
+    vocab = Fuzzer.command_vocabulary(game)
+    return game, Fuzzer.random_commands(random.Random(seed), vocab, n)
+
+
+def full_rewrite(n: int, path: Path):
+    game, cmds = session(n)
+    spent = 0.0
+    for cmd in cmds:
+        game.process_command(cmd)
+        t = time.perf_counter()
+        path.write_text(json.dumps(game.to_dict()))
+        spent += time.perf_counter() - t
+    return spent / n, path.stat().st_size
+
+
+def journaled(n: int, path: Path):
+    game, cmds = session(n)
+    journal = Journal(str(path))
+    spent = 0.0
+    for cmd in cmds:
+        result = game.process_command(cmd)
+        t = time.perf_counter()
+        journal.record(game, result)
+        spent += time.perf_counter() - t
+    journal.close()
+    t = time.perf_counter()
+    replayed = Journal.replay(str(path))
+    replay = time.perf_counter() - t
+    assert replayed.to_dict() == game.to_dict()
+    return spent / n, path.stat().st_size, replay
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Journal vs full-save autosave")
+    ap.add_argument("--commands", type=int, nargs="+", default=[1000, 10000])
+    args = ap.parse_args()
+
+    tmp = Path(tempfile.mkdtemp())
+    print(f"{'commands':>8s} {'mode':8s} {'us/save':>9s} {'bytes':>9s} {'replay ms':>10s}")
+    for n in args.commands:
+        us, size = full_rewrite(n, tmp / "autosave.json")
+        print(f"{n:8d} {'rewrite':8s} {us * 1e6:9.1f} {size:9d} {'-':>10s}")
+        us, size, replay = journaled(n, tmp / "autosave.journal")
+        print(f"{n:8d} {'journal':8s} {us * 1e6:9.1f} {size:9d} {replay * 1e3:10.2f}")
+        for f in tmp.iterdir():
+            os.remove(f)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Thread-pool stress test for per-session output.
+
+Runs the walkthrough in many concurrent sessions and checks that every
+session's transcript is exactly the single-threaded reference. It does it
+twice: once with the per-game output sink, once with the old "swap
+sys.stdout" capture, so the difference is visible.
+
+    python -m benchmarks.bench_output_sink --sessions 64 --rounds 20
+"""
+import argparse
+import io
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from OOAdventure.Game import Game
+from benchmarks.common import WALKTHROUGH
+
+
+def capture_with_sink(game: Game, cmd: str) -> str:
+    buf = io.StringIO()
+    old = game.out
+    game.out = buf
+    try:
+        game.process_command(cmd)
+    finally:
+        game.out = old
+    return buf.getvalue()
+
+
+def capture_with_stdout(game: Game, cmd: str) -> str:
+    # The old approach: swap the process-wide sys.stdout.
+    buf = io.StringIO()
+    old = sys.stdout
+    sys.stdout = buf
+    try:
+        game.process_command(cmd)
+    finally:
+        sys.stdout = old
+    return buf.getvalue()
+
+
+def play(capture) -> str:
+    game = Game()
+    return "".join(capture(game, cmd) for cmd in WALKTHROUGH)
+
+
+def stress(capture, sessions: int, rounds: int):
+    reference = play(capture_with_sink)
+    bad = 0
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=sessions) as pool:
+        futures = [pool.submit(play, capture)
+                   for _ in range(sessions * rounds)]
+        for f in futures:
+            if f.result() != reference:
+                bad += 1
+    elapsed = time.perf_counter() - start
+    return bad, sessions * rounds, elapsed
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--sessions", type=int, default=64)
+    ap.add_argument("--rounds", type=int, default=20)
+    args = ap.parse_args()
+
+    # Make thread switches frequent so interleaving shows up quickly.
+    sys.setswitchinterval(1e-6)
+
+    real_stdout = sys.stdout
+    for label, capture in (("per-game sink", capture_with_sink),
+                           ("swap sys.stdout", capture_with_stdout)):
+        bad, total, elapsed = stress(capture, args.sessions, args.rounds)
+        # Racing swaps can leave a session buffer installed as sys.stdout.
+        sys.stdout = real_stdout
+        print(f"{label:16s} {total:6d} playthroughs on {args.sessions} threads: "
+              f"{bad:5d} corrupted transcripts, {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
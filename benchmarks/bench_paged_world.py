@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Big worlds loaded whole versus paged in from the mapped image.
+
+Writes a corridor world of N rooms (one item each, see bench_world_file)
+and, for a Game class loading it whole and one with PAGED = True,
+reports:
+
+    template   building the WorldTemplate from a warm __pycache__
+    MB         tracemalloc memory held by the template and one game
+               after walking --walk rooms east, picking up every item
+    us/cmd     mean time of those commands, for another class of the
+               same kind walked with tracemalloc off
+    hot/miss   decoded rooms kept by the paged LRU, and decodes so far
+
+    python -m benchmarks.bench_paged_world --rooms 10000 100000 --walk 2000
+"""
+import argparse
+import json
+import shutil
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from OOAdventure import WorldFile
+from OOAdventure.Game import Game
+from OOAdventure.WorldTemplate import WorldTemplate
+
+from .bench_world_file import corridor
+
+
+def walk_east(cls, rooms: int) -> float:
+    """Seconds to pick up every trinket on the way `rooms` rooms east."""
+    game = cls(headless=True)
+    t = time.perf_counter()
+    for i in range(rooms):
+        game.process_command(f"pick trinket{i}")
+        game.process_command("go east")
+    return time.perf_counter() - t
+
+
+def run(make_cls, walk: int):
+    # Each class gets its own template (and LRU), so the timed walk
+    # starts as cold as the measured one.
+    cls = make_cls()
+    tracemalloc.start()
+    t = time.perf_counter()
+    template = WorldTemplate.of(cls)
+    template_ms = (time.perf_counter() - t) * 1e3
+    walk_east(cls, walk)
+    used = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    lru = (f"{template.rooms.hot()}/{template.rooms.misses}"
+           if cls.PAGED else "-")
+    timed = make_cls()
+    WorldTemplate.of(timed)
+    per_cmd = walk_east(timed, walk) / (2 * walk) * 1e6
+    return template_ms, used / 2**20, per_cmd, lru
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Whole versus paged big worlds")
+    ap.add_argument("--rooms", type=int, nargs="+", default=[10000, 100000])
+    ap.add_argument("--walk", type=int, default=2000)
+    ap.add_argument("--hot", type=int, default=1024,
+                    help="HOT_ROOMS for the paged class")
+    args = ap.parse_args()
+
+    folder = Path(tempfile.mkdtemp())
+    print(f"{'rooms':>7s} {'':6s} {'template ms':>12s} {'MB':>7s} "
+          f"{'us/cmd':>7s} {'hot/miss':>11s}")
+    for n in args.rooms:
+        path = folder / f"world{n}.json"
+        path.write_text(json.dumps(corridor(n)))
+        WorldFile.load(path)                              # compile once
+
+        def whole():
+            return type("Whole", (Game,), {"WORLD": path})
+
+        def paged():
+            return type("Paged", (Game,), {"WORLD": path, "PAGED": True,
+                                           "HOT_ROOMS": args.hot})
+        for label, make_cls in (("whole", whole), ("paged", paged)):
+            template_ms, mb, per_cmd, lru = run(make_cls, min(args.walk, n - 1))
+            print(f"{n:7d} {label:6s} {template_ms:12.1f} {mb:7.1f} "
+                  f"{per_cmd:7.1f} {lru:>11s}")
+    shutil.rmtree(folder)
+
+
+if __name__ == "__main__":
+    main()
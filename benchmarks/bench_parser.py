@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Parse throughput: the old split/dict path versus PhraseParser.
+
+Worlds get `n` extra items with one- and two-word aliases ("trinket 7",
+"brass trinket 7"), so the alias tables grow while the commands stay the
+same. "split" is what _dispatch used to do (split, verb dict, join the
+rest, alias dict); it only understands the terse commands. The parser is
+timed on the same terse commands and on wordy ones it alone understands.
+
+    python -m benchmarks.bench_parser --aliases 0 1000 10000
+"""
+import argparse
+import time
+
+from OOAdventure.Game import Game
+from OOAdventure.Item import Item
+from OOAdventure.WorldTemplate import WorldTemplate
+
+TERSE = ["pick orb", "take tp stone", "go north", "use fire scroll",
+         "look", "grab rope", "use stone", "get key"]
+WORDY = ["pick up the glowing crystal orb", "use the rope on the chasm",
+         "go to the north", "take the tp stone.", "n",
+         "use the fire scroll on the pool", "grab the ice wand please",
+         "look around"]
+
+
+def world(n: int) -> WorldTemplate:
+    class BigGame(Game):
+        def _build_world(self) -> None:
+            super()._build_world()
+            for i in range(n // 2):
+                name = f"Trinket {i}"
+                self.items[name] = Item(name, "Entrance",
+                                        aliases=[f"brass trinket {i}"])
+    return WorldTemplate.of(BigGame)
+
+
+def split_path(template: WorldTemplate):
+    verbs, aliases = Game.VERB_ALIASES, template.item_alias_index
+
+    def parse(cmd: str):
+        parts = cmd.strip().lower().split()
+        verb = verbs.get(parts[0])
+        raw = " ".join(parts[1:])
+        return verb, aliases.get(raw.strip().strip('"').strip("'"))
+    return parse
+
+
+def parser_path(template: WorldTemplate):
+    parser, aliases = template.parser, template.item_alias_index
+
+    def parse(cmd: str):
+        verb, _, args = parser.parse(cmd)
+        return verb, aliases.get(" ".join(args))
+    return parse
+
+
+def per_parse_us(parse, commands, rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for cmd in commands:
+            parse(cmd)
+    return (time.perf_counter() - start) / (rounds * len(commands)) * 1e6
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Command parse throughput")
+    ap.add_argument("--aliases", type=int, nargs="+", default=[0, 1000, 10000])
+    ap.add_argument("--rounds", type=int, default=5000)
+    args = ap.parse_args()
+
+    print(f"{'aliases':>8s} {'split us':>9s} {'parser us':>10s} "
+          f"{'wordy us':>9s} {'parses/sec':>11s}")
+    for n in args.aliases:
+        template = world(n)
+        split = per_parse_us(split_path(template), TERSE, args.rounds)
+        parsed = per_parse_us(parser_path(template), TERSE, args.rounds)
+        wordy = per_parse_us(parser_path(template), WORDY, args.rounds)
+        print(f"{len(template.item_alias_index):8d} {split:9.2f} {parsed:10.2f} "
+              f"{wordy:9.2f} {1e6 / wordy:11,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Saves/sec: one JSON file per session versus the SQLite save store.
+
+Every session saves a mid-game state to its "save.json" slot, `rounds`
+times over. Compares Game.save() to files, Game.save() into SQLite (one
+commit per save), and the same rows batched through write_many(), single
+threaded and with a thread per worker.
+
+    python -m benchmarks.bench_save_store --sessions 1000 --threads 8
+"""
+import argparse
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from OOAdventure.Game import Game
+from OOAdventure.SaveStore import SqliteSaveStore
+
+from .common import WALKTHROUGH
+
+
+def games(n: int):
+    out = []
+    for i in range(n):
+        game = Game(headless=True)
+        for cmd in WALKTHROUGH[:1 + i % (len(WALKTHROUGH) - 1)]:
+            game.process_command(cmd)
+        out.append(game)
+    return out
+
+
+def to_files(sessions, rounds: int, folder: Path, threads: int) -> float:
+    paths = [str(folder / f"s{i}.json") for i in range(len(sessions))]
+
+    def work(k):
+        for _ in range(rounds):
+            for i in range(k, len(sessions), threads):
+                sessions[i].save(paths[i])
+
+    return timed(work, threads)
+
+
+def to_sqlite(sessions, rounds: int, store: SqliteSaveStore,
+              threads: int) -> float:
+    for i, game in enumerate(sessions):
+        game.saves = store.slots(f"s{i}")
+
+    def work(k):
+        for _ in range(rounds):
+            for i in range(k, len(sessions), threads):
+                sessions[i].save("save.json")
+
+    return timed(work, threads)
+
+
+def to_sqlite_batched(sessions, rounds: int, store: SqliteSaveStore,
+                      threads: int) -> float:
+    def work(k):
+        for _ in range(rounds):
+            store.write_many(
+                (f"s{i}", "save.json", sessions[i].to_dict(), False)
+                for i in range(k, len(sessions), threads))
+
+    return timed(work, threads)
+
+
+def timed(work, threads: int) -> float:
+    t = time.perf_counter()
+    with ThreadPoolExecutor(threads) as pool:
+        list(pool.map(work, range(threads)))
+    return time.perf_counter() - t
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="File saves vs SQLite saves")
+    ap.add_argument("--sessions", type=int, default=1000)
+    ap.add_argument("--rounds", type=int, default=3)
+    ap.add_argument("--threads", type=int, nargs="+", default=[1, 8])
+    args = ap.parse_args()
+
+    sessions = games(args.sessions)
+    n = args.sessions * args.rounds
+    print(f"{n} saves of {args.sessions} sessions")
+    print(f"{'threads':>7s} {'backend':16s} {'saves/sec':>10s} {'bytes':>10s}")
+    for threads in args.threads:
+        folder = Path(tempfile.mkdtemp())
+        for g in sessions:
+            g.saves = None
+        secs = to_files(sessions, args.rounds, folder, threads)
+        size = sum(f.stat().st_size for f in folder.iterdir())
+        print(f"{threads:7d} {'json files':16s} {n / secs:10,.0f} {size:10d}")
+
+        db = folder / "saves.db"
+        store = SqliteSaveStore(str(db))
+        secs = to_sqlite(sessions, args.rounds, store, threads)
+        batched = to_sqlite_batched(sessions, args.rounds, store, threads)
+        assert store.read("s5", "save.json") == sessions[5].to_dict()
+        store.close()              # checkpoints the WAL into saves.db
+        size = os.path.getsize(db)
+        print(f"{threads:7d} {'sqlite':16s} {n / secs:10,.0f} {size:10d}")
+        print(f"{threads:7d} {'sqlite batched':16s} {n / batched:10,.0f} {size:10d}")
+
+
+if __name__ == "__main__":
+    main()
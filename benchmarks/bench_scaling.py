@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+How the game scales with world size, on generated worlds.
+
+For each size, WorldGenerator builds a winnable world of N rooms (N/2
+items, one puzzle per 50 rooms) and a Game subclass plays it. Timed:
+
+    generate       building the world and its walkthrough
+    compile        first WorldFile.load (JSON, checks, image)
+    template       WorldTemplate for the class (what a server does once)
+    Game()         a new session
+    look           after every step below
+    go/pick/use    the first --steps walkthrough commands, by verb
+    to_dict        and from_dict, of the game after those steps
+    save, load     handle_save / handle_load of that game to a file
+
+Per-call figures are medians and p99s in microseconds. Everything is
+also written as JSON (--out) with the Python version, platform and git
+commit, so runs can be compared over time.
+
+    python -m benchmarks.bench_scaling --rooms 10 100 1000 10000 100000 --out scaling.json
+"""
+import argparse
+import json
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+
+from OOAdventure import WorldFile, WorldGenerator
+from OOAdventure.Game import Game
+from OOAdventure.WorldTemplate import WorldTemplate
+
+from .common import summary
+
+COLUMNS = ("Game()", "look", "go", "pick", "use", "to_dict", "from_dict", "save", "load")
+
+
+def timings(f, n: int, budget: float = 2.0):
+    """Up to n timed calls of f, fewer (at least 5) once they pass `budget` s."""
+    times = []
+    stop = time.perf_counter() + budget
+    for i in range(n):
+        t = time.perf_counter()
+        f()
+        times.append(time.perf_counter() - t)
+        if i >= 4 and t > stop:
+            break
+    return times
+
+
+def once(f) -> float:
+    t = time.perf_counter()
+    f()
+    return (time.perf_counter() - t) * 1e3
+
+
+def measure(rooms: int, steps: int, repeat: int, paged: bool, folder: Path) -> dict:
+    items, puzzles = rooms // 2, max(1, rooms // 50)
+    t = time.perf_counter()
+    world, walkthrough = WorldGenerator.generate(rooms, items, puzzles, seed=rooms)
+    generate_ms = (time.perf_counter() - t) * 1e3
+    path = folder / f"world{rooms}.json"
+    path.write_text(json.dumps(world))
+    compile_ms = once(lambda: WorldFile.load(path))
+    cls = type("Generated", (Game,), {"WORLD": path, "PAGED": paged})
+    template_ms = once(lambda: WorldTemplate.of(cls))
+
+    per_call = defaultdict(list)
+    per_call["Game()"] = timings(cls, repeat)
+    game = cls()
+    game.echo = False
+    for cmd in walkthrough[:steps]:
+        t = time.perf_counter()
+        game.process_command(cmd)
+        per_call[cmd.split()[0]].append(time.perf_counter() - t)
+        per_call["look"] += timings(lambda: game.process_command("look"), 1)
+
+    data = game.to_dict()
+    per_call["to_dict"] = timings(game.to_dict, repeat)
+    per_call["from_dict"] = timings(lambda: cls.from_dict(data), repeat)
+    save = str(folder / "save.json")
+    per_call["save"] = timings(lambda: game.handle_save([save]), repeat)
+    per_call["load"] = timings(lambda: game.handle_load([save]), repeat)
+    return {"rooms": rooms, "items": items, "puzzles": puzzles, "paged": paged,
+            "walkthrough": len(walkthrough),
+            "generate_ms": round(generate_ms, 2), "compile_ms": round(compile_ms, 2),
+            "template_ms": round(template_ms, 2),
+            "per_call": {name: summary(per_call[name]) for name in COLUMNS if per_call[name]}}
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Game cost against world size")
+    ap.add_argument("--rooms", type=int, nargs="+", default=[10, 100, 1000, 10000, 100000])
+    ap.add_argument("--steps", type=int, default=500,
+                    help="walkthrough commands timed per world")
+    ap.add_argument("--repeat", type=int, default=200,
+                    help="calls timed for Game(), to_dict, save and the like "
+                         "(fewer once they take over 2 s)")
+    ap.add_argument("--paged", action="store_true", help="use PAGED = True classes")
+    ap.add_argument("--out", default="scaling.json", help="JSON results file")
+    args = ap.parse_args()
+
+    folder = Path(tempfile.mkdtemp())
+    results = []
+    print(f"{'rooms':>7s} {'template ms':>12s}" + "".join(f" {c:>9s}" for c in COLUMNS)
+          + "   (median us)")
+    try:
+        for n in args.rooms:
+            r = measure(n, args.steps, args.repeat, args.paged, folder)
+            results.append(r)
+            print(f"{n:7d} {r['template_ms']:12.1f}" + "".join(
+                f" {r['per_call'][c]['median_us']:9.1f}" if c in r["per_call"] else f" {'-':>9s}"
+                for c in COLUMNS))
+    finally:
+        shutil.rmtree(folder)
+    report = {"benchmark": "scaling", "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+              "python": sys.version.split()[0], "platform": platform.platform(),
+              "commit": git_commit(), "args": vars(args), "results": results}
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=1)
+    print(f"wrote {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Bytes per live session, measured with tracemalloc.
+
+Keeps --sessions games alive at each stage of the walkthrough (fresh,
+after 4, 12 and all 16 commands) and reports the memory they hold, divided
+by the number of games. --top lists the source lines that allocated most
+of it for the last stage. The script only uses Game's public API, so it
+can be run against an older checkout to get the "before" numbers.
+
+    python -m benchmarks.bench_session_memory --sessions 5000 --top 8
+"""
+import argparse
+import tracemalloc
+
+from OOAdventure.Game import Game
+
+from .common import WALKTHROUGH
+
+STAGES = (0, 4, 12, len(WALKTHROUGH))
+
+
+def live_sessions(n: int, commands):
+    games = []
+    for _ in range(n):
+        game = Game()
+        game.echo = False
+        for cmd in commands:
+            game.process_command(cmd)
+        games.append(game)
+    return games
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Memory per live session")
+    ap.add_argument("--sessions", type=int, default=5000)
+    ap.add_argument("--top", type=int, default=0,
+                    help="show the N biggest allocation sites")
+    args = ap.parse_args()
+
+    live_sessions(1, WALKTHROUGH)       # build the template and caches first
+    print(f"{'commands':>8s} {'bytes/session':>14s}")
+    for stage in STAGES:
+        tracemalloc.start()
+        games = live_sessions(args.sessions, WALKTHROUGH[:stage])
+        used = tracemalloc.get_traced_memory()[0]
+        snapshot = tracemalloc.take_snapshot() if args.top else None
+        tracemalloc.stop()
+        print(f"{stage:8d} {used / args.sessions:14,.0f}")
+        del games
+    if snapshot is not None:
+        print(f"\nbiggest allocation sites after {STAGES[-1]} commands:")
+        for stat in snapshot.statistics("lineno")[:args.top]:
+            frame = stat.traceback[0]
+            print(f"{stat.size / args.sessions:8,.0f} B  "
+                  f"{frame.filename}:{frame.lineno}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+First-response latency when a burst of new visitors arrives at once.
+
+Every visitor needs a new game and its opening "look" (what bootstrap()
+in app.py sends first). All of them are submitted to a thread pool at the
+same instant, and latency runs from that instant to the visitor's opening
+text, so time spent queued behind other visitors counts. Compared:
+
+    no pool       build + look on the request path (the old bootstrap)
+    pool, full    SessionPool already holding one game per visitor
+    pool, small   SessionPool of --size games refilled in the background
+
+    python -m benchmarks.bench_session_pool --burst 500 --threads 32
+"""
+import argparse
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from OOAdventure.SessionPool import SessionPool, quiet_game
+
+
+def no_pool():
+    game = quiet_game()
+    return game, game.process_command("look")
+
+
+def burst(take, n: int, threads: int):
+    def visitor(start: float) -> float:
+        _, opening = take()
+        assert opening.text
+        return time.perf_counter() - start
+
+    with ThreadPoolExecutor(threads) as ex:
+        list(ex.map(time.sleep, [0.01] * threads))   # start the workers first
+        start = time.perf_counter()
+        futures = [ex.submit(visitor, start) for _ in range(n)]
+        return [f.result() for f in futures]
+
+
+def report(label: str, times) -> None:
+    q = statistics.quantiles(times, n=100)
+    print(f"{label:12s} {q[49] * 1e3:8.2f} {q[94] * 1e3:8.2f} "
+          f"{q[98] * 1e3:8.2f} {max(times) * 1e3:8.2f}")
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Bootstrap latency under a burst")
+    ap.add_argument("--burst", type=int, default=500)
+    ap.add_argument("--threads", type=int, default=32)
+    ap.add_argument("--size", type=int, default=64,
+                    help="games held by the small pool")
+    ap.add_argument("--refill", type=float, default=500,
+                    help="games per second the small pool rebuilds")
+    args = ap.parse_args()
+
+    quiet_game().process_command("look")       # build the world template once
+    print(f"{args.burst} new sessions at once on {args.threads} threads")
+    print(f"{'':12s} {'p50 ms':>8s} {'p95 ms':>8s} {'p99 ms':>8s} {'max ms':>8s}")
+    report("no pool", burst(no_pool, args.burst, args.threads))
+
+    full = SessionPool(size=args.burst, refill_per_sec=args.refill)
+    full.wait_full()
+    report("pool, full", burst(full.take, args.burst, args.threads))
+    full.close()
+
+    small = SessionPool(size=args.size, refill_per_sec=args.refill)
+    small.wait_full()
+    report("pool, small", burst(small.take, args.burst, args.threads))
+    print(f"small pool: {small.hits} served ready, {small.misses} built inline")
+    small.close()
+
+
+if __name__ == "__main__":
+    main()
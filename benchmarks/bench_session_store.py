@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Load test for SessionStore: hundreds of sessions issuing commands at once.
+
+Each simulated player runs a seeded random command stream through
+store.session(); a thread pool interleaves them. The cache is smaller
+than the number of players, so sessions get evicted and reloaded from
+their journals along the way. At the end every session is reloaded from
+disk and checked against a reference game that ran the same commands.
+
+    python -m benchmarks.bench_session_store --sessions 300 --commands 100
+"""
+import argparse
+import random
+import shutil
+import statistics
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from OOAdventure import Fuzzer
+from OOAdventure.AutoSaver import AutoSaver
+from OOAdventure.Game import Game
+from OOAdventure.SessionStore import SessionStore
+
+
+def player(store: SessionStore, sid: str, commands) -> list:
+    times = []
+    for cmd in commands:
+        t = time.perf_counter()
+        with store.session(sid) as s:
+            s.record(s.game.process_command(cmd))
+        times.append(time.perf_counter() - t)
+    return times
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="SessionStore load test")
+    ap.add_argument("--sessions", type=int, default=300)
+    ap.add_argument("--commands", type=int, default=100)
+    ap.add_argument("--threads", type=int, default=32)
+    ap.add_argument("--cache", type=int, default=100,
+                    help="max sessions kept in memory")
+    args = ap.parse_args()
+
+    folder = tempfile.mkdtemp()
+    saver = AutoSaver()
+    store = SessionStore(folder, max_sessions=args.cache, saver=saver)
+    vocab = Fuzzer.command_vocabulary(Game(headless=True))
+    streams = {f"player{i}": Fuzzer.random_commands(random.Random(i), vocab,
+                                                    args.commands)
+               for i in range(args.sessions)}
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(args.threads) as pool:
+        futures = [pool.submit(player, store, sid, cmds)
+                   for sid, cmds in streams.items()]
+        times = [t for f in futures for t in f.result()]
+    elapsed = time.perf_counter() - start
+    peak = len(store)
+    store.close()
+    saver.flush()
+
+    check = SessionStore(folder, max_sessions=args.sessions)
+    bad = 0
+    for sid, cmds in streams.items():
+        ref = Game(headless=True)
+        for cmd in cmds:
+            ref.process_command(cmd)
+        with check.session(sid) as s:
+            bad += s.game.to_dict() != ref.to_dict()
+
+    q = statistics.quantiles(times, n=100)
+    print(f"{len(times)} commands from {args.sessions} sessions on "
+          f"{args.threads} threads in {elapsed:.2f}s "
+          f"({len(times) / elapsed:,.0f} commands/sec)")
+    print(f"latency p50 {q[49] * 1e6:.0f}us  p99 {q[98] * 1e6:.0f}us")
+    print(f"cache limit {args.cache}, cached at end {peak}, "
+          f"evictions {store.evictions}, disk writes {saver.writes}")
+    print(f"sessions restored from disk with wrong state: {bad}")
+    saver.close()
+    shutil.rmtree(folder)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Solver timings on bigger worlds.
+
+The tower is extended with a corridor of extra rooms running east from the
+Entrance, and the Teleportation Stone is moved to the far end of it, so
+both the state space and the solution grow with the world size.
+
+    python -m benchmarks.bench_solver --sizes 10 100 1000
+"""
+import argparse
+import time
+
+from OOAdventure.Game import Game
+from OOAdventure.Room import Room
+from OOAdventure.Solver import solve
+
+
+class CorridorGame(Game):
+    HALLS = 0
+
+    def _build_world(self) -> None:
+        super()._build_world()
+        prev = "Entrance"
+        for i in range(1, self.HALLS + 1):
+            name = f"Hall {i}"
+            self.rooms[name] = Room(name=name, desc="A long, echoing hallway.")
+            self.room(prev).connect("east", name)
+            self.room(name).connect("west", prev)
+            prev = name
+        self.items["Teleportation Stone"].location = prev
+
+
+def corridor_game(rooms: int) -> Game:
+    cls = type(f"Corridor{rooms}", (CorridorGame,), {"HALLS": max(0, rooms - 5)})
+    return cls()
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Solver timings")
+    ap.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000])
+    args = ap.parse_args()
+
+    print(f"{'rooms':>6} {'moves':>6} {'states':>9} {'seconds':>9} {'states/s':>10}")
+    for size in args.sizes:
+        game = corridor_game(size)
+        start = time.perf_counter()
+        solution = solve(game)
+        elapsed = time.perf_counter() - start
+        moves = len(solution.commands) if solution.commands else "-"
+        print(f"{len(game.rooms):6d} {moves:>6} {solution.states:9d} "
+              f"{elapsed:9.2f} {solution.states / elapsed:10,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Size and speed of Game.encode_state() versus JSON.
+
+States are taken after every step of the walkthrough. "json" is
+json.dumps(to_dict()) and back; "save" is the indent=2 form Game.save
+writes. Decode times cover bytes -> to_dict()-shaped dict, the part the
+two formats do not share (from_dict() is the same afterwards).
+
+    python -m benchmarks.bench_state_codec
+"""
+import json
+import time
+
+from OOAdventure.Game import Game
+from OOAdventure.StateCodec import schema_for
+from benchmarks.common import WALKTHROUGH
+
+
+def states():
+    game = Game(headless=True)
+    out = [game.clone()]
+    for cmd in WALKTHROUGH:
+        game.process_command(cmd)
+        out.append(game.clone())
+    return out
+
+
+def per_call_us(fn, args, repeat: int = 200) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for a in args:
+            fn(a)
+    return (time.perf_counter() - start) / (repeat * len(args)) * 1e6
+
+
+def main() -> None:
+    games = states()
+    schema = schema_for(Game)
+    packed = [g.encode_state() for g in games]
+    compact = [json.dumps(g.to_dict()) for g in games]
+    pretty = [json.dumps(g.to_dict(), indent=2) for g in games]
+
+    def avg(blobs):
+        return sum(len(b) for b in blobs) / len(blobs)
+
+    rows = [
+        ("binary", avg(packed),
+         per_call_us(lambda g: g.encode_state(), games),
+         per_call_us(schema.decode, packed)),
+        ("json", avg(compact),
+         per_call_us(lambda g: json.dumps(g.to_dict()), games),
+         per_call_us(json.loads, compact)),
+        ("save", avg(pretty),
+         per_call_us(lambda g: json.dumps(g.to_dict(), indent=2), games),
+         per_call_us(json.loads, pretty)),
+    ]
+    print(f"{'format':8s} {'bytes':>7s} {'encode us':>10s} {'decode us':>10s}")
+    for label, size, enc, dec in rows:
+        print(f"{label:8s} {size:7.1f} {enc:10.2f} {dec:10.2f}")
+
+
+if __name__ == "__main__":
+    main()
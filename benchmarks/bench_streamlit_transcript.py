@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Bytes the Streamlit transcript sends the browser per command.
+
+"full html" is what streamlit_app.py used to render on every rerun: the
+last 400 lines joined, HTML-escaped and wrapped in a components.html
+iframe with its scroll script. "incremental" is the JSON args of the
+transcript_view component, which carry only the lines added by the
+command. Both are measured after a history of 50, 400 and 5000 lines.
+
+    python -m benchmarks.bench_streamlit_transcript --history 50 400 5000
+"""
+import argparse
+import html as ihtml
+import json
+
+from OOAdventure.Game import Game
+from OOAdventure.Transcript import Transcript
+
+from .common import WALKTHROUGH
+
+
+def full_html(lines) -> str:
+    text = "\n".join(lines[-400:])
+    return f"""
+    <div id="box" style="
+        height: 500px;
+        overflow-y: auto;
+        background: #111;
+        color: #eee;
+        padding: 10px;
+        font-family: monospace;
+        white-space: pre-wrap;
+        border-radius: 6px;">
+      {ihtml.escape(text)}
+    </div>
+    <script>
+      // After paint, scroll to bottom so latest output is visible
+      setTimeout(function() {{
+        var box = document.getElementById('box');
+        if (box) box.scrollTop = box.scrollHeight;
+      }}, 0);
+    </script>
+    """
+
+
+def history(n: int):
+    game = Game()
+    game.echo = False
+    lines = []
+    i = 0
+    while len(lines) < n:
+        cmd = WALKTHROUGH[i % 4]
+        lines += [f"> {cmd}", game.process_command(cmd).text]
+        i += 1
+    return lines[:n]
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Transcript bytes per command")
+    ap.add_argument("--history", type=int, nargs="+", default=[50, 400, 5000])
+    args = ap.parse_args()
+
+    print(f"{'history':>7s} {'full html B':>12s} {'incremental B':>14s}")
+    for n in args.history:
+        lines = history(n)
+        game = Game()
+        game.echo = False
+        new = ["> look", game.process_command("look").text]
+        old_bytes = len(full_html(lines + new).encode())
+
+        transcript = Transcript(lines, window=400)
+        sent = len(transcript)
+        for line in new:
+            transcript.append(line)
+        payload = {"base": sent, "lines": transcript.since(sent),
+                   "reset": False, "height": 500}
+        new_bytes = len(json.dumps(payload).encode())
+        print(f"{n:7d} {old_bytes:12,d} {new_bytes:14,d}")
+
+
+if __name__ == "__main__":
+    main()
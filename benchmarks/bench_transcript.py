@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Cost of one chat turn as the session grows: list copy versus Transcript.
+
+"list" is what on_send used to do: `chat = chat + [pair]`, then ship the
+whole chat to the Chatbot (json.dumps stands in for Gradio serializing
+it). "transcript" appends in place and ships only the recent window.
+Also reports the size of the history kept at the end: the whole JSON
+for the list, compressed chunks plus the window for the transcript.
+
+    python -m benchmarks.bench_transcript --turns 100 1000 5000
+"""
+import argparse
+import json
+import time
+
+from OOAdventure.Game import Game
+from OOAdventure.Transcript import Transcript
+
+from .common import WALKTHROUGH
+
+
+def outputs(n: int):
+    game = Game()
+    game.echo = False
+    for i in range(n):
+        cmd = WALKTHROUGH[i % 4]          # look / pick stone / go north / pick orb
+        yield f"> {cmd}", game.process_command(cmd).text or "(no output)"
+
+
+def per_turn_us(turns: int, use_transcript: bool, probe: int = 200):
+    """Mean time of the last `probe` turns, and bytes of history kept."""
+    pairs = list(outputs(turns))
+    chat = Transcript() if use_transcript else []
+    spent = 0.0
+    for i, pair in enumerate(pairs):
+        t = time.perf_counter()
+        if use_transcript:
+            chat.append(pair)
+            json.dumps(chat.window())
+        else:
+            chat = chat + [pair]
+            json.dumps(chat)
+        if i >= turns - probe:
+            spent += time.perf_counter() - t
+    if use_transcript:
+        held = chat.stored_bytes() + len(json.dumps(chat.window()))
+    else:
+        held = len(json.dumps(chat))
+    return spent / min(probe, turns) * 1e6, held
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Chat turn cost vs session length")
+    ap.add_argument("--turns", type=int, nargs="+", default=[100, 1000, 5000])
+    args = ap.parse_args()
+
+    print(f"{'turns':>6s} {'list us':>9s} {'transcript us':>14s} "
+          f"{'list KB':>9s} {'transcript KB':>14s}")
+    for n in args.turns:
+        old_us, old_bytes = per_turn_us(n, False)
+        new_us, new_bytes = per_turn_us(n, True)
+        print(f"{n:6d} {old_us:9.1f} {new_us:14.1f} "
+              f"{old_bytes / 1024:9.0f} {new_bytes / 1024:14.0f}")
+
+
+if __name__ == "__main__":
+    main()
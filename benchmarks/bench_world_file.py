@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Startup time for big worlds loaded from world files.
+
+Writes a world file with N rooms (a corridor of rooms, one item each)
+and times, with a cold and then a warm __pycache__:
+
+    compile    json.loads + validate + pack the image (first start only)
+    load       hash the file and unpack every Room and Item from the image
+    template   WorldTemplate for the Game subclass using the file
+               (indexes, parser), which is what a server does at start
+    import     a fresh interpreter importing OOAdventure.Game
+    start      then creating its first Game() from the cached image
+
+    python -m benchmarks.bench_world_file --rooms 100 1000 5000 20000
+"""
+import argparse
+import json
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from OOAdventure import WorldFile
+from OOAdventure.Game import Game
+from OOAdventure.WorldTemplate import WorldTemplate
+
+
+def corridor(n: int) -> dict:
+    rooms = {}
+    for i in range(n):
+        exits = {}
+        if i:
+            exits["west"] = f"Room {i - 1}"
+        if i + 1 < n:
+            exits["east"] = f"Room {i + 1}"
+        rooms[f"Room {i}"] = {"desc": "A long, echoing hallway.", "exits": exits}
+    items = {f"Trinket {i}": {"at": f"Room {i}", "aliases": [f"trinket{i}"]}
+             for i in range(n)}
+    return {"start": "Room 0", "rooms": rooms, "items": items}
+
+
+STARTUP = """
+import sys, time
+t = time.perf_counter()
+from OOAdventure.Game import Game
+imported = time.perf_counter()
+class World(Game):
+    WORLD = sys.argv[1]
+World()
+print(imported - t, time.perf_counter() - imported)
+"""
+
+
+def ms(f) -> float:
+    t = time.perf_counter()
+    f()
+    return (time.perf_counter() - t) * 1e3
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="World file startup time")
+    ap.add_argument("--rooms", type=int, nargs="+", default=[100, 1000, 5000, 20000])
+    args = ap.parse_args()
+
+    folder = Path(tempfile.mkdtemp())
+    print(f"{'rooms':>6s} {'file KB':>8s} {'image KB':>9s} {'compile ms':>11s} "
+          f"{'load ms':>8s} {'template ms':>12s} {'import ms':>10s} {'start ms':>9s}")
+    for n in args.rooms:
+        path = folder / f"world{n}.json"
+        path.write_text(json.dumps(corridor(n)))
+        compile_ms = ms(lambda: WorldFile.load(path))          # cold cache
+        image = WorldFile.cache_path(path)
+
+        def load():
+            world = WorldFile.load(path)
+            world.rooms()
+            world.items()
+        load_ms = ms(load)
+
+        class World(Game):
+            WORLD = path
+        template_ms = ms(lambda: WorldTemplate.of(World))
+        out = subprocess.run([sys.executable, "-c", STARTUP, str(path)],
+                             capture_output=True, text=True, check=True)
+        import_ms, start_ms = (float(t) * 1e3 for t in out.stdout.split())
+        print(f"{n:6d} {path.stat().st_size / 1024:8.0f} "
+              f"{image.stat().st_size / 1024:9.0f} {compile_ms:11.1f} "
+              f"{load_ms:8.1f} {template_ms:12.1f} {import_ms:10.1f} {start_ms:9.1f}")
+    shutil.rmtree(folder)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Game() construction time and per-session memory, before and after the
+shared WorldTemplate.
+
+"before" gives every game its own freshly built world (what Game() used
+to do: run _build_world and _build_item_alias_index); "after" is today's
+Game(), which copies two small dicts from the template. Memory is measured with
+tracemalloc over many live sessions.
+
+    python -m benchmarks.bench_world_template --sessions 10000
+"""
+import argparse
+import time
+import tracemalloc
+
+from OOAdventure.Game import Game
+from OOAdventure.WorldTemplate import WorldTemplate
+
+
+def before() -> Game:
+    game = Game()
+    world = WorldTemplate.build(Game)
+    game.rooms, game.items = world.rooms, world.items
+    game.item_alias_index = world.item_alias_index
+    return game
+
+
+def after() -> Game:
+    return Game()
+
+
+def construct_us(factory, n: int) -> float:
+    start = time.perf_counter()
+    for _ in range(n):
+        factory()
+    return (time.perf_counter() - start) / n * 1e6
+
+
+def bytes_per_session(factory, n: int) -> float:
+    Game()  # make sure the template exists before measuring
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    live = [factory() for _ in range(n)]
+    used = tracemalloc.get_traced_memory()[0] - base
+    tracemalloc.stop()
+    del live
+    return used / n
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Construction time and memory")
+    ap.add_argument("--sessions", type=int, default=10000)
+    args = ap.parse_args()
+
+    print(f"{'':8s} {'construct us':>13s} {'bytes/session':>14s}")
+    for label, factory in (("before", before), ("after", after)):
+        us = construct_us(factory, args.sessions)
+        mem = bytes_per_session(factory, args.sessions)
+        print(f"{label:8s} {us:13.2f} {mem:14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+# Shared fixtures for the benchmark scripts.
+import statistics
+from typing import Dict, Sequence
+
+# The canonical winning walkthrough (same steps as test_game.py).
+WALKTHROUGH = [
+    "look",
+    "pick stone",
+    "go north",
+    "pick orb",
+    "use orb",
+    "go east",
+    "pick rope",
+    "use rope",
+    "go north",
+    "pick fire",
+    "pick wand",
+    "use fire scroll",
+    "pick key",
+    "use wand",
+    "go east",
+    "use stone",
+]
+
+
+def summary(seconds: Sequence[float]) -> Dict[str, float]:
+    """Median, p99 and mean of some timings, in microseconds."""
+    us = sorted(t * 1e6 for t in seconds)
+    return {"n": len(us), "median_us": round(statistics.median(us), 2),
+            "p99_us": round(us[min(len(us) - 1, int(len(us) * 0.99))], 2),
+            "mean_us": round(statistics.fmean(us), 2)}
@@ -1,5 +1,4 @@
 import io
-import sys
 import pytest
 from OOAdventure.Game import Game  # your OO game
 
@@ -7,14 +6,12 @@ from OOAdventure.Game import Game  # your OO game
 def run_command(game, cmd: str) -> str:
     """Capture printed output from a game command."""
     buf = io.StringIO()
-    old = sys.stdout
-    sys.stdout = buf
+    old = game.out
+    game.out = buf
     try:
         game.process_command(cmd)
-    except SystemExit:
-        pass  # Game may call exit() when you win
     finally:
-        sys.stdout = old
+        game.out = old
     return buf.getvalue()
 
 
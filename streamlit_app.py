@@ -1,8 +1,18 @@
 import json
-import html as ihtml
+import uuid
+from pathlib import Path
 import streamlit as st
 import streamlit.components.v1 as components
+from OOAdventure.AutoSaver import AutoSaver
+from OOAdventure.CommandResult import CommandResult
 from OOAdventure.Game import Game
+from OOAdventure.SessionPool import SessionPool
+from OOAdventure.SessionStore import SessionStore
+from OOAdventure.Transcript import Transcript
+
+# Lines resent when the transcript view has to start over (page reload,
+# remount); older ones stay server-side.
+RESYNC_LINES = 400
 
 
 # ----------------------------
@@ -12,23 +22,73 @@ from OOAdventure.Game import Game
 def append_output(line: str):
     st.session_state.transcript.append(line)
 
+
+def new_transcript() -> None:
+    """Start (or replace) the transcript; the view starts over too."""
+    st.session_state.transcript = Transcript(window=RESYNC_LINES)
+    st.session_state.sent = 0
+
+
+# Custom component (transcript_component/index.html): the browser keeps
+# the lines it has and each rerun only sends the new ones.
+_transcript_view = components.declare_component(
+    "transcript_view",
+    path=str(Path(__file__).parent / "transcript_component"))
+
+
+def show_transcript(height: int = 500) -> None:
+    transcript = st.session_state.transcript
+    sent = st.session_state.sent
+    reset = sent == 0
+    ask = st.session_state.get("transcript_view")
+    if ask and ask != st.session_state.get("served_ask"):
+        # The view lost track (e.g. it was remounted): resend the tail.
+        st.session_state.served_ask = ask
+        sent = max(0, len(transcript) - RESYNC_LINES)
+        reset = True
+    lines = transcript.since(sent)
+    _transcript_view(base=sent, lines=lines, reset=reset, height=height,
+                     key="transcript_view", default=None)
+    st.session_state.sent = sent + len(lines)
+
 # ----------------------------
-# Game state management (persist to/from JSON file)
+# Game state management (one journal per player session)
 # ----------------------------
 
 
-def save_state(game: Game):
-    with open("autosave.json", "w") as f:
-        json.dump(game.to_dict(), f)
+@st.cache_resource
+def autosaver() -> AutoSaver:
+    """One background writer per server process (not per rerun).
+
+    It flushes itself at interpreter exit.
+    """
+    return AutoSaver()
+
+
+@st.cache_resource
+def store() -> SessionStore:
+    """Every player's game, keyed by session id.
+
+    Live games sit in an LRU cache (bounded, idle ones evicted after 30
+    minutes); each session has its own journal under sessions/.
+    """
+    return SessionStore("sessions", max_sessions=500, ttl=1800,
+                        saver=autosaver())
+
 
+@st.cache_resource
+def pool() -> SessionPool:
+    """Games built ahead of time, opening screen included, for new players."""
+    return SessionPool(size=64, refill_per_sec=500)
 
-def load_state() -> Game:
-    try:
-        with open("autosave.json") as f:
-            state = json.load(f)
-        return Game.from_dict(state)   # restored instance
-    except FileNotFoundError:
-        return Game()
+
+def session_id() -> str:
+    """Stable id for this player, kept in the URL so a refresh resumes."""
+    sid = st.query_params.get("sid")
+    if not sid:
+        sid = uuid.uuid4().hex
+        st.query_params["sid"] = sid
+    return sid
 
 
 # ----------------------------
@@ -37,35 +97,37 @@ def load_state() -> Game:
 # ----------------------------
 
 
+def render(result: CommandResult) -> str:
+    text = result.text
+    if result.game_over:
+        text += "Game Over. Refresh or restart to play again.\n"
+    return text
+
+
 def run_and_capture(game, cmd: str) -> str:
-    """Capture command output from the game."""
-    import io
-    import sys
-    buf = io.StringIO()
-    old = sys.stdout
-    sys.stdout = buf
-    try:
-        game.process_command(cmd)
-    except SystemExit:
-        print("Game Over. Refresh or restart to play again.")
-    finally:
-        sys.stdout = old
-    return buf.getvalue()
+    """Run a command (or "cmd; cmd; ...") and return its text."""
+    return render(game.process_line(cmd))
 
 
 # ----------------------------
 # Page + Session state init
 # ----------------------------
 st.set_page_config("Wizard's Quest", layout="wide")
+SID = session_id()
 
-if "game" not in st.session_state:
-    st.session_state.game = load_state()
-    st.session_state.transcript = []
+if "transcript" not in st.session_state:
+    new_transcript()
     append_output("=== Wizard's Quest ===")
-    append_output(run_and_capture(st.session_state.game, "look"))
+    with store().session(SID) as s:
+        if s.fresh:
+            game, opening = pool().take()
+            s.reset(game)
+            append_output(render(opening))
+        else:
+            append_output(run_and_capture(s.game, "look"))
 
     # --- Save/Load controls ---
-if "game" in st.session_state:
+if "transcript" in st.session_state:
     st.markdown("### Save / Load")
 
 
@@ -77,33 +139,12 @@ col1, col2 = st.columns([3, 1])
 
 # ==== Transcript (left) ====
 #  monospace, dark background, auto-scroll to bottom
-# - transcript is a list of adventures lines
-# - only show last 400 lines (to avoid huge HTML)
-# Auto-scroll to bottom via JS trick
+# - transcript is a Transcript of adventure lines, kept server-side
+# - each rerun sends the browser only the lines it has not seen; the
+#   view keeps the newest 400 in the page and pages older ones back in
 with col1:
     st.markdown("### Transcript")
-    transcript_text = "\n".join(st.session_state.transcript[-400:])
-    transcript_html = f"""
-    <div id="box" style="
-        height: 500px;
-        overflow-y: auto;
-        background: #111;
-        color: #eee;
-        padding: 10px;
-        font-family: monospace;
-        white-space: pre-wrap;
-        border-radius: 6px;">
-      {ihtml.escape(transcript_text)}
-    </div>
-    <script>
-      // After paint, scroll to bottom so latest output is visible
-      setTimeout(function() {{
-        var box = document.getElementById('box');
-        if (box) box.scrollTop = box.scrollHeight;
-      }}, 0);
-    </script>
-    """
-    components.html(transcript_html, height=520, scrolling=False)
+    show_transcript()
 
 # ==== Command + controls (right) ====
 # single-line text input, auto-focus
@@ -116,10 +157,11 @@ with col2:
                             placeholder="e.g., go east")
         submitted = st.form_submit_button("Send")
         if submitted and cmd.strip():
-            out = run_and_capture(st.session_state.game, cmd)
+            with store().session(SID) as s:
+                result = s.game.process_line(cmd)
+                s.record(result)   # queued; written off-thread
             append_output(f"> {cmd}")
-            append_output(out)
-            save_state(st.session_state.game)
+            append_output(render(result))
             st.rerun()
 
     st.markdown("")
@@ -129,8 +171,9 @@ with col2:
         st.markdown("### Save / Load")
 
         # Download current state
-        save_bytes = json.dumps(
-            st.session_state.game.to_dict(), indent=2).encode("utf-8")
+        with store().session(SID) as s:
+            save_bytes = json.dumps(
+                s.game.to_dict(), indent=2).encode("utf-8")
         st.download_button(
             "Download Save",
             data=save_bytes,
@@ -143,11 +186,11 @@ with col2:
         uploaded_file = st.file_uploader("Upload Save", type="json")
         if uploaded_file is not None:
             state = json.load(uploaded_file)
-            st.session_state.game = Game.from_dict(state)
-            st.session_state.transcript = []
+            new_transcript()
             append_output("=== Restored Game ===")
-            append_output(run_and_capture(st.session_state.game, "look"))
-            save_state(st.session_state.game)
+            with store().session(SID) as s:
+                s.reset(Game.from_dict(state))
+                append_output(run_and_capture(s.game, "look"))
             st.rerun()
 
     # SINGLE robust focus script (post-render, via components.html)
@@ -205,9 +248,7 @@ with col2:
 
     st.divider()
     if st.button("Restart (fresh game)", use_container_width=True):
-        import os
-        if os.path.exists("autosave.json"):
-            os.remove("autosave.json")
+        store().drop(SID)
         st.session_state.clear()
         st.rerun()
 st.divider()
@@ -1,7 +1,31 @@
 import unittest
+import gc
 import io
-import sys
+import json
+import os
+import tempfile
+import threading
+import time
+import weakref
 from OOAdventure.Game import Game  # import your OO game
+from OOAdventure.CommandResult import EventKind
+from OOAdventure import Fuzzer, Simulation, Solver, WorldFile, WorldGenerator
+from OOAdventure.AutoSaver import AutoSaver
+from OOAdventure.Journal import Journal
+from OOAdventure.SaveStore import SqliteSaveStore
+from OOAdventure.SessionPool import SessionPool
+from OOAdventure.SessionStore import SessionStore
+from OOAdventure.Transcript import Transcript
+from OOAdventure.WorldTemplate import WorldTemplate
+
+
+class LeakyGame(Game):
+    """Picking the orb forgets to take it out of the Library."""
+
+    def pick(self, item_name: str) -> None:
+        super().pick(item_name)
+        if item_name == "Crystal Orb":
+            self._writable_item(item_name).location = "Library"
 
 
 class TestGame(unittest.TestCase):
@@ -9,14 +33,12 @@ class TestGame(unittest.TestCase):
     def run_command(self, game, cmd: str) -> str:
         """Helper to capture printed output from a game command."""
         buf = io.StringIO()
-        old = sys.stdout
-        sys.stdout = buf
+        old = game.out
+        game.out = buf
         try:
             game.process_command(cmd)
-        except SystemExit:
-            pass  # Game may call exit when you win
         finally:
-            sys.stdout = old
+            game.out = old
         return buf.getvalue()
 
     def test_full_walkthrough(self):
@@ -42,6 +64,7 @@ class TestGame(unittest.TestCase):
         transcript.append(self.run_command(game, "use wand"))
         transcript.append(self.run_command(game, "go east"))
         transcript.append(self.run_command(game, "use stone"))
+        self.assertTrue(game.won)
 
         joined = "\n".join(transcript)
 
@@ -51,6 +74,531 @@ class TestGame(unittest.TestCase):
         self.assertIn(
             "Congratulations! You have reached the Gem of Eternity", joined)
 
+    def test_output_stays_in_own_sink(self):
+        a, b = Game(out=io.StringIO()), Game(out=io.StringIO())
+        a.process_command("pick stone")
+        b.process_command("go north")
+        self.assertIn("You picked up the Teleportation Stone.", a.out.getvalue())
+        self.assertNotIn("Library", a.out.getvalue())
+        self.assertIn("You are in the Library.", b.out.getvalue())
+        self.assertNotIn("Teleportation Stone.", b.out.getvalue())
+
+    def test_command_result_events(self):
+        game = Game()
+        game.echo = False
+        result = game.process_command("go east")
+        self.assertFalse(result.ok)
+        self.assertEqual(result.text, "You can't go that way.\n")
+
+        for cmd in ["pick stone", "go north", "pick orb"]:
+            self.assertTrue(game.process_command(cmd).ok)
+        result = game.process_command("use orb")
+        self.assertEqual([e.kind for e in result.events],
+                         [EventKind.USED, EventKind.EXIT_UNLOCKED])
+        self.assertEqual(result.events[1].data,
+                         {"room": "Library", "direction": "east", "to": "Altar"})
+        self.assertFalse(result.won)
+
+    def test_win_is_a_result_not_system_exit(self):
+        game = Game()
+        game.echo = False
+        for cmd in ["pick stone", "go north", "pick orb", "use orb", "go east",
+                    "pick rope", "use rope", "go north", "pick fire",
+                    "pick wand", "use fire", "pick key", "use wand", "go east"]:
+            game.process_command(cmd)
+        result = game.process_command("use stone")
+        self.assertTrue(result.won and result.game_over)
+        self.assertTrue(result.of_kind(EventKind.GAME_WON))
+        self.assertIn("won the game!", result.text)
+
+    def test_headless_run_commands(self):
+        game = Game(headless=True)
+        outcomes = Simulation.run_commands(
+            game, ["pick stone", "go east", "flarp", "look"])
+        self.assertEqual(list(outcomes), [Simulation.OK, Simulation.FAILED,
+                                          Simulation.FAILED, Simulation.OK])
+        self.assertEqual(game.process_command("look").lines, [])
+        self.assertEqual(game.player.inventory, ["Teleportation Stone"])
+
+    def test_headless_quit_writes_no_files(self):
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as d:
+            os.chdir(d)
+            try:
+                self.assertTrue(Game(headless=True).process_command("quit").game_over)
+                self.assertEqual(os.listdir(d), [])
+            finally:
+                os.chdir(cwd)
+
+    def test_fuzzer_holds_on_shipped_world(self):
+        executed, failures = Fuzzer.fuzz_range(0, 50, 40)
+        self.assertEqual(failures, [])
+        self.assertEqual(executed, 50 * 40)
+
+    def test_fuzzer_minimizes_failures(self):
+        _, failures = Fuzzer.fuzz_range(0, 50, 60, LeakyGame)
+        self.assertTrue(failures)
+        smallest = min(failures, key=lambda f: len(f.commands))
+        self.assertEqual(len(smallest.commands), 2)
+        self.assertTrue(smallest.commands[-1].endswith(("orb", "crystal orb")))
+        self.assertIn("disagrees", smallest.problems[0])
+
+    def test_clone_is_independent(self):
+        game = Game(headless=True)
+        for cmd in ["pick stone", "go north", "pick orb"]:
+            game.process_command(cmd)
+        twin = game.clone()
+        twin.process_command("use orb")
+        self.assertTrue(twin.room("Library").has_exit("east"))
+        self.assertFalse(game.room("Library").has_exit("east"))
+        self.assertNotEqual(game.state_key(), twin.state_key())
+        rebuilt = game.with_state_key(twin.state_key())
+        self.assertEqual(rebuilt.state_key(), twin.state_key())
+        self.assertEqual(rebuilt.to_dict()["rooms"], twin.to_dict()["rooms"])
+
+    def test_solver_finds_shortest_win(self):
+        solution = Solver.solve()
+        self.assertEqual(len(solution.commands), 15)
+        self.assertGreater(solution.states, 15)
+        game = Game(headless=True)
+        outcomes = Simulation.run_commands(game, solution.commands)
+        self.assertEqual(outcomes[-1], Simulation.WON)
+
+    def test_sessions_share_the_world_template(self):
+        a, b = Game(headless=True), Game(headless=True)
+        self.assertIs(a.room("Library"), b.room("Library"))
+        with self.assertRaises(TypeError):
+            a.room("Library").connect("east", "Altar")   # template is frozen
+        for cmd in ["pick stone", "go north", "pick orb", "use orb"]:
+            a.process_command(cmd)
+        self.assertIsNot(a.room("Library"), b.room("Library"))
+        self.assertFalse(b.room("Library").has_exit("east"))
+        self.assertEqual(b.items["Crystal Orb"].location, "Library")
+
+    def test_journal_replays_session(self):
+        path = os.path.join(tempfile.mkdtemp(), "autosave.journal")
+        journal = Journal(path, snapshot_every=5)
+        game = Game(headless=True)
+        for cmd in ["pick stone", "go north", "pick orb", "use orb", "go east",
+                    "pick rope", "use rope", "go north", "look", "pick fire"]:
+            journal.record(game, game.process_command(cmd))
+        journal.close()
+        with open(path) as f:
+            self.assertIn('{"snapshot"', f.read())
+        self.assertEqual(Journal.replay(path).to_dict(), game.to_dict())
+
+    def test_journal_snapshot_keeps_the_win(self):
+        path = os.path.join(tempfile.mkdtemp(), "autosave.journal")
+        journal = Journal(path, snapshot_every=1)
+        game = Game(headless=True)
+        for cmd in ["pick stone", "go north", "pick orb", "use orb", "go east",
+                    "pick rope", "use rope", "go north", "pick fire", "pick wand",
+                    "use fire", "pick key", "use wand", "go east", "use stone"]:
+            journal.record(game, game.process_command(cmd))
+        journal.close()
+        self.assertTrue(game.won)
+        self.assertTrue(Journal.replay(path).won)
+
+    def test_autosaver_coalesces_and_flushes(self):
+        folder = tempfile.mkdtemp()
+        path = os.path.join(folder, "autosave.json")
+        saver = AutoSaver(delay=0.2)
+        for i in range(50):
+            saver.save(path, f"state {i}")
+        saver.append(path, "\ntail")
+        saver.close()
+        with open(path) as f:
+            self.assertEqual(f.read(), "state 49\ntail")
+        self.assertEqual(saver.writes, 1)
+        self.assertEqual(os.listdir(folder), ["autosave.json"])
+
+    def test_closed_autosaver_writes_inline_and_is_freed(self):
+        path = os.path.join(tempfile.mkdtemp(), "late.json")
+        saver = AutoSaver()
+        saver.close()
+        saver.save(path, "after close")
+        with open(path) as f:
+            self.assertEqual(f.read(), "after close")
+        ref = weakref.ref(saver)
+        del saver
+        gc.collect()
+        self.assertIsNone(ref())
+
+    def test_encode_state_round_trips(self):
+        game = Game(headless=True)
+        for cmd in ["look", "pick stone", "go north", "pick orb", "use orb"]:
+            game.process_command(cmd)
+        game.set_room_state("Library", "visits", -3)   # not in the schema
+        blob = game.encode_state()
+        self.assertIsInstance(blob, bytes)
+        self.assertLess(len(blob), 64)
+        self.assertEqual(Game.decode_state(blob).to_dict(), game.to_dict())
+
+        game.set_room_state("Library", "weights", [1.5, {"x": None}])
+        self.assertEqual(Game.decode_state(game.encode_state()).to_dict(), game.to_dict())
+
+    def test_session_store_evicts_past_a_busy_session(self):
+        store = SessionStore(tempfile.mkdtemp(), max_sessions=2, ttl=60)
+        for sid in ("a", "b"):
+            with store.session(sid) as s:
+                s.record(s.game.process_command("look"))
+        with store.session("a"):
+            with store.session("b"):           # "a" is now the oldest, and busy
+                pass
+            with store.session("c"):
+                pass
+            self.assertEqual(len(store), 2)
+            self.assertEqual(store.evictions, 1)   # "b" went instead
+
+    def test_session_store_drop_waits_for_the_session(self):
+        store = SessionStore(tempfile.mkdtemp())
+        dropped = threading.Event()
+        with store.session("a") as s:
+            worker = threading.Thread(target=lambda: (store.drop("a"), dropped.set()))
+            worker.start()
+            self.assertFalse(dropped.wait(0.1))
+            s.record(s.game.process_command("go north"))
+        worker.join()
+        self.assertFalse(store.path("a").exists())
+        with store.session("a") as s:
+            self.assertEqual(s.game.player.room, "Entrance")
+
+    def test_session_store_evicts_and_reloads(self):
+        saver = AutoSaver()
+        store = SessionStore(tempfile.mkdtemp(), max_sessions=1, ttl=60,
+                             saver=saver)
+        with store.session("a") as s:
+            for cmd in ["pick stone", "go north", "pick orb"]:
+                s.record(s.game.process_command(cmd))
+            expected = s.game.to_dict()
+        with store.session("b") as s:          # pushes "a" out
+            s.record(s.game.process_command("look"))
+        self.assertEqual(store.evictions, 1)
+        with store.session("a") as s:
+            self.assertEqual(s.game.to_dict(), expected)
+        self.assertEqual(store.evict_idle(now=time.monotonic() + 61), 1)
+        self.assertEqual(len(store), 0)
+        store.close()
+        saver.close()
+
+    def test_location_index_follows_items(self):
+        game = Game(headless=True)
+        self.assertEqual(game.items_in("Chamber"), ["Fire Scroll", "Ice Wand"])
+        for cmd in ["pick stone", "go north", "pick orb", "use orb", "go east",
+                    "pick rope", "use rope", "go north", "pick fire",
+                    "use fire scroll"]:
+            game.process_command(cmd)
+        twin = game.clone()
+        twin.process_command("pick key")
+        self.assertEqual(game.items_in("Chamber"), ["Ice Wand", "Vault Key"])
+        self.assertEqual(twin.items_in("Chamber"), ["Ice Wand"])
+        self.assertIn("Vault Key", twin.items_in("inventory"))
+        restored = Game.from_dict(twin.to_dict())
+        self.assertEqual(restored.items_at, twin.items_at)
+        self.assertEqual(Fuzzer.check_invariants(restored), [])
+        self.assertEqual(Game().items_in("Chamber"), ["Fire Scroll", "Ice Wand"])
+
+    def test_inventory_is_an_ordered_set(self):
+        game = Game(headless=True)
+        for cmd in ["pick stone", "go north", "pick orb", "pick orb"]:
+            game.process_command(cmd)
+        self.assertEqual(game.player.inventory,
+                         ["Teleportation Stone", "Crystal Orb"])
+        data = game.to_dict()
+        self.assertEqual(data["player"]["inventory"],
+                         ["Teleportation Stone", "Crystal Orb"])
+        restored = Game.from_dict(data)
+        self.assertEqual(restored.player.inventory, game.player.inventory)
+        restored.player.remove("Teleportation Stone")
+        self.assertFalse(restored.player.has("Teleportation Stone"))
+        self.assertTrue(game.player.has("Teleportation Stone"))
+
+    def test_did_you_mean_for_verbs_and_items(self):
+        game = Game()
+        game.echo = False
+        result = game.process_command("tkae stone")
+        self.assertIn("Did you mean 'take'?", result.text)
+        self.assertEqual(result.of_kind(EventKind.UNKNOWN_COMMAND)[0].data,
+                         {"verb": "tkae", "suggestion": "take"})
+        self.assertIn("Did you mean 'stone'?",
+                      game.process_command("pick stnoe").text)
+        self.assertIn("Did you mean 'crystal orb'?",
+                      game.process_command("use crystl orbb").text)
+        self.assertNotIn("Did you mean", game.process_command("pick zzz").text)
+        self.assertNotIn("Did you mean", game.process_command("x").text)
+
+    def test_phrase_parser(self):
+        game = Game()
+        game.echo = False
+        for cmd, expected in [
+                ("pick up the teleportation stone", EventKind.PICKED),
+                ("north", EventKind.MOVED),
+                ("take the glowing crystal orb.", EventKind.PICKED),
+                ("use the orb on the pedestal", EventKind.EXIT_UNLOCKED),
+                ("go to the east", EventKind.MOVED),
+                ("grab the rope", EventKind.PICKED),
+                ("use rope on the chasm", EventKind.EXIT_UNLOCKED)]:
+            result = game.process_command(cmd)
+            self.assertTrue(result.of_kind(expected), cmd)
+        self.assertEqual(game._parser.parse("use tp stone on the vault")[2],
+                         ["tp", "stone"])
+        self.assertEqual(game._parser.parse("save the game.json")[2],
+                         ["the", "game.json"])
+        self.assertIsNone(game._parser.parse("dance with the orb")[0])
+
+    def test_chained_commands(self):
+        game = Game()
+        game.echo = False
+        result = game.process_line("pick stone; n; take orb; use orb; e")
+        self.assertTrue(result.ok)
+        self.assertEqual(game.player.room, "Altar")
+        self.assertEqual(len(result.of_kind(EventKind.MOVED)), 2)
+        self.assertIn("> take orb\nYou picked up the Crystal Orb.", result.text)
+
+        result = game.process_line("take rope; go north; use rope")
+        self.assertFalse(result.ok)                # stopped at "go north"
+        self.assertNotIn("> use rope", result.text)
+        self.assertIn("Enchanted Rope", game.player.inventory)
+        self.assertFalse(game.room("Altar").exits.get("north"))
+
+        self.assertEqual(game.process_line("look").command, "look")
+
+    def test_transcript_keeps_window_and_full_history(self):
+        chat = Transcript(window=3, chunk=4)
+        for i in range(10):
+            chat.append(["> look", f"turn {i}"])
+        self.assertEqual(len(chat), 10)
+        self.assertEqual([t for _, t in chat.window()],
+                         ["turn 7", "turn 8", "turn 9"])
+        self.assertEqual([t for _, t in chat], [f"turn {i}" for i in range(10)])
+        self.assertEqual(chat.page(3, 3), [["> look", f"turn {i}"] for i in (3, 4, 5)])
+        self.assertEqual(chat.page(8, 5), [["> look", "turn 8"], ["> look", "turn 9"]])
+        self.assertEqual(chat.since(9), [["> look", "turn 9"]])
+
+    def test_sqlite_save_slots(self):
+        store = SqliteSaveStore(os.path.join(tempfile.mkdtemp(), "saves.db"))
+        game = Game(headless=True)
+        game.saves = store.slots("alice")
+        for cmd in ["pick stone", "go north", "save", "pick orb"]:
+            game.process_command(cmd)
+        saved = store.read("alice", "save.json")
+        self.assertEqual(saved["player"]["room"], "Library")
+        self.assertEqual(store.find(room="Library"), [("alice", "save.json")])
+        self.assertTrue(game.process_command("load").ok)
+        self.assertEqual(game.to_dict(), saved)
+        self.assertFalse(game.process_command("load other").ok)
+        store.close()
+
+    def test_loading_an_unwon_save_clears_the_win(self):
+        store = SqliteSaveStore(os.path.join(tempfile.mkdtemp(), "saves.db"))
+        game = Game(headless=True)
+        game.saves = store.slots("bob")
+        game.process_command("save early.json")
+        for cmd in ["pick stone", "go north", "pick orb", "use orb", "go east",
+                    "pick rope", "use rope", "go north", "pick fire", "pick wand",
+                    "use fire", "pick key", "use wand", "go east", "use stone"]:
+            game.process_command(cmd)
+        self.assertTrue(game.won)
+        self.assertTrue(game.process_command("load early.json").ok)
+        self.assertEqual(game.player.room, "Entrance")
+        self.assertFalse(game.won)
+        store.close()
+
+    def test_loading_a_won_save_keeps_the_win(self):
+        store = SqliteSaveStore(os.path.join(tempfile.mkdtemp(), "saves.db"))
+        game = Game(headless=True)
+        game.saves = store.slots("carol")
+        for cmd in ["pick stone", "go north", "pick orb", "use orb", "go east",
+                    "pick rope", "use rope", "go north", "pick fire", "pick wand",
+                    "use fire", "pick key", "use wand", "go east", "use stone"]:
+            game.process_command(cmd)
+        game.process_command("save won.json")
+        later = Game(headless=True)
+        later.saves = store.slots("carol")
+        self.assertTrue(later.process_command("load won.json").ok)
+        self.assertEqual(later.player.room, "Vault")
+        self.assertTrue(later.won)
+        later.process_command("save again.json")
+        self.assertEqual(store.find(won=True), [("carol", "again.json"), ("carol", "won.json")])
+        self.assertTrue(Game.from_dict(game.to_dict()).won)
+        store.close()
+
+    def test_sessions_share_static_room_data(self):
+        a, b = Game(headless=True), Game(headless=True)
+        for cmd in ["pick stone", "go north", "pick orb", "use orb"]:
+            a.process_command(cmd)
+        lib_a, lib_b = a.rooms["Library"], b.rooms["Library"]
+        self.assertIsNot(lib_a, lib_b)
+        self.assertIs(lib_a.spec, lib_b.spec)
+        self.assertIs(a.rooms["Vault"], b.rooms["Vault"])
+        self.assertEqual(dict(lib_b.exits), {"south": "Entrance"})
+        self.assertEqual(lib_a.exits["east"], "Altar")
+        self.assertEqual(b.items["Crystal Orb"].location, "Library")
+        with self.assertRaises(TypeError):
+            b.rooms["Library"] = lib_a
+        self.assertFalse(hasattr(lib_a, "__dict__"))
+        self.assertFalse(hasattr(a.player, "__dict__"))
+        twin = a.clone()
+        twin.process_command("go east")
+        twin.process_command("pick rope")
+        self.assertEqual(a.items["Enchanted Rope"].location, "Altar")
+        self.assertEqual(twin.items["Enchanted Rope"].location, "inventory")
+
+    def test_world_file_compiles_and_caches(self):
+        world = {
+            "start": "Hall",
+            "rooms": {
+                "Hall": {"desc": "A hall.", "exits": {"north": "Study"}},
+                "Study": {"desc": "A study.", "exits": {"south": "Hall"},
+                          "gated": {"east": "Hall"}, "state": {"lit": False, "n": -3},
+                          "use": {"strategy": "LibraryUse", "args": {"item": "Brass Lamp"}}},
+            },
+            "items": {"Brass Lamp": {"at": "Study", "aliases": ["lamp"]}},
+        }
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "small.json")
+            with open(path, "w") as f:
+                json.dump(world, f)
+
+            class Small(Game):
+                WORLD = path
+            game = Small(headless=True)
+            self.assertEqual(game.player.room, "Hall")
+            self.assertEqual(dict(game.rooms["Study"].state), {"lit": False, "n": -3})
+            self.assertTrue(game.process_command("go north").ok)
+            self.assertTrue(game.process_command("take lamp").ok)
+            cached = WorldFile.cache_path(path)
+            self.assertTrue(cached.exists())
+            image = WorldFile.load(path)
+            self.assertEqual(image.gated(image.room_index("Study")), {"east": "Hall"})
+            self.assertIsNone(image.room_index("Cellar"))
+
+        world["rooms"]["Hall"]["exits"]["down"] = "Cellar"
+        world["rooms"]["Study"]["use"] = "NoSuchUse"
+        world["items"]["Lantern"] = {"at": "Hall", "aliases": ["lamp"]}
+        with self.assertRaises(WorldFile.WorldError) as caught:
+            WorldFile.compile_world(world)
+        self.assertEqual(len(caught.exception.problems), 3)
+
+    def test_world_file_reports_malformed_worlds(self):
+        def problems(rooms, items=None):
+            return WorldFile.validate({"start": "A", "rooms": rooms, "items": items or {}})
+        self.assertEqual(len(problems({"A": {"desc": "a", "exits": 5}})), 1)
+        self.assertEqual(len(problems({"A": {"desc": "a", "exits": {}, "gated": ["n"]}})), 1)
+        with self.assertRaises(WorldFile.WorldError):
+            WorldFile.compile_world({"rooms": {"A": {"desc": "a", "gated": 5, "exits": 5}}})
+        clash = problems({"A": {"desc": "a"}}, {"Orb": {"at": "A", "aliases": ["'ball'"]},
+                                                  "Ball": {"at": "A"}})
+        self.assertEqual(len(clash), 1)
+        self.assertIn("already taken", clash[0])
+        self.assertEqual(problems({"A": {"desc": "a"}}, {"Orb": {"at": "A", "used_in": None}}), [])
+
+    def test_tower_puzzles_work_in_other_worlds(self):
+        world = {
+            "start": "Hall",
+            "rooms": {
+                "Hall": {"desc": "A hall.", "exits": {"north": "Study"}},
+                "Study": {"desc": "A study.", "exits": {"south": "Hall"},
+                          "gated": {"west": "Hall"}, "use": "LibraryUse"},
+            },
+            "items": {"Crystal Orb": {"at": "Hall", "aliases": ["orb"]}},
+        }
+        self.assertEqual(WorldFile.validate(world), [])
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "study.json")
+            with open(path, "w") as f:
+                json.dump(world, f)
+
+            class Study(Game):
+                WORLD = path
+            game = Study(headless=True)
+            for cmd in ["take orb", "n", "use orb", "w"]:
+                self.assertTrue(game.process_command(cmd).ok, cmd)
+            self.assertEqual(game.player.room, "Hall")
+
+        world["rooms"]["Study"]["use"] = {"strategy": "AltarUse", "args": {"to": "Attic"}}
+        world["rooms"]["Hall"]["use"] = "ChamberUse"
+        problems = WorldFile.validate(world)
+        self.assertEqual(len(problems), 3, problems)
+        self.assertTrue(any("'Attic'" in p for p in problems))
+        self.assertTrue(any("'Enchanted Rope'" in p for p in problems))
+        self.assertTrue(any("Hall" in p and "direction" in p for p in problems))
+
+    def test_tower_world_file_matches_the_game(self):
+        image = WorldFile.load(Game.WORLD)
+        game = Game(headless=True)
+        self.assertEqual(list(image.rooms()), list(game.rooms))
+        self.assertEqual({n: it.aliases for n, it in image.items().items()},
+                         {n: it.aliases for n, it in game.items.items()})
+
+    def test_paged_world_plays_and_saves_only_changes(self):
+        class Paged(Game):
+            PAGED = True
+            HOT_ROOMS = 2
+        steps = ["pick stone", "go north", "pick orb", "use orb", "go east",
+                 "pick rope", "use rope", "go north", "pick fire", "pick wand",
+                 "use fire scroll", "pick key", "use wand"]
+        game = Paged(headless=True)
+        for cmd in steps:
+            self.assertTrue(game.process_command(cmd).ok, cmd)
+        template = WorldTemplate.of(Paged)
+        self.assertLessEqual(template.rooms.hot(), 2)
+        self.assertNotIsInstance(game.rooms, dict)
+
+        data = game.to_dict()
+        self.assertEqual(set(data["rooms"]), {"Library", "Altar", "Chamber"})
+        restored = Paged.from_dict(data)
+        restored.headless = True
+        self.assertEqual(restored.to_dict(), data)
+        for twin in (restored, game.clone()):
+            twin.process_command("go east")
+            self.assertTrue(twin.process_command("use stone").won)
+        self.assertFalse(game.won)
+
+    def test_generated_worlds_are_winnable(self):
+        world, walkthrough = WorldGenerator.generate(rooms=300, items=80, puzzles=12, seed=7)
+        self.assertEqual(WorldGenerator.generate(300, 80, 12, seed=7), (world, walkthrough))
+        self.assertEqual(WorldFile.validate(world), [])
+        self.assertEqual(len(world["rooms"]), 300)
+        self.assertEqual(len(world["items"]), 80)
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "generated.json")
+            with open(path, "w") as f:
+                json.dump(world, f)
+
+            class Generated(Game):
+                WORLD = path
+            game = Generated(headless=True)
+            for cmd in walkthrough[:-1]:
+                self.assertTrue(game.process_command(cmd).ok, cmd)
+            self.assertFalse(game.won)
+            self.assertTrue(game.process_command(walkthrough[-1]).won)
+
+            small, steps = WorldGenerator.generate(rooms=9, puzzles=3, seed=2)
+            with open(path, "w") as f:
+                json.dump(small, f)
+
+            class Small(Game):
+                WORLD = path
+            solution = Solver.solve(Small(headless=True), exhaustive=False)
+            self.assertIsNotNone(solution.commands)
+            self.assertLessEqual(len(solution.commands), len(steps))
+
+    def test_session_pool_hands_out_fresh_games(self):
+        pool = SessionPool(size=4)
+        self.assertTrue(pool.wait_full(timeout=5))
+        games = [pool.take() for _ in range(6)]
+        pool.close()
+        self.assertEqual(pool.hits + pool.misses, 6)
+        self.assertEqual(len({id(g) for g, _ in games}), 6)
+        for game, opening in games:
+            self.assertIn("Entrance", opening.text)
+            self.assertEqual(game.player.room, "Entrance")
+        self.assertTrue(games[0][0].process_command("pick stone").ok)
+        self.assertIn("Teleportation Stone", games[0][0].player.inventory)
+        self.assertNotIn("Teleportation Stone", games[1][0].player.inventory)
+        self.assertIn("Teleportation Stone", games[1][0].items_in("Entrance"))
+
 
 if __name__ == "__main__":
     unittest.main()